@@ -0,0 +1,92 @@
+import pygame
+# Only fonts are needed to render, skip the display and audio so forked workers start cleanly
+pygame.font.init()
+
+from WoodlandCommon import *
+from Woodland import *
+from WoodlandRenderer import *
+from ConfigData import *
+from WoodlandExport import *
+
+import argparse
+import multiprocessing
+import os
+import time
+
+
+# Generate a single map and render it and/or turn it into an export record. This runs inside the worker processes so it only takes picklable arguments
+def generateMap( args ):
+    configData, seed, outputDir, formats = args
+
+    # The debug string is never dumped in batch mode, don't let it grow across maps
+    debug_clear()
+
+    woodland = configData.createWoodland( ( 0, 0 ) )
+    woodland.generate( configData.numClearings, seed )
+
+    path = None
+    if "png" in formats:
+        surface = pygame.Surface( woodland.size )
+        WoodlandRenderer( woodland ).draw( surface )
+
+        path = os.path.join( outputDir, "woodland_" + str( seed ) + ".png" )
+        pygame.image.save( surface, path )
+
+    record = None
+    if "jsonl" in formats:
+        record = WoodlandExport.getRecord( woodland )
+
+    return seed, path, record
+
+def generateBatch( configData, seeds, outputDir, numWorkers, chunkSize=4, formats=( "png", ) ):
+    os.makedirs( outputDir, exist_ok=True )
+
+    tasks = [ ( configData, seed, outputDir, formats ) for seed in seeds ]
+    numDone = 0
+
+    # The records are written as they come back so they never pile up
+    export = None
+    if "jsonl" in formats:
+        export = WoodlandExport( os.path.join( outputDir, "woodlands.jsonl" ) )
+
+    try:
+        with multiprocessing.Pool( numWorkers ) as pool:
+            for seed, path, record in pool.imap_unordered( generateMap, tasks, chunkSize ):
+                numDone += 1
+                if export:
+                    export.writeRecord( record )
+                print( "[" + str( numDone ) + "/" + str( len( tasks ) ) + "] " + str( path or export.path ) + " seed " + str( seed ) )
+    finally:
+        if export:
+            export.close()
+
+    return numDone
+
+def main():
+    parser = argparse.ArgumentParser( description="Generate Woodland maps in bulk without opening a window" )
+    parser.add_argument( "--config", help="json file of ConfigData settings to override, Ex { \"mapWidth\": 2000 }" )
+    parser.add_argument( "--seed-start", type=int, default=0, help="first seed to generate" )
+    parser.add_argument( "--count", type=int, default=10, help="number of maps to generate, one per seed" )
+    parser.add_argument( "--workers", type=int, default=os.cpu_count(), help="number of worker processes" )
+    parser.add_argument( "--output-dir", default="Woodlands", help="directory the maps are written to" )
+    parser.add_argument( "--format", choices=[ "png", "jsonl", "both" ], default="png", help="save each map as an image, add it to woodlands.jsonl, or both" )
+    args = parser.parse_args()
+
+    configData = ConfigData()
+    if args.config:
+        try:
+            configData.loadJson( args.config )
+        except ValueError as error:
+            parser.error( str( error ) )
+
+    seeds = range( args.seed_start, args.seed_start + args.count )
+
+    startTime = time.perf_counter()
+    formats = ( "png", "jsonl" ) if args.format == "both" else ( args.format, )
+    numDone = generateBatch( configData, seeds, args.output_dir, max( 1, args.workers ), formats=formats )
+    elapsed = time.perf_counter() - startTime
+
+    print( "Generated " + str( numDone ) + " maps in " + "{:.2f}".format( elapsed ) + "s" )
+
+if __name__ == '__main__':
+    main()
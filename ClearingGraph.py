@@ -0,0 +1,94 @@
+from Path import *
+
+import numpy as np
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import connected_components
+
+# Paths between clearings, indexed by clearing id
+# Edges live in a dict keyed by ( lowId, highId ) so checking, adding and removing a path are all O(1), and the dict keeps
+# the order paths were made in. Neighbours are also packed into compressed sparse row arrays for numpy-friendly iteration,
+# those are only rebuilt when they're asked for after the graph has changed
+class ClearingGraph:
+    def __init__( self, clearings ):
+        self.clearings = clearings
+        self.edges = {}
+        # Neighbour ids of each clearing in the order they were connected
+        self.adjacency = [ [] for _ in clearings ]
+        self.degree = np.zeros( len( clearings ), dtype=np.int32 )
+
+        self.csrDirty = True
+        self.indptr = np.zeros( len( clearings ) + 1, dtype=np.int32 )
+        self.indices = np.zeros( 0, dtype=np.int32 )
+
+    @staticmethod
+    def edgeKey( id1, id2 ):
+        if id1 < id2:
+            return ( id1, id2 )
+        return ( id2, id1 )
+
+    def hasEdge( self, id1, id2 ):
+        return self.edgeKey( id1, id2 ) in self.edges
+
+    def getPath( self, id1, id2 ):
+        return self.edges.get( self.edgeKey( id1, id2 ) )
+
+    def addPath( self, clearing1, clearing2 ):
+        key = self.edgeKey( clearing1.id, clearing2.id )
+        if key in self.edges:
+            return self.edges[key]
+
+        path = Path( clearing1, clearing2 )
+        self.edges[key] = path
+        self.adjacency[clearing1.id].append( clearing2.id )
+        self.adjacency[clearing2.id].append( clearing1.id )
+        self.degree[clearing1.id] += 1
+        self.degree[clearing2.id] += 1
+        self.csrDirty = True
+        return path
+
+    def removePath( self, id1, id2 ):
+        key = self.edgeKey( id1, id2 )
+        if key not in self.edges:
+            return
+
+        del self.edges[key]
+        self.adjacency[id1].remove( id2 )
+        self.adjacency[id2].remove( id1 )
+        self.degree[id1] -= 1
+        self.degree[id2] -= 1
+        self.csrDirty = True
+
+    def buildCSR( self ):
+        if not self.csrDirty:
+            return
+
+        self.indptr = np.zeros( len( self.clearings ) + 1, dtype=np.int32 )
+        np.cumsum( self.degree, out=self.indptr[1:] )
+        self.indices = np.zeros( self.indptr[-1], dtype=np.int32 )
+        for i, neighbours in enumerate( self.adjacency ):
+            self.indices[ self.indptr[i]:self.indptr[i+1] ] = neighbours
+        self.csrDirty = False
+
+    # Array of the ids connected to this clearing
+    def getNeighbourIds( self, id ):
+        self.buildCSR()
+        return self.indices[ self.indptr[id]:self.indptr[id+1] ]
+
+    def getNeighbours( self, id ):
+        return [ self.clearings[i] for i in self.getNeighbourIds( id ) ]
+
+    # Label of the connected group each clearing belongs to, groups are numbered by their lowest clearing id
+    def getComponentLabels( self ):
+        self.buildCSR()
+        n = len( self.clearings )
+        matrix = csr_matrix( ( np.ones( len( self.indices ), dtype=np.int8 ), self.indices, self.indptr ), shape=( n, n ) )
+        return connected_components( matrix, directed=False )[1]
+
+    # Pairs of clearing ids for every path, in the order they were made
+    def getEdgeArray( self ):
+        if len( self.edges ) == 0:
+            return np.zeros( ( 0, 2 ), dtype=np.int32 )
+        return np.array( list( self.edges.keys() ), dtype=np.int32 )
+
+    def getPaths( self ):
+        return list( self.edges.values() )
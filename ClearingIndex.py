@@ -0,0 +1,53 @@
+from Clearing import *
+
+# Which clearings have each control and each feature, kept up to date by the clearings themselves as they change
+# so the war update can go straight to the clearings it cares about instead of scanning the whole map.
+# Lookups hand back clearings in id order, the same order a scan over woodland.clearings would find them in
+class ClearingIndex:
+    def __init__( self, clearings ):
+        self.clearings = clearings
+        self.byControl = {}
+        self.byFeature = [ set() for _ in Clearing.featureNames ]
+
+        for clearing in clearings:
+            self.byControl.setdefault( clearing.control, set() ).add( clearing.id )
+            mask = clearing.featureMask
+            for featureId in range( len( Clearing.featureNames ) ):
+                if mask & ( 1 << featureId ):
+                    self.byFeature[featureId].add( clearing.id )
+
+            clearing.index = self
+
+    # Called by the clearings
+    def controlChanged( self, clearing, oldControl, newControl ):
+        if oldControl in self.byControl:
+            self.byControl[oldControl].discard( clearing.id )
+        self.byControl.setdefault( newControl, set() ).add( clearing.id )
+
+    def featureAdded( self, clearing, featureId ):
+        self.byFeature[featureId].add( clearing.id )
+
+    def featureRemoved( self, clearing, featureId ):
+        self.byFeature[featureId].discard( clearing.id )
+
+    # Lookups
+    def getControlledIds( self, control ):
+        return self.byControl.get( control, set() )
+
+    def getFeatureIds( self, featureString ):
+        return self.byFeature[ Clearing.featureIds[ featureString ] ]
+
+    def getClearings( self, ids ):
+        return [ self.clearings[i] for i in sorted( ids ) ]
+
+    def getControlled( self, control ):
+        return self.getClearings( self.getControlledIds( control ) )
+
+    def getWithFeature( self, featureString ):
+        return self.getClearings( self.getFeatureIds( featureString ) )
+
+    def countControlled( self, control ):
+        return len( self.getControlledIds( control ) )
+
+    def countWithFeature( self, featureString ):
+        return len( self.getFeatureIds( featureString ) )
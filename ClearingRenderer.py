@@ -0,0 +1,495 @@
+from RenderCommon import *
+from Clearing import *
+
+import pygame
+import numpy as np
+import weakref
+
+class ClearingRenderer:
+    # Data for drawing
+    rad = Clearing.rad
+
+    # Data for drawing features
+    featureSize = 20
+    featureSpacing = 2
+    outlineWidth = 1
+    fortificationHeight = 3
+
+    # These are relative to the origin of the clearing
+    # They are ordered by how close they are to the clearing so the drawing looks better
+    featureLocations = [ [ -rad - featureSize - featureSpacing, -rad ],
+                         [ -rad - featureSize - featureSpacing, -rad + featureSize + featureSpacing ],
+                         [ rad + featureSpacing, -rad ],
+                         [ rad + featureSpacing, -rad + featureSize + featureSpacing],
+                         [ -rad - 2 * ( featureSize + featureSpacing ), -rad ],
+                         [ -rad - 2 * ( featureSize + featureSpacing ), -rad + featureSize + featureSpacing ],
+                         [ rad + featureSize + 2 * featureSpacing, -rad ],
+                         [ rad + featureSize + 2 * featureSpacing, -rad + featureSize + featureSpacing] ]
+    maxFeatures = len( featureLocations )
+
+    # Methods for drawing all types of features
+    @staticmethod
+    def drawStronghold( screen, org, size ):
+        points = [ [ 0, 1], [ 1, 1], [ 1, 0.375], [ 0.875, 0.25], [ 0.75, 0.375], [ 0.75, 0.25], [ 0.5, 0], [ 0.25, 0.25], [ 0.25, 0.375], [ 0.125, 0.25], [ 0, 0.375] ]
+
+        for i in range( len( points ) ):
+            points[i] = org + size * np.array( points[i] )
+            
+        pygame.draw.polygon( screen, controlColours[ "Marquisate" ], points )
+        pygame.draw.polygon( screen, BLACK, points, width=ClearingRenderer.outlineWidth )
+
+    @staticmethod
+    def drawRoost( screen, org, size ):
+        points = [ [0, .2], [.1, .1], [.1, 0], [.3, .1], [.5, 0], [.7, .1], [.9, 0], [.9, .1], [1, .2], [1, .35], [.85, .45], [.85, .55], [.7, .65], [.7, .9], [.8, 1], [.2, 1], [.3, .9], [.3, .65], [.15, .55], [.15, .45], [0, .35]]
+
+        for i in range( len( points ) ):
+            points[i] = org + size * np.array( points[i] )
+
+        pygame.draw.polygon( screen, controlColours[ "Eyrie" ], points )
+        pygame.draw.polygon( screen, BLACK, points, width=ClearingRenderer.outlineWidth )
+
+    @staticmethod
+    def drawLostMarquisateControl( screen, org, size ):
+        points = [ [ 0, 1], [ 1, 1], [ 1, 0.375], [ 0.875, 0.25], [ 0.75, 0.375], [ 0.5, 0.75] ]
+
+        for i in range( len( points ) ):
+            points[i] = org + size * np.array( points[i] )
+
+        pygame.draw.polygon( screen, controlColours[ "Marquisate" ], points )
+        pygame.draw.polygon( screen, BLACK, points, width=ClearingRenderer.outlineWidth )
+
+    @staticmethod
+    def drawWoodlandAllianceSupport( screen, org, size ):
+        if GLOBAL_SETTINGS.useClassicGraphics:
+            points = [ [.15, 0], [.3, 0], [.45, .15], [.55, .15], [.7, 0], [.85, 0], [1.0, 0.15], [1.0, .3], [.85, .45], [.85, .7], [.65, .9], [.35, .9], [.15, .7], [.15, .45], [0.0, .3], [.0, .15] ]
+            
+            for i in range( len( points ) ):
+                points[i] = org + size * np.array( points[i] )
+
+            pygame.draw.polygon( screen, controlColours[ "Woodland Alliance" ], points )
+            pygame.draw.polygon( screen, BLACK, points, width=ClearingRenderer.outlineWidth )
+        else:
+            image = getScaledImage( WOODLAND_ALLIANCE_ICON_PATH, size )
+            screen.blit( image, org )
+
+    @staticmethod
+    def drawWoodlandAllianceBase( screen, org, size ):
+        points = [ [0, 0], [0.2, 0], [0.2, 0.2], [.4, .2], [.4, 0], [.6, 0], [.6, .2], [.8, .2], [.8, 0], [1, 0], [1, 1], [0, 1] ]
+        
+        for i in range( len( points ) ):
+            points[i] = org + size * np.array( points[i] )
+
+        pygame.draw.polygon( screen, controlColours[ "Woodland Alliance" ], points )
+        pygame.draw.polygon( screen, BLACK, points, width=ClearingRenderer.outlineWidth )
+
+    @staticmethod
+    def drawLizardCultSupport( screen, org, size ):
+        if GLOBAL_SETTINGS.useClassicGraphics:
+            points = [ [0, 0.1], [0.25, 0], [.6, 0], [1, .15], [1, .45], [.6, .6], [.7, .9], [.15, .9], [.25, .6], [0.0, .5], [.25, .4], [.0, .3], [.25, .2] ]
+            
+            for i in range( len( points ) ):
+                points[i] = org + size * np.array( points[i] )
+
+            pygame.draw.polygon( screen, controlColours[ "Lizard Cult" ], points )
+            pygame.draw.polygon( screen, BLACK, points, width=ClearingRenderer.outlineWidth )
+        else:
+            image = getScaledImage( LIZARD_CULT_ICON_PATH, size )
+            screen.blit( image, org )
+
+    @staticmethod
+    def drawGarden( screen, org, size ):
+        points = [ [0, .8], [0, 0.6], [0.166, 0.3], [.333, 0.6], [.5, .3], [.666, .6], [.833, .3], [1, .6], [1, .8] ]
+        
+        for i in range( len( points ) ):
+            points[i] = org + size * np.array( points[i] )
+
+        pygame.draw.polygon( screen, controlColours[ "Lizard Cult" ], points )
+        pygame.draw.polygon( screen, BLACK, points, width=ClearingRenderer.outlineWidth )
+
+    @staticmethod
+    def drawInProgressGarden( screen, org, size ):
+        points = [ [0, .8], [0, 0.7], [0.166, 0.6], [.333, 0.7], [.5, .6], [.666, .7], [.833, .6], [1, .7], [1, .8] ]
+        
+        for i in range( len( points ) ):
+            points[i] = org + size * np.array( points[i] )
+
+        pygame.draw.polygon( screen, controlColours[ "Lizard Cult" ], points )
+        pygame.draw.polygon( screen, BLACK, points, width=ClearingRenderer.outlineWidth )
+
+    @staticmethod
+    def drawRiverfolk( screen, org, size ):
+        if GLOBAL_SETTINGS.useClassicGraphics:
+            points = [ [.1, 0], [.2, 0], [.3, .1], [.7, .1], [.8, 0], [.9, 0], [1.0, 0.1], [1.0, .2], [.9, .3], [.9, .7], [.7, .9], [.3, .9], [.1, .7], [.1, .3], [0.0, .2], [.0, .1] ]
+            
+            for i in range( len( points ) ):
+                points[i] = org + size * np.array( points[i] )
+
+            pygame.draw.polygon( screen, controlColours[ "Riverfolk" ], points )
+            pygame.draw.polygon( screen, BLACK, points, width=ClearingRenderer.outlineWidth )
+        else:
+            image = getScaledImage( RIVERFOLK_ICON_PATH, size )
+            screen.blit( image, org )
+
+    @staticmethod
+    def drawTunnel( screen, org, size ):
+        points = [ [0, 0.8], [.2, .4], [.3, .5], [.7, .5], [.8, .4], [1, .8] ]
+        
+        for i in range( len( points ) ):
+            points[i] = org + size * np.array( points[i] )
+
+        pygame.draw.polygon( screen, controlColours[ "Grand Duchy" ], points )
+        pygame.draw.polygon( screen, BLACK, points, width=ClearingRenderer.outlineWidth )
+
+    @staticmethod
+    def drawCorvidConspiracy( screen, org, size ):
+        if GLOBAL_SETTINGS.useClassicGraphics:
+            points = [ [0.1, 1], [0.2, 0.75], [0, 0.5], [0, 0.25], [0.25, 0], [0.5, 0], [0.75, .25], [1, 0.2], [0.75, 0.375], [1, 0.6], [0.75, 0.5], [0.6, .75], [0.7, 1.0] ]
+            
+            for i in range( len( points ) ):
+                points[i] = org + size * np.array( points[i] )
+
+            pygame.draw.polygon( screen, controlColours[ "Corvid Conspiracy" ], points )
+            pygame.draw.polygon( screen, BLACK, points, width=ClearingRenderer.outlineWidth )
+        else:
+            image = getScaledImage( CORVIDS_ICON_PATH, size )
+            screen.blit( image, org )
+            
+    @staticmethod
+    def drawPlot( screen, org, size ):
+        points = [ [0.2, 0.2], [0.4, 0], [.6, 0], [.8, .2], [.8, .8], [.6, 1], [.4, 1], [.2, .8] ]
+        
+        for i in range( len( points ) ):
+            points[i] = org + size * np.array( points[i] )
+
+        pygame.draw.polygon( screen, controlColours[ "Corvid Conspiracy" ], points )
+        pygame.draw.polygon( screen, BLACK, points, width=ClearingRenderer.outlineWidth )
+
+    @staticmethod
+    def drawTradingPost( screen, org, size ):
+        points = [ [0, 0], [1, 0], [1, 1], [0, 1] ]
+        
+        for i in range( len( points ) ):
+            points[i] = org + size * np.array( points[i] )
+
+        pygame.draw.polygon( screen, controlColours[ "Riverfolk" ], points )
+        pygame.draw.polygon( screen, BLACK, points, width=ClearingRenderer.outlineWidth )
+
+    @staticmethod
+    def drawCitadel( screen, org, size ):
+        points = [ [0, 0], [1, 0], [1, 1], [0, 1] ]
+        
+        for i in range( len( points ) ):
+            points[i] = org + size * np.array( points[i] )
+
+        pygame.draw.polygon( screen, controlColours[ "Grand Duchy" ], points )
+        pygame.draw.polygon( screen, BLACK, points, width=ClearingRenderer.outlineWidth )
+
+    @staticmethod
+    def drawMarket( screen, org, size ):
+        points = [ [0, 1], [.5, 0], [1, 1] ]
+        
+        for i in range( len( points ) ):
+            points[i] = org + size * np.array( points[i] )
+
+        pygame.draw.polygon( screen, controlColours[ "Grand Duchy" ], points )
+        pygame.draw.polygon( screen, BLACK, points, width=ClearingRenderer.outlineWidth )
+
+    @staticmethod
+    def drawSawmill( screen, org, size ):
+        points = [ [0.5, 0], [1, 0.5], [.5, 1], [0, .5] ]
+        
+        for i in range( len( points ) ):
+            points[i] = org + size * np.array( points[i] )
+
+        pygame.draw.polygon( screen, controlColours[ "Marquisate" ], points )
+        pygame.draw.polygon( screen, BLACK, points, width=ClearingRenderer.outlineWidth )
+
+    @staticmethod
+    def drawWorkshop( screen, org, size ):
+        points = [ [0, 0], [1, 0], [1, 1], [0, 1] ]
+        
+        for i in range( len( points ) ):
+            points[i] = org + size * np.array( points[i] )
+
+        pygame.draw.polygon( screen, controlColours[ "Marquisate" ], points )
+        pygame.draw.polygon( screen, BLACK, points, width=ClearingRenderer.outlineWidth )
+
+    @staticmethod
+    def drawRecruiter( screen, org, size ):
+        points = [ [0, 1], [.5, 0], [1, 1] ]
+        
+        for i in range( len( points ) ):
+            points[i] = org + size * np.array( points[i] )
+
+        pygame.draw.polygon( screen, controlColours[ "Marquisate" ], points )
+        pygame.draw.polygon( screen, BLACK, points, width=ClearingRenderer.outlineWidth )
+
+    # Methods for drawing control icons
+    @staticmethod
+    def drawMarquisateControl( screen, org, size ):
+        if GLOBAL_SETTINGS.useClassicGraphics:
+            points = [ [0, 0], [0.33, 0.25], [.66, .25], [1, 0], [1, .75], [.75, 1], [.25, 1], [0, .75] ]
+            
+            for i in range( len( points ) ):
+                points[i] = org + size * np.array( points[i] )
+
+            pygame.draw.polygon( screen, controlColours[ "Marquisate" ], points )
+            pygame.draw.polygon( screen, BLACK, points, width=ClearingRenderer.outlineWidth )
+        else:
+            image = getScaledImage( MARQUISATE_ICON_PATH, size )
+            screen.blit( image, org )
+        
+    @staticmethod
+    def drawEyrieControl( screen, org, size ):
+        if GLOBAL_SETTINGS.useClassicGraphics:
+            points = [ [0, 1], [0.2, 0.8], [0.1, 0.1], [0.5, 0.3], [0.75, 0.3], [1.0, 0.5], [0.75, .7], [0.75, 0.8], [0.95, 1] ]
+            
+            for i in range( len( points ) ):
+                points[i] = org + size * np.array( points[i] )
+
+            pygame.draw.polygon( screen, controlColours[ "Eyrie" ], points )
+            pygame.draw.polygon( screen, BLACK, points, width=ClearingRenderer.outlineWidth )
+        else:
+            image = getScaledImage( EYRIE_ICON_PATH, size )
+            screen.blit( image, org )
+            
+    @staticmethod
+    def drawWoodlandAllianceControl( screen, org, size ):
+        ClearingRenderer.drawWoodlandAllianceSupport( screen, org, size )
+        
+    @staticmethod
+    def drawLizardCultControl( screen, org, size ):
+        ClearingRenderer.drawLizardCultSupport( screen, org, size )
+
+    @staticmethod
+    def drawRiverfolkControl( screen, org, size ):
+        ClearingRenderer.drawRiverfolk( screen, org, size )
+
+    @staticmethod
+    def drawGrandDuchyControl( screen, org, size ):
+        if GLOBAL_SETTINGS.useClassicGraphics:
+            points = [ [0, 1], [0, 0.64], [0.09, 0.37], [0.21, 0.19], [0.36, 0.1], [0.6, 0.1], [0.7, .3], [1, 0.3], [.8, .5], [.9, 1] ]
+            
+            for i in range( len( points ) ):
+                points[i] = org + size * np.array( points[i] )
+
+            pygame.draw.polygon( screen, controlColours[ "Grand Duchy" ], points )
+            pygame.draw.polygon( screen, BLACK, points, width=ClearingRenderer.outlineWidth )
+        else:
+            image = getScaledImage( DUCHY_ICON_PATH, size )
+            screen.blit( image, org )
+            
+    @staticmethod
+    def drawCorvidControl( screen, org, size ):
+        ClearingRenderer.drawCorvidConspiracy( screen, org, size )
+
+    # Methods for drawing denizens
+    @staticmethod
+    def drawFox( screen, org, size ):
+        points = [ [0, 0], [0.33, 0.25], [.66, .25], [1, 0], [1, .75], [.5, 1], [0, .75] ]
+        
+        for i in range( len( points ) ):
+            points[i] = org + size * np.array( points[i] )
+
+        pygame.draw.polygon( screen, controlColours[ "Denizens" ], points )
+        pygame.draw.polygon( screen, BLACK, points, width=ClearingRenderer.outlineWidth )
+
+    @staticmethod
+    def drawMouse( screen, org, size ):
+        points = [ [.15, 0], [.3, 0], [.45, .15], [.55, .15], [.7, 0], [.85, 0], [1.0, 0.15], [1.0, .3], [.85, .45], [.85, .7], [.65, .9], [.35, .9], [.15, .7], [.15, .45], [0.0, .3], [.0, .15] ]
+        
+        for i in range( len( points ) ):
+            points[i] = org + size * np.array( points[i] )
+
+        pygame.draw.polygon( screen, controlColours[ "Denizens" ], points )
+        pygame.draw.polygon( screen, BLACK, points, width=ClearingRenderer.outlineWidth )
+
+    @staticmethod
+    def drawRabbit( screen, org, size ):
+        points = [ [0, 0.05], [0.05, 0], [0.15, 0], [0.5, 0.4], [0.85, 0], [.95, 0], [1, .05], [1, .15], [0.7, 0.35], [0.875, 0.55], [0.875, 0.8], [0.675, 1], [0.325, 1], [0.125, 0.8], [0.125, 0.55], [0.3, 0.35], [0, 0.15] ]
+        
+        for i in range( len( points ) ):
+            points[i] = org + size * np.array( points[i] )
+
+        pygame.draw.polygon( screen, controlColours[ "Denizens" ], points )
+        pygame.draw.polygon( screen, BLACK, points, width=ClearingRenderer.outlineWidth )
+
+    controlDict = { "Marquisate" : drawMarquisateControl,
+                    "Eyrie" : drawEyrieControl,
+                    "Woodland Alliance" : drawWoodlandAllianceControl,
+                    "Lizard Cult" : drawLizardCultControl,
+                    "Riverfolk" : drawRiverfolkControl,
+                    "Grand Duchy" : drawGrandDuchyControl,
+                    "Corvid Conspiracy" : drawCorvidControl,
+                    "Denizens" : drawMouse,
+                    "None" : None
+                    }
+
+    controlDrawSize = 25
+
+    featureDrawFcns = { "Stronghold":                  drawStronghold,
+                        "Roost":                       drawRoost,
+                        "Lost Marquisate Control":     drawLostMarquisateControl,
+                        "Woodland Alliance Support":   drawWoodlandAllianceSupport,
+                        "Base":                        drawWoodlandAllianceBase,
+                        "Lizard Cult Support":         drawLizardCultSupport,
+                        "Garden":                      drawGarden,
+                        "Riverfolk":                   drawRiverfolk,
+                        "Tunnel":                      drawTunnel,
+                        "Corvid Conspiracy":           drawCorvidConspiracy,
+                        "Lake":                        None,
+                        "River":                       None,
+                        "Fortifications":              None,
+                        "Market":                      drawMarket,
+                        "Citadel":                     drawCitadel,
+                        "Workshop":                    drawWorkshop,
+                        "Sawmill":                     drawSawmill,
+                        "Recruiter":                   drawRecruiter,
+                        "Plot":                        drawPlot,
+                        "Trading Post":                drawTradingPost,
+                        "In Progress Garden":          drawInProgressGarden,
+                        "Mountain":                    None,
+                        "Marsh":                       None,
+                        }
+
+    residentsDict = { "Fox" : drawFox,
+                      "Mouse" : drawMouse,
+                      "Rabbit" : drawRabbit,
+                      "None" : None
+                      }
+    
+    residentsDrawSize = 15
+
+    statusColours = [GREEN, YELLOW, ORANGE, RED]
+
+    localInfoDrawSpacing = 1
+    localInfoCache = weakref.WeakKeyDictionary()
+
+    @staticmethod
+    def draw( screen, clearing ):
+        pygame.draw.circle( screen, WHITE, clearing.pos, clearing.rad )
+        pygame.draw.circle( screen, ClearingRenderer.statusColours[clearing.status], clearing.pos, clearing.rad, 3 )
+        
+        nameTextSize = font20.size( clearing.name )
+        nameTextPos = [ clearing.pos[0] - nameTextSize[0] / 2.0, clearing.pos[1] + clearing.rad ]
+
+        outlineText( screen, nameTextPos, clearing.name, font20, WHITE, BLACK )
+
+        controlDrawFcn = ClearingRenderer.controlDict[ clearing.control ]
+        if controlDrawFcn != None:
+            controlDrawSize = ClearingRenderer.controlDrawSize
+            controlDrawPos = clearing.pos - np.array( [ controlDrawSize / 2.0, controlDrawSize / 2.0 ] )
+            controlDrawFcn( screen, controlDrawPos, controlDrawSize )
+
+        residentsDrawFcn = ClearingRenderer.residentsDict[ clearing.residents ]
+        if residentsDrawFcn != None:
+            residentsDrawPos = [ clearing.pos[0] + nameTextSize[0] / 2.0, clearing.pos[1] + clearing.rad + nameTextSize[1] / 5.0 ]
+            residentsDrawFcn( screen, residentsDrawPos, ClearingRenderer.residentsDrawSize )
+
+        ClearingRenderer.drawFeatures( screen, clearing )
+
+    # Screen rect that everything draw puts down for this clearing fits inside
+    @staticmethod
+    def getDrawRect( clearing ):
+        nameTextSize = font20.size( clearing.name )
+        buffer = ClearingRenderer.outlineWidth + 2
+
+        # Features sit in two columns on each side of the clearing, the residents go just past the end of the name
+        featuresHalfWidth = clearing.rad + 2 * ( ClearingRenderer.featureSize + ClearingRenderer.featureSpacing )
+        nameHalfWidth = nameTextSize[0] / 2.0 + ClearingRenderer.residentsDrawSize
+        halfWidth = max( featuresHalfWidth, nameHalfWidth ) + buffer
+
+        top = clearing.pos[1] - clearing.rad - buffer
+        bottom = clearing.pos[1] + clearing.rad + max( nameTextSize[1], nameTextSize[1] / 5.0 + ClearingRenderer.residentsDrawSize ) + buffer
+        return pygame.Rect( clearing.pos[0] - halfWidth, top, 2 * halfWidth, bottom - top )
+
+    # Fortifications are special, we draw them on top of the circle
+    @staticmethod
+    def drawFortifications( screen, clearing ):
+        points = [ [-1, 1], [-1, .5], [-.6, .5], [-.6, .7], [-.2, .7], [-.2, .5], [.2, .5], [.2, .7], [.6, .7], [.6, .5], [1, .5], [1, 1] ]
+        
+        for i in range( len( points ) ):
+            points[i] = clearing.pos + clearing.rad * np.array( points[i] )
+        
+        pygame.draw.polygon( screen, LIGHT_GREY, points )
+        pygame.draw.polygon( screen, BLACK, points, width=ClearingRenderer.outlineWidth )
+
+    @staticmethod
+    def drawFeatures( screen, clearing ):
+        featureLocationIndex = 0
+        for feature in clearing.features:
+            if feature == "Fortifications":
+                ClearingRenderer.drawFortifications( screen, clearing )
+            elif featureLocationIndex < ClearingRenderer.maxFeatures:
+                drawFcn = ClearingRenderer.featureDrawFcns[ feature ]
+                
+                if drawFcn != None:
+                    featureLocation = ClearingRenderer.featureLocations[ featureLocationIndex ] + clearing.pos
+                    drawFcn( screen, featureLocation, ClearingRenderer.featureSize )
+                    
+                    featureLocationIndex += 1
+
+    @staticmethod
+    def getLocalInfoTexts( clearing ):
+        texts = [ clearing.name + ": " + clearing.residents ]
+        fonts = [ basicFont14 ]
+        colours = [ BLACK ]
+
+        texts.append( "War status: " + clearing.statusDescriptions[ clearing.status ] )
+        fonts.append( basicFont12 )
+        colours.append( ClearingRenderer.statusColours[ clearing.status ] )
+        
+        texts.append( "Important Denizens:" )
+        fonts.append( basicFont12 )
+        colours.append( BLACK )
+        for denizen in clearing.denizens:
+            texts.append( " - " + denizen.name + ": " + denizen.species + " " + denizen.occupation )
+            fonts.append( basicFont12 )
+            colours.append( BLACK )
+
+        texts.append( "Important Buildings:" )
+        fonts.append( basicFont12 )
+        colours.append( BLACK )
+        for building in clearing.buildings:
+            texts.append( " - " + building )
+            fonts.append( basicFont12 )
+            colours.append( BLACK )
+
+        texts.append( "Problems:" )
+        fonts.append( basicFont12 )
+        colours.append( BLACK )
+        for problem in clearing.problems:
+            texts.append( " - " + problem )
+            fonts.append( basicFont12 )
+            colours.append( BLACK )
+        
+        return texts, fonts, colours
+
+    # Everything the local info shows, when this changes the cached local info is drawn again
+    @staticmethod
+    def getLocalInfoKey( clearing ):
+        return ( clearing.name, clearing.residents, clearing.status,
+                 tuple( ( denizen.name, denizen.species, denizen.occupation ) for denizen in clearing.denizens ),
+                 tuple( clearing.buildings ), tuple( clearing.problems ) )
+
+    # The finished local info for each clearing, kept until what it shows changes
+    # This is kept here instead of on the clearings so they can still be pickled, and goes away along with the clearings
+    @staticmethod
+    def getLocalInfoSurface( clearing ):
+        key = ClearingRenderer.getLocalInfoKey( clearing )
+        cached = ClearingRenderer.localInfoCache.get( clearing )
+        if cached and cached[0] == key:
+            return cached[1]
+
+        texts, fonts, colours = ClearingRenderer.getLocalInfoTexts( clearing )
+        surface = pygame.Surface( getTextTableSize( texts, fonts, ClearingRenderer.localInfoDrawSpacing ) )
+        drawTextTable( surface, ( 0, 0 ), texts, fonts, colours, ClearingRenderer.localInfoDrawSpacing, WHITE, BLACK )
+
+        ClearingRenderer.localInfoCache[clearing] = ( key, surface )
+        return surface
+
+    @staticmethod
+    def drawLocalInfo( screen, clearing, pos ):
+        surface = ClearingRenderer.getLocalInfoSurface( clearing )
+        screen.blit( surface, pos )
+        return surface.get_size()
@@ -0,0 +1,108 @@
+from Woodland import *
+
+import json
+
+# Helper class to store the config data
+class ConfigData:
+    def __init__( self ):
+        self.mapWidth = 1000
+        self.mapHeight = 800
+        self.numClearings = 12
+        self.minClearingDist = 100
+
+        self.forceLake = False
+        self.forceRiver = False
+        
+        self.enableLake = True
+        self.enableRiver = True
+        
+        self.enableMarquisate = True
+        self.enableEyrie = True
+        self.enableWoodlandAlliance = True
+        self.enableLizardCult = True
+        self.enableRiverfolk = True
+        self.enableDuchy = True
+        self.enableCorvids = True
+        self.enableMountains = True
+        self.enableMarshes = True
+        self.enableLandmarks = True
+
+    def getTextBoxAsInt( widget ):
+        text = widget.getText()
+        if text.isdigit():
+            return int( text )
+        else:
+            return 0
+
+    def setMapWidth( config, widget ):
+        config.mapWidth = ConfigData.getTextBoxAsInt( widget )
+
+    def setMapHeight( config, widget ):
+        config.mapHeight = ConfigData.getTextBoxAsInt( widget )
+
+    def setNumClearings( config, widget ):
+        config.numClearings = ConfigData.getTextBoxAsInt( widget )
+
+    def setMinClearingDist( config, widget ):
+        config.minClearingDist = ConfigData.getTextBoxAsInt( widget )
+
+    def setForceLake( config, widget ):
+        config.forceLake = widget.getValue()
+
+    def setForceRiver( config, widget ):
+        config.forceRiver = widget.getValue()
+
+    def setEnableLake( config, widget ):
+        config.enableLake = widget.getValue()
+
+    def setEnableRiver( config, widget ):
+        config.enableRiver = widget.getValue()
+
+    def setEnableMarquisate( config, widget ):
+        config.enableMarquisate = widget.getValue()
+
+    def setEnableEyrie( config, widget ):
+        config.enableEyrie = widget.getValue()
+
+    def setEnableWoodlandAlliance( config, widget ):
+        config.enableWoodlandAlliance = widget.getValue()
+
+    def setEnableLizardCult( config, widget ):
+        config.enableLizardCult = widget.getValue()
+
+    def setEnableRiverfolk( config, widget ):
+        config.enableRiverfolk = widget.getValue()
+
+    def setEnableDuchy( config, widget ):
+        config.enableDuchy = widget.getValue()
+
+    def setEnableCorvids( config, widget ):
+        config.enableCorvids = widget.getValue()
+
+    def setEnableMountains( config, widget ):
+        config.enableMountains = widget.getValue()
+
+    def setEnableMarshes( config, widget ):
+        config.enableMarshes = widget.getValue()
+
+    def setEnableLandmarks( config, widget ):
+        config.enableLandmarks = widget.getValue()
+
+    # Build an ungenerated Woodland from the current settings
+    def createWoodland( self, pos ):
+        return Woodland( pos, [ self.mapWidth, self.mapHeight ], self.minClearingDist,
+                         self.enableLake, self.enableRiver, self.forceLake, self.forceRiver,
+                         self.enableMarquisate, self.enableEyrie, self.enableWoodlandAlliance,
+                         self.enableLizardCult, self.enableRiverfolk, self.enableDuchy,
+                         self.enableCorvids, self.enableMountains, self.enableMarshes,
+                         self.enableLandmarks )
+
+    # Overwrite the settings with any that are set in a json file, Ex { "mapWidth": 2000, "enableLake": false }
+    def loadJson( self, path ):
+        with open( path ) as file:
+            values = json.load( file )
+
+        for name in values:
+            if not hasattr( self, name ):
+                raise ValueError( "Unknown config setting " + name + " in " + path )
+            setattr( self, name, values[name] )
@@ -0,0 +1,73 @@
+from RenderCommon import *
+from Woodland import *
+
+import functools
+import pygame
+import numpy as np
+
+# Pre-drawn sprites of the decor so each object can be put down with a single blit instead of a few draw calls
+# A sprite is made the first time an object of that type, size and colour is needed and kept for the maps after that
+# Colours are rounded to colourStep so the colour variance doesn't make every object need its own sprite
+class DecorAtlas:
+    colourStep = 16
+    spritePadding = 2
+
+    # A map uses a few hundred different sprites, this keeps the ones for a couple of maps before the oldest are let go
+    spriteCacheSize = 2048
+
+    @staticmethod
+    def quantiseColours( colours ):
+        step = DecorAtlas.colourStep
+        return np.minimum( 255, np.round( colours / step ) * step ).astype( np.int64 )
+
+    # Returns ( sprite, offset from the object's position to the top left of the sprite )
+    # Colour has to already be quantised and a tuple. The sprites are shared, so don't draw onto them
+    @staticmethod
+    @functools.lru_cache( maxsize=spriteCacheSize )
+    def getSprite( decorObjectType, size, colour ):
+        # Build the shapes for a single object sitting on the origin
+        decor = np.zeros( 1, dtype=Woodland.decorDtype )
+        decor["size"] = size
+        decor["colour"] = colour
+        decor["type"] = decorObjectType
+        geometry = DecorGeometry.build( decor, 0, 0, Woodland.decorShapeFcns )
+
+        # Find how far the shapes reach, circles reach their radius past their centre
+        radii = np.zeros( len( geometry.points ) )
+        circles = geometry.shapes[ geometry.shapes["kind"] == DecorGeometry.CIRCLE ]
+        radii[ circles["start"] ] = circles["radius"]
+        minPoint = np.floor( ( geometry.points - radii[:, None] ).min( axis=0 ) ).astype( int ) - DecorAtlas.spritePadding
+        maxPoint = np.ceil( ( geometry.points + radii[:, None] ).max( axis=0 ) ).astype( int ) + DecorAtlas.spritePadding
+
+        sprite = pygame.Surface( maxPoint - minPoint, pygame.SRCALPHA )
+        points = ( geometry.points - minPoint ).tolist()
+        for kind, shapeColour, width, start, count, radius in geometry.shapes.tolist():
+            if kind == DecorGeometry.CIRCLE:
+                pygame.draw.circle( sprite, shapeColour, points[start], radius )
+            else:
+                pygame.draw.polygon( sprite, shapeColour, points[start:start + count], width )
+
+        return ( convertForDisplay( sprite ), tuple( minPoint.tolist() ) )
+
+    # Everything to hand to Surface.blits to draw all of a woodland's decor, in the same order it would be drawn in
+    @staticmethod
+    def getBlits( woodland ):
+        decor = woodland.decor
+        if len( decor ) == 0:
+            return []
+
+        # Only look up each distinct sprite once
+        colours = DecorAtlas.quantiseColours( decor["colour"] )
+        keys = np.stack( ( decor["type"], decor["size"], colours[:, 0], colours[:, 1], colours[:, 2] ), axis=1 )
+        uniqueKeys, spriteIndexes = np.unique( keys, axis=0, return_inverse=True )
+        spriteIndexes = spriteIndexes.reshape( -1 )
+
+        sprites = []
+        offsets = np.zeros( ( len( uniqueKeys ), 2 ), dtype=np.int64 )
+        for i, ( decorObjectType, size, r, g, b ) in enumerate( uniqueKeys.tolist() ):
+            sprite, offsets[i] = DecorAtlas.getSprite( decorObjectType, size, ( r, g, b ) )
+            sprites.append( sprite )
+
+        xs = np.round( decor["x"] ).astype( np.int64 ) + offsets[spriteIndexes, 0]
+        ys = woodland.pos[1] + woodland.drawGridCellSize * decor["row"].astype( np.int64 ) + offsets[spriteIndexes, 1]
+        return list( zip( [ sprites[i] for i in spriteIndexes.tolist() ], zip( xs.tolist(), ys.tolist() ) ) )
@@ -0,0 +1,137 @@
+from WoodlandCommon import *
+
+import numpy as np
+
+# The shapes every decor object is drawn with, worked out once when the decor is made so drawing it is just handing them over
+# Every shape is a polygon or a circle. The points of all of them live in one array, each shape knows where its points start
+# and how many it has, and the shapes are kept in the order they need to be drawn in
+class DecorGeometry:
+    POLYGON = 0
+    CIRCLE = 1
+
+    shapeDtype = np.dtype( [ ( "kind", np.int8 ), ( "colour", np.uint8, 3 ), ( "width", np.int8 ), ( "start", np.int32 ), ( "count", np.int32 ), ( "radius", np.float64 ) ] )
+
+    mountainSnowCapMinSize = 42
+    houseOutlineWidth = 1
+
+    # Shapes relative to the bottom middle of the object, scaled by its size
+    treeTrunkPoints = [ [-.2, 0], [-.15, -.05], [-.15, -.7], [.15, -.7], [.15, -.05], [.2, 0] ]
+    pineTrunkPoints = [ [-.15, 0], [-.1, -.1], [.1, -.1], [.15, 0] ]
+    pineTreePoints = [ [0, -1.0], [.2, -.7], [.1, -.7], [.3, -.4], [.2, -.4], [.4, -.1], [-.4, -.1], [-.2, -.4], [-.3, -.4], [-.1, -.7], [-.2, -.7] ]
+    houseBasePoints = [ [-.3, .0], [-.3, -.4], [.0, -.7], [.3, -.4], [.3, .0] ]
+    houseRoofPoints = [ [.0, -.7], [.4, -.3], [.45, -.35], [.3, -.5], [.3, -.75], [.15, -.75], [.15, -.65], [0, -.8], [-.45, -.35], [-.4, -.3] ]
+
+    def __init__( self ):
+        self.points = np.zeros( ( 0, 2 ) )
+        self.shapes = np.zeros( 0, dtype=self.shapeDtype )
+
+        # Filled in while building
+        self.pointBatches = []
+        self.shapeBatches = []
+        self.orderBatches = []
+        self.numPoints = 0
+
+    # Build the shapes for every object in a decor array, shapeFcns has the function that adds the shapes for each decor type
+    @staticmethod
+    def build( decor, top, cellSize, shapeFcns ):
+        geometry = DecorGeometry()
+        pos = np.stack( ( decor["x"], top + cellSize * decor["row"] ), axis=1 )
+        sizes = decor["size"].astype( np.int64 )
+
+        for decorObjectType, shapeFcn in shapeFcns.items():
+            items = np.nonzero( decor["type"] == decorObjectType.value )[0]
+            if len( items ) > 0:
+                shapeFcn( geometry, items, pos[items], sizes[items], decor["colour"][items] )
+
+        geometry.finish()
+        return geometry
+
+    # Shapes are added for a batch of objects at a time, items are the indexes of the objects in the decor array and layer is
+    # the order the shape is drawn in for each object. Points is ( number of objects, number of points per shape, 2 )
+    def addPolygons( self, items, layer, points, colours, width=0 ):
+        shapes = np.zeros( len( items ), dtype=self.shapeDtype )
+        shapes["kind"] = self.POLYGON
+        shapes["colour"] = colours
+        shapes["width"] = width
+        shapes["count"] = points.shape[1]
+        shapes["start"] = self.numPoints + points.shape[1] * np.arange( len( items ) )
+        self.addShapes( items, layer, shapes, points.reshape( -1, 2 ) )
+
+    def addCircles( self, items, layer, centres, radii, colours ):
+        shapes = np.zeros( len( items ), dtype=self.shapeDtype )
+        shapes["kind"] = self.CIRCLE
+        shapes["colour"] = colours
+        shapes["count"] = 1
+        shapes["start"] = self.numPoints + np.arange( len( items ) )
+        shapes["radius"] = radii
+        self.addShapes( items, layer, shapes, centres )
+
+    def addShapes( self, items, layer, shapes, points ):
+        self.pointBatches.append( points )
+        self.shapeBatches.append( shapes )
+        self.orderBatches.append( np.stack( ( items, np.full( len( items ), layer ) ), axis=1 ) )
+        self.numPoints += len( points )
+
+    # Put the shapes in draw order, objects in the order they are in the decor and then each object's shapes by layer
+    def finish( self ):
+        if len( self.shapeBatches ) > 0:
+            self.points = np.concatenate( self.pointBatches )
+            shapes = np.concatenate( self.shapeBatches )
+            order = np.concatenate( self.orderBatches )
+            self.shapes = shapes[ np.lexsort( ( order[:, 1], order[:, 0] ) ) ]
+
+        self.pointBatches = []
+        self.shapeBatches = []
+        self.orderBatches = []
+
+    # Template points scaled by each object's size and moved to its position
+    @staticmethod
+    def placePoints( pos, sizes, templatePoints ):
+        return pos[:, None, :] + sizes[:, None, None] * np.array( templatePoints )[None, :, :]
+
+    @staticmethod
+    def addTrees( geometry, items, pos, sizes, colours ):
+        geometry.addPolygons( items, 0, DecorGeometry.placePoints( pos, sizes, DecorGeometry.treeTrunkPoints ), BROWN )
+
+        leavesPoints = [ np.stack( ( pos[:, 0] - 0.25 * sizes, pos[:, 1] - 0.6 * sizes ), axis=1 ),
+                         np.stack( ( pos[:, 0] + 0.25 * sizes, pos[:, 1] - 0.6 * sizes ), axis=1 ),
+                         np.stack( ( pos[:, 0], pos[:, 1] - 0.7 * sizes ), axis=1 ) ]
+        leavesSizes = [ sizes * 0.25, sizes * 0.25, sizes * 0.35 ]
+
+        for i in range( len( leavesPoints ) ):
+            geometry.addCircles( items, i + 1, leavesPoints[i], leavesSizes[i], colours )
+
+    @staticmethod
+    def addMountains( geometry, items, pos, sizes, colours ):
+        mountainPoints = np.stack( ( pos + np.stack( ( np.zeros( len( sizes ) ), - sizes ), axis=1 ),
+                                     pos + np.stack( ( - sizes / 2, np.zeros( len( sizes ) ) ), axis=1 ),
+                                     pos + np.stack( ( sizes / 2, np.zeros( len( sizes ) ) ), axis=1 ) ), axis=1 )
+        geometry.addPolygons( items, 0, mountainPoints, colours )
+
+        # Big enough mountains get a snow cap, the bigger they are the further down it goes
+        hasSnowCap = sizes >= DecorGeometry.mountainSnowCapMinSize
+        if np.any( hasSnowCap ):
+            peaks = mountainPoints[hasSnowCap]
+            snowCapHeight = ( ( sizes[hasSnowCap] - DecorGeometry.mountainSnowCapMinSize ) / sizes[hasSnowCap] )[:, None]
+            snowCapPoints = np.stack( ( peaks[:, 0], peaks[:, 0] + snowCapHeight * ( peaks[:, 1] - peaks[:, 0] ), peaks[:, 0] + snowCapHeight * ( peaks[:, 2] - peaks[:, 0] ) ), axis=1 )
+            geometry.addPolygons( items[hasSnowCap], 1, snowCapPoints, WHITE )
+
+    @staticmethod
+    def addPines( geometry, items, pos, sizes, colours ):
+        geometry.addPolygons( items, 0, DecorGeometry.placePoints( pos, sizes, DecorGeometry.pineTrunkPoints ), DARK_BROWN )
+        geometry.addPolygons( items, 1, DecorGeometry.placePoints( pos, sizes, DecorGeometry.pineTreePoints ), colours )
+
+    @staticmethod
+    def addBushes( geometry, items, pos, sizes, colours ):
+        centres = np.stack( ( pos[:, 0], pos[:, 1] - sizes / 2 ), axis=1 )
+        geometry.addCircles( items, 0, centres, sizes / 2, colours )
+
+    @staticmethod
+    def addSmallHouses( geometry, items, pos, sizes, colours ):
+        allPoints = [ DecorGeometry.houseBasePoints, DecorGeometry.houseRoofPoints ]
+        allColours = [ GREY, BROWN ]
+
+        for i in range( len( allPoints ) ):
+            points = DecorGeometry.placePoints( pos, sizes, allPoints[i] )
+            geometry.addPolygons( items, 2 * i, points, allColours[i] )
+            geometry.addPolygons( items, 2 * i + 1, points, BLACK, DecorGeometry.houseOutlineWidth )
@@ -1,5 +1,4 @@
 from WoodlandCommon import *
-import pygame
 import random
 
 class Denizen:
@@ -51,30 +50,30 @@ class Denizen:
              "Whickam", "Woodleaf", "Xander", "Xara", "Xeelie", "Xim", "Yasmin", "Yates", "Yolenda", "Yotterie", "Zachrie", "Zain", "Zoic", "Zola"]
     
 
-    def __init__( self ):
+    def __init__( self, rng=random ):
         self.occupation = ""
         self.species = ""
-        self.name = random.choice( self.names )
+        self.name = rng.choice( self.names )
 
-    def generateSpecies( self, clearing ):
-        rand = random.random()
+    def generateSpecies( self, clearing, rng=random ):
+        rand = rng.random()
         species = ""
         control = clearing.control
         clearingSpecies = clearing.residents
 
         # Make the species part of the controlling group of this clearing
         if rand < self.controlSpeciesFactor and ( control in self.controlSpecies ) and ( len( self.controlSpecies[control] ) > 0 ) :
-            species = random.choice( self.controlSpecies[control] )
+            species = rng.choice( self.controlSpecies[control] )
         elif rand < self.clearingSpeciesFactor:
             species = clearingSpecies
         elif rand < self.basicSpeciesFactor:
-            species = random.choice( self.basicSpecies )
+            species = rng.choice( self.basicSpecies )
         elif rand < self.commonSpeciesFactor:
-            species = random.choice( self.commonSpecies )
+            species = rng.choice( self.commonSpecies )
         elif rand < self.uncommonSpeciesFactor:
-            species = random.choice( self.uncommonSpecies )
+            species = rng.choice( self.uncommonSpecies )
         elif rand < self.rareSpeciesFactor:
-            species = random.choice( self.rareSpecies )
+            species = rng.choice( self.rareSpecies )
 
         self.species = species
     
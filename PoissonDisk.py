@@ -0,0 +1,155 @@
+import random
+import math
+
+# Places points with at least minDist between them inside a rectangle
+# A background grid with cells small enough to hold at most one point makes every distance check constant time,
+# and only cells that actually have a point are stored so the cost follows the number of points, not the area
+class PoissonDisk:
+    # Number of random points in a row that can be rejected before we stop throwing darts at the whole area
+    maxDartFailures = 30
+    # Number of candidates tried around an existing point before it's considered surrounded (Bridson's k)
+    maxFillAttempts = 30
+    # The last sweep tries a lattice of this many points across each side of a cell
+    sweepSubdivisions = 8
+
+    def __init__( self, left, bottom, right, top, minDist ):
+        self.left = left
+        self.bottom = bottom
+        self.right = right
+        self.top = top
+        self.minDist = minDist
+        self.minDistSq = minDist * minDist
+
+        # With this cell size a cell's diagonal is minDist, so it can never contain two points
+        self.cellSize = minDist / math.sqrt( 2 )
+        self.grid = {}
+        self.points = []
+
+    def getCell( self, x, y ):
+        return ( int( ( x - self.left ) / self.cellSize ), int( ( y - self.bottom ) / self.cellSize ) )
+
+    def isInside( self, x, y ):
+        return self.left <= x <= self.right and self.bottom <= y <= self.top
+
+    def isFree( self, x, y ):
+        cellX, cellY = self.getCell( x, y )
+
+        # Anything within minDist is at most 2 cells away
+        for i in range( cellX - 2, cellX + 3 ):
+            for j in range( cellY - 2, cellY + 3 ):
+                other = self.grid.get( ( i, j ) )
+                if other is not None:
+                    dx = other[0] - x
+                    dy = other[1] - y
+                    if dx * dx + dy * dy < self.minDistSq:
+                        return False
+        return True
+
+    def addPoint( self, x, y ):
+        self.grid[ self.getCell( x, y ) ] = ( x, y )
+        self.points.append( ( x, y ) )
+
+    # The points that could be within minDist of anywhere in a cell
+    def getNearbyPoints( self, cellX, cellY ):
+        nearby = []
+        for i in range( cellX - 2, cellX + 3 ):
+            for j in range( cellY - 2, cellY + 3 ):
+                other = self.grid.get( ( i, j ) )
+                if other is not None:
+                    nearby.append( other )
+        return nearby
+
+    # Try a fine lattice of spots in every empty cell, either in a random order or row by row from the bottom left
+    # Adding a point only ever takes spots away, so after one pass there's nowhere left on the lattice that fits another
+    def sweep( self, n, rng, shuffle=True ):
+        numCellsX = int( ( self.right - self.left ) / self.cellSize ) + 1
+        numCellsY = int( ( self.top - self.bottom ) / self.cellSize ) + 1
+        cells = [ ( i, j ) for j in range( numCellsY ) for i in range( numCellsX ) if ( i, j ) not in self.grid ]
+        if shuffle:
+            rng.shuffle( cells )
+
+        step = self.cellSize / self.sweepSubdivisions
+        offsets = [ ( ( a + 0.5 ) * step, ( b + 0.5 ) * step ) for b in range( self.sweepSubdivisions ) for a in range( self.sweepSubdivisions ) ]
+
+        for cellX, cellY in cells:
+            if len( self.points ) >= n:
+                break
+
+            nearby = self.getNearbyPoints( cellX, cellY )
+            cornerX = self.left + cellX * self.cellSize
+            cornerY = self.bottom + cellY * self.cellSize
+            if shuffle:
+                rng.shuffle( offsets )
+
+            for offsetX, offsetY in offsets:
+                x = cornerX + offsetX
+                y = cornerY + offsetY
+                if not self.isInside( x, y ):
+                    continue
+                if all( ( other[0] - x ) * ( other[0] - x ) + ( other[1] - y ) * ( other[1] - y ) >= self.minDistSq for other in nearby ):
+                    # A cell can only ever hold one point
+                    self.addPoint( x, y )
+                    break
+
+    # Returns up to n points. Fewer are only returned once there's no spot left anywhere in the area that fits another
+    def sample( self, n, rng=random ):
+        self.place( n, rng )
+
+        # Points spread out at random leave gaps between them that are too small for another, so an area that's nearly full
+        # can jam before it reaches n. Start again packing the points in row by row, which fits the most in, then pick n of them
+        # at random so the whole map is still covered
+        if len( self.points ) < n:
+            self.grid = {}
+            self.points = []
+            self.sweep( math.inf, rng, shuffle=False )
+
+            if len( self.points ) > n:
+                packed = rng.sample( self.points, n )
+                self.grid = {}
+                self.points = []
+                for x, y in packed:
+                    self.addPoint( x, y )
+
+        return self.points
+
+    def place( self, n, rng ):
+        # Throw darts at the whole area first so the points are spread evenly across the map instead of growing out of one spot
+        failures = 0
+        while len( self.points ) < n and failures < self.maxDartFailures:
+            x = rng.uniform( self.left, self.right )
+            y = rng.uniform( self.bottom, self.top )
+
+            if self.isFree( x, y ):
+                self.addPoint( x, y )
+                failures = 0
+            else:
+                failures += 1
+
+        # Once the darts keep missing the map is getting full, fill the remaining gaps with Bridson's algorithm
+        # by trying points in the ring between minDist and 2 * minDist around points that still have room
+        active = list( range( len( self.points ) ) )
+        while len( self.points ) < n and len( active ) > 0:
+            activeIndex = rng.randrange( len( active ) )
+            baseX, baseY = self.points[ active[activeIndex] ]
+
+            found = False
+            for _ in range( self.maxFillAttempts ):
+                angle = rng.uniform( 0, 2 * math.pi )
+                dist = rng.uniform( self.minDist, 2 * self.minDist )
+                x = baseX + math.cos( angle ) * dist
+                y = baseY + math.sin( angle ) * dist
+
+                if self.isInside( x, y ) and self.isFree( x, y ):
+                    self.addPoint( x, y )
+                    active.append( len( self.points ) - 1 )
+                    found = True
+                    break
+
+            # Nothing fits around this point anymore
+            if not found:
+                active[activeIndex] = active[-1]
+                active.pop()
+
+        # The fill can give up on a point that still has room around it, go over whatever space is left so nothing is missed
+        if len( self.points ) < n:
+            self.sweep( n, rng )
@@ -0,0 +1,65 @@
+import pygame
+
+# Keeps track of which parts of the window have changed so only those get drawn and sent to the display
+# When nothing has changed the main loop sleeps until the next event instead of drawing frames nobody will see
+class RedrawScheduler:
+    def __init__( self, screen ):
+        self.screen = screen
+        self.dirtyRects = []
+        self.fullRedraw = True
+        self.drawnRects = []
+
+    def setScreen( self, screen ):
+        self.screen = screen
+        self.markAllDirty()
+
+    def markAllDirty( self ):
+        self.fullRedraw = True
+
+    def markDirty( self, rect ):
+        if rect:
+            self.dirtyRects.append( pygame.Rect( rect ) )
+
+    def isDirty( self ):
+        return self.fullRedraw or len( self.dirtyRects ) > 0
+
+    # Events since the last call, if there's nothing to draw this blocks until there are some
+    # maxWait is in milliseconds, for when something other than an event can need a redraw
+    def getEvents( self, maxWait=None ):
+        if self.isDirty():
+            return pygame.event.get()
+
+        event = pygame.event.wait() if maxWait is None else pygame.event.wait( maxWait )
+        if event.type == pygame.NOEVENT:
+            return pygame.event.get()
+        return [ event ] + pygame.event.get()
+
+    # Clip drawing to the dirty parts of the screen so everything can be drawn as usual but only those pixels change
+    # Returns False if there's nothing to draw
+    def beginDraw( self ):
+        if not self.isDirty():
+            return False
+
+        screenRect = self.screen.get_rect()
+        if self.fullRedraw:
+            self.drawnRects = [ screenRect ]
+        else:
+            self.drawnRects = [ rect.clip( screenRect ) for rect in self.dirtyRects ]
+
+        self.screen.set_clip( self.drawnRects[0].unionall( self.drawnRects[1:] ) )
+        return True
+
+    def endDraw( self ):
+        self.screen.set_clip( None )
+        self.dirtyRects = []
+        self.fullRedraw = False
+
+    # Anything drawn outside of beginDraw and endDraw still needs to be sent to the display
+    def markDrawn( self, rect ):
+        if rect:
+            self.drawnRects.append( pygame.Rect( rect ) )
+
+    def updateDisplay( self ):
+        if len( self.drawnRects ) > 0:
+            pygame.display.update( self.drawnRects )
+            self.drawnRects = []
@@ -0,0 +1,147 @@
+from WoodlandCommon import *
+
+import pygame
+import numpy as np
+import functools
+
+
+"""
+FONTS
+"""
+font24 = pygame.font.SysFont("vinerhanditc", 24)
+font20 = pygame.font.SysFont("vinerhanditc", 20)
+font18 = pygame.font.SysFont("vinerhanditc", 18)
+font16 = pygame.font.SysFont("vinerhanditc", 16)
+font14 = pygame.font.SysFont("vinerhanditc", 14)
+font12 = pygame.font.SysFont("vinerhanditc", 12)
+font10 = pygame.font.SysFont("vinerhanditc", 10)
+
+basicFont16 = pygame.font.SysFont("Arial", 16)
+basicFont14 = pygame.font.SysFont("Arial", 14)
+basicFont12 = pygame.font.SysFont("Arial", 12)
+basicFont10 = pygame.font.SysFont("Arial", 10)
+
+"""
+DRAWING HELPERS
+"""
+# Rendering text is slow and almost all of it is the same from frame to frame, so the rendered surfaces are kept around
+textCacheSize = 1024
+outlineTextOffset = 1
+
+@functools.lru_cache( maxsize=textCacheSize )
+def getTextSurface( string, font, colour ):
+    return font.render( string, True, colour )
+
+# The outline and the text are put together once into a single surface
+# Each copy is laid over the ones before it the same way blitting it straight onto the screen would, so the edges still blend
+@functools.lru_cache( maxsize=textCacheSize )
+def getOutlinedTextSurface( string, font, colour, bgColour ):
+    offset = outlineTextOffset
+    layers = [ ( [ 0, 0 ], bgColour ), ( [ 2 * offset, 0 ], bgColour ), ( [ 0, 2 * offset ], bgColour ), ( [ 2 * offset, 2 * offset ], bgColour ), ( [ offset, offset ], colour ) ]
+
+    textSize = font.size( string )
+    size = ( textSize[0] + 2 * offset, textSize[1] + 2 * offset )
+    alpha = np.zeros( size )
+    premultipliedColour = np.zeros( ( size[0], size[1], 3 ) )
+
+    for layerPos, layerColour in layers:
+        layerAlpha = pygame.surfarray.array_alpha( getTextSurface( string, font, layerColour ) ) / 255.0
+        region = ( slice( layerPos[0], layerPos[0] + layerAlpha.shape[0] ), slice( layerPos[1], layerPos[1] + layerAlpha.shape[1] ) )
+
+        alpha[region] = layerAlpha + alpha[region] * ( 1 - layerAlpha )
+        premultipliedColour[region] = np.array( layerColour[:3] ) * layerAlpha[:, :, None] + premultipliedColour[region] * ( 1 - layerAlpha[:, :, None] )
+
+    surface = pygame.Surface( size, pygame.SRCALPHA )
+    pygame.surfarray.pixels3d( surface )[:] = np.round( premultipliedColour / np.maximum( alpha, 1e-6 )[:, :, None] ).clip( 0, 255 )
+    pygame.surfarray.pixels_alpha( surface )[:] = np.round( alpha * 255 )
+    return surface
+
+def drawText( screen, pos, string, font, colour ):
+    screen.blit( getTextSurface( string, font, tuple( colour ) ), pos )
+
+def outlineText( screen, pos, string, font, colour, bgColour ):
+    text = getOutlinedTextSurface( string, font, tuple( colour ), tuple( bgColour ) )
+    screen.blit( text, ( pos[0] - outlineTextOffset, pos[1] - outlineTextOffset ) )
+
+def getTextTableSize( texts, fonts, spacing ):
+    # Calculate the max width and height
+    width = 0
+    height = 0
+    for i in range( len( texts ) ):
+        text = texts[i]
+        font = fonts[i]
+
+        size = font.size( text )
+        width = max( width, size[0] )
+        height += size[1] + spacing
+
+    # Add spacing to the top and sides
+    height += spacing
+    width += 2 * spacing
+
+    return ( width, height )
+
+def drawTextTable( screen, pos, texts, fonts, colours, spacing, backgroundColour, borderColour ):
+    width, height = getTextTableSize( texts, fonts, spacing )
+        
+    # Draw the bounding box and all of the info
+    if backgroundColour:
+        pygame.draw.rect( screen, backgroundColour, [ pos[0], pos[1], width, height ] )
+    if borderColour:
+        pygame.draw.rect( screen, borderColour, [ pos[0], pos[1], width, height ], 1 )
+
+    currWidth = spacing
+    currHeight = spacing
+    for i in range( len( texts ) ):
+        text = texts[i]
+        font = fonts[i]
+        colour = colours[i]
+
+        size = font.size( text )
+        drawText( screen, [ pos[0] + currWidth, pos[1] + currHeight ], text, font, colour )
+
+        currHeight += size[1] + spacing
+
+    return ( width, height )
+
+# Draw everywhere but this rectangle
+def drawAntiRect( screen, rect, colour ):
+    screenWidth = screen.get_width()
+    screenHeight = screen.get_height()
+
+    bgRects = [ [ 0, 0, rect[0], screenHeight ],
+                [ rect[0] + rect[2], 0, screenWidth - rect[0] - rect[2], screenHeight ],
+                [ 0, 0, screenWidth, rect[1] ],
+                [ 0, rect[1] + rect[3], screenWidth, screenHeight - rect[1] - rect[3] ] ]
+
+    for rect in bgRects:
+        pygame.draw.rect( screen, colour, rect )
+
+# Convert a surface to the display's format so it blits faster
+# Converting needs a display, batch rendering doesn't have one so the surface is kept as it is there
+def convertForDisplay( surface ):
+    if pygame.display.get_surface():
+        return surface.convert_alpha()
+    return surface
+
+# Loading and scaling icons is slow and the same few are drawn every frame, so the scaled copies are kept around
+imageCacheSize = 128
+
+# Scale the image to match the size and return the scaled copy
+# We will scale the larger side of the image to the size to keep it within the confines of whatever it's being drawn in
+# The copies are shared, so don't draw onto what this returns
+@functools.lru_cache( maxsize=imageCacheSize )
+def getScaledImage( imagePath, size ):
+    image = convertForDisplay( pygame.image.load( imagePath ) )
+    imageSize = image.get_size()
+
+    newSize = [ 0, 0 ]
+    if imageSize[0] > imageSize[1]:
+        newSize[0] = size
+        newSize[1] = int( size * float( imageSize[1] ) / imageSize[0] )
+    else:
+        newSize[0] = int( size * float( imageSize[0] ) / imageSize[1] )
+        newSize[1] = size
+
+    image = pygame.transform.scale( image, newSize )
+    return image
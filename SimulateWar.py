@@ -0,0 +1,92 @@
+from WoodlandCommon import *
+from Woodland import *
+from WarEngine import *
+from WarStats import *
+from ConfigData import *
+
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import time
+import numpy as np
+
+
+# Generate one map and run its war, this runs inside the worker processes so it only takes picklable arguments
+def simulateMap( args ):
+    configData, seed, numTicks, useWarEngine = args
+
+    # The debug string is never dumped here, don't let it grow across maps
+    debug_clear()
+
+    woodland = configData.createWoodland( ( 0, 0 ) )
+    woodland.generate( configData.numClearings, seed )
+
+    stats = WarStats( numTicks )
+    stats.addMap( len( woodland.clearings ) )
+
+    if useWarEngine:
+        engine = WarEngine( woodland, seed )
+        for tick in range( numTicks ):
+            engine.update()
+            stats.addEngineTick( tick, engine )
+    else:
+        # Woodland.update rolls on the global random state
+        random.seed( seed )
+        np.random.seed( seed )
+        for tick in range( numTicks ):
+            woodland.update()
+        stats.addWoodlandCounts( woodland )
+
+    return stats
+
+def simulateBatch( configData, seeds, numTicks, numWorkers, useWarEngine=False, chunkSize=1 ):
+    tasks = [ ( configData, seed, numTicks, useWarEngine ) for seed in seeds ]
+    totals = WarStats( numTicks )
+
+    # Merge each map's stats in as soon as it's done so nothing per map has to be kept around
+    with multiprocessing.Pool( numWorkers ) as pool:
+        for stats in pool.imap_unordered( simulateMap, tasks, chunkSize ):
+            totals.merge( stats )
+            if totals.numMaps % 10 == 0 or totals.numMaps == len( tasks ):
+                print( "[" + str( totals.numMaps ) + "/" + str( len( tasks ) ) + "] maps simulated" )
+
+    return totals
+
+def main():
+    parser = argparse.ArgumentParser( description="Simulate the Woodland war over many maps and report how each faction does" )
+    parser.add_argument( "--config", help="json file of ConfigData settings to override, Ex { \"numClearings\": 20 }" )
+    parser.add_argument( "--seed-start", type=int, default=0, help="first seed to simulate" )
+    parser.add_argument( "--count", type=int, default=100, help="number of maps to simulate, one per seed" )
+    parser.add_argument( "--ticks", type=int, default=50, help="number of war updates to run on each map" )
+    parser.add_argument( "--workers", type=int, default=os.cpu_count(), help="number of worker processes" )
+    parser.add_argument( "--fast", action="store_true", help="use the vectorised WarEngine instead of Woodland.update" )
+    parser.add_argument( "--output", help="json file to write the merged stats to" )
+    args = parser.parse_args()
+
+    if args.ticks < 1:
+        parser.error( "--ticks must be at least 1" )
+
+    configData = ConfigData()
+    if args.config:
+        try:
+            configData.loadJson( args.config )
+        except ValueError as error:
+            parser.error( str( error ) )
+
+    seeds = range( args.seed_start, args.seed_start + args.count )
+
+    startTime = time.perf_counter()
+    totals = simulateBatch( configData, seeds, args.ticks, max( 1, args.workers ), args.fast )
+    elapsed = time.perf_counter() - startTime
+
+    totals.printSummary()
+    print( "Simulated " + str( totals.numMaps ) + " maps in " + "{:.2f}".format( elapsed ) + "s" )
+
+    if args.output:
+        with open( args.output, "w" ) as file:
+            json.dump( totals.toDict(), file, indent=4 )
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,44 @@
+import numpy as np
+from scipy.spatial import cKDTree
+
+# Nearest neighbour lookups for the things on the map that can be hovered, so finding what's under the mouse doesn't
+# have to check every one of them. Everything here stays put once the map is generated so the trees are only built once
+class SpatialIndex:
+    def __init__( self, clearings, landmarks, bridges ):
+        self.clearings = clearings
+        self.landmarks = landmarks
+        # Bridges are polygons, they're found by their centre
+        self.bridges = bridges
+
+        self.clearingTree = self.buildTree( [ clearing.pos for clearing in clearings ] )
+        self.landmarkTree = self.buildTree( [ landmark.pos for landmark in landmarks ] )
+        self.bridgeTree = self.buildTree( [ np.mean( bridge, axis=0 ) for bridge in bridges ] )
+
+    @staticmethod
+    def buildTree( points ):
+        if len( points ) == 0:
+            return None
+        return cKDTree( np.array( points, dtype=float ).reshape( -1, 2 ) )
+
+    # Index of the closest point in the tree that's less than maxDist away, or None
+    @staticmethod
+    def queryTree( tree, point, maxDist ):
+        if tree is None:
+            return None
+
+        dist, i = tree.query( point, distance_upper_bound=maxDist )
+        if dist >= maxDist:
+            return None
+        return int( i )
+
+    def nearestClearing( self, point, maxDist ):
+        i = self.queryTree( self.clearingTree, point, maxDist )
+        return None if i is None else self.clearings[i]
+
+    def nearestLandmark( self, point, maxDist ):
+        i = self.queryTree( self.landmarkTree, point, maxDist )
+        return None if i is None else self.landmarks[i]
+
+    def nearestBridge( self, point, maxDist ):
+        i = self.queryTree( self.bridgeTree, point, maxDist )
+        return None if i is None else self.bridges[i]
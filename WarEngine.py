@@ -0,0 +1,433 @@
+from WoodlandCommon import *
+from Clearing import *
+from Woodland import *
+
+import numpy as np
+from scipy.sparse import csr_matrix
+
+# Runs the same war rules as Woodland.update but keeps the clearings in flat numpy arrays
+# Control, war status, ticks since the last attack and a clearing by feature matrix are stored per clearing id,
+# so every faction action is a handful of array operations instead of a loop over the clearings.
+# The results match the Woodland rules statistically, not roll for roll, since the random numbers are drawn differently
+class WarEngine:
+    factions = list( Woodland.controlFcns.keys() )
+    controlNames = [ "None", "Denizens" ] + factions
+    controlIds = { name: i for i, name in enumerate( controlNames ) }
+    factionOffset = 2
+
+    noControl = controlIds["None"]
+    numFeatures = len( Clearing.featureNames )
+
+    # Feature columns
+    fortifications = Clearing.featureIds["Fortifications"]
+    stronghold = Clearing.featureIds["Stronghold"]
+    roost = Clearing.featureIds["Roost"]
+    workshop = Clearing.featureIds["Workshop"]
+    sawmill = Clearing.featureIds["Sawmill"]
+    recruiter = Clearing.featureIds["Recruiter"]
+    base = Clearing.featureIds["Base"]
+    allianceSupport = Clearing.featureIds["Woodland Alliance Support"]
+    lizardSupport = Clearing.featureIds["Lizard Cult Support"]
+    garden = Clearing.featureIds["Garden"]
+    inProgressGarden = Clearing.featureIds["In Progress Garden"]
+    riverfolk = Clearing.featureIds["Riverfolk"]
+    tradingPost = Clearing.featureIds["Trading Post"]
+    tunnel = Clearing.featureIds["Tunnel"]
+    market = Clearing.featureIds["Market"]
+    citadel = Clearing.featureIds["Citadel"]
+    corvids = Clearing.featureIds["Corvid Conspiracy"]
+    plot = Clearing.featureIds["Plot"]
+
+    blockingColumns = [ Clearing.featureIds[ name ] for name in Woodland.attackBlockingFeatures ]
+
+    def __init__( self, woodland, seed=None ):
+        self.rng = np.random.default_rng( seed )
+
+        # For each control id, which features it loses when it loses the clearing
+        self.buildingLosses = np.zeros( ( len( self.controlNames ), self.numFeatures ), dtype=bool )
+        for faction, buildings in Woodland.possibleBuildingLosses.items():
+            for building in buildings:
+                self.buildingLosses[ self.controlIds[faction], Clearing.featureIds[building] ] = True
+
+        self.numClearings = len( woodland.clearings )
+        self.ticks = 0
+        # Roll each faction made on the last update
+        self.lastRolls = {}
+
+        self.enabled = np.array( [ woodland.enabledFactions[faction] for faction in self.factions ], dtype=bool )
+        self.corners = np.array( [ corner.id for corner in woodland.corners if corner is not None ], dtype=np.int32 )
+
+        woodland.graph.buildCSR()
+        weights = np.ones( len( woodland.graph.indices ), dtype=np.int32 )
+        self.adjacency = csr_matrix( ( weights, woodland.graph.indices.copy(), woodland.graph.indptr.copy() ), shape=( self.numClearings, self.numClearings ) )
+        self.indptr = woodland.graph.indptr.copy()
+        self.indices = woodland.graph.indices.copy()
+
+        self.loadState( woodland )
+
+    def loadState( self, woodland ):
+        clearings = woodland.clearings
+        self.control = np.array( [ self.controlIds[ clearing.control ] for clearing in clearings ], dtype=np.int8 )
+        self.status = np.array( [ clearing.status for clearing in clearings ], dtype=np.int8 )
+        self.ticksSinceLastAttack = np.array( [ clearing.ticksSinceLastAttack for clearing in clearings ], dtype=np.int32 )
+
+        masks = woodland.getFeatureMasks()
+        self.features = ( ( masks[:, None] >> np.arange( self.numFeatures ) ) & 1 ).astype( bool )
+
+    def saveState( self, woodland ):
+        masks = ( self.features.astype( np.int64 ) << np.arange( self.numFeatures ) ).sum( axis=1 )
+        for i, clearing in enumerate( woodland.clearings ):
+            clearing.control = self.controlNames[ self.control[i] ]
+            clearing.setFeatureMask( int( masks[i] ) )
+            clearing.status = int( self.status[i] )
+            clearing.ticksSinceLastAttack = int( self.ticksSinceLastAttack[i] )
+
+    # Helpers
+    def scaleByExpectedClearings( self, num, minVal=0 ):
+        val = num * self.numClearings / Woodland.expectedClearings
+        return int( max( minVal, val ) )
+
+    def rollDie( self, sides, rolls ):
+        return int( self.rng.integers( 1, sides + 1, size=rolls ).sum() )
+
+    # Pick up to n of the candidate ids, the candidates can repeat in which case a clearing can be picked twice
+    def sample( self, candidates, n ):
+        n = int( min( n, len( candidates ) ) )
+        if n <= 0:
+            return candidates[:0]
+        return self.rng.choice( candidates, n, replace=False )
+
+    def count( self, column ):
+        return int( np.count_nonzero( self.features[:, column] ) )
+
+    # Clearings not controlled by the faction that are connected to one it does control
+    def getAdjacent( self, faction ):
+        controlled = ( self.control == faction ).astype( np.int32 )
+        return ( ( self.adjacency @ controlled ) > 0 ) & ( self.control != faction )
+
+    def increaseWarStatus( self, ids, n=1 ):
+        np.add.at( self.status, ids, n )
+        np.minimum( self.status, Clearing.maxStatus, out=self.status )
+        self.ticksSinceLastAttack[ids] = 0
+
+    # Take over the clearings, knocking down the fortifications and whatever the old controller had built
+    def conquer( self, ids, faction ):
+        self.features[ids, self.fortifications] = False
+        self.features[ids] &= ~self.buildingLosses[ self.control[ids] ]
+        self.increaseWarStatus( ids )
+        self.control[ids] = faction
+
+    # Roll fcns
+    @staticmethod
+    def marquisateRoll( self, faction ):
+        numTotal = np.count_nonzero( self.control == faction ) + self.count( self.workshop ) + self.count( self.sawmill ) + self.count( self.recruiter )
+        return 1 if numTotal > self.scaleByExpectedClearings( 2 ) else 0
+
+    @staticmethod
+    def eyrieRoll( self, faction ):
+        numRoosts = self.count( self.roost )
+        numClearings = np.count_nonzero( self.control == faction )
+        return 1 if numRoosts > self.scaleByExpectedClearings( 0 ) or numClearings > self.scaleByExpectedClearings( 2 ) else 0
+
+    @staticmethod
+    def allianceRoll( self, faction ):
+        numBases = self.count( self.base )
+        numSympathy = self.count( self.allianceSupport )
+        return 1 if numBases > self.scaleByExpectedClearings( 1 ) or numSympathy > self.scaleByExpectedClearings( 3 ) else 0
+
+    @staticmethod
+    def lizardCultRoll( self, faction ):
+        return 1 if self.count( self.garden ) > self.scaleByExpectedClearings( 1 ) else 0
+
+    @staticmethod
+    def riverfolkRoll( self, faction ):
+        return 1 if self.count( self.riverfolk ) > self.scaleByExpectedClearings( 3 ) else 0
+
+    @staticmethod
+    def duchyRoll( self, faction ):
+        numClearings = np.count_nonzero( self.control == faction )
+        if numClearings > self.scaleByExpectedClearings( 1 ) and self.count( self.market ) > self.scaleByExpectedClearings( 0 ) and self.count( self.citadel ) > self.scaleByExpectedClearings( 0 ):
+            return 1
+        return 0
+
+    @staticmethod
+    def corvidRoll( self, faction ):
+        return 1 if np.count_nonzero( self.control == faction ) > self.scaleByExpectedClearings( 3 ) else 0
+
+    # Minor boon fcns
+    @staticmethod
+    def attack( self, faction ):
+        controlled = self.control == faction
+        numControlled = np.count_nonzero( controlled )
+
+        # Like Woodland.attack, the lake and river connection never applies here
+        adjacent = self.getAdjacent( faction )
+        if faction == self.controlIds["Grand Duchy"]:
+            adjacent |= ~controlled & self.features[:, self.tunnel]
+
+        canAttack = np.flatnonzero( adjacent )
+        if numControlled == 0:
+            canAttack = np.concatenate( ( canAttack, self.corners ) )
+
+        toAttack = self.sample( canAttack, self.scaleByExpectedClearings( 1 ) )
+        if len( toAttack ) == 0:
+            return
+
+        # Attacks happen in order and stop at the first fortified clearing, which only loses its fortifications
+        fortified = self.features[toAttack, self.fortifications]
+        if fortified.any():
+            firstFortified = toAttack[ np.argmax( fortified ) ]
+            toAttack = toAttack[ :np.argmax( fortified ) ]
+        else:
+            firstFortified = None
+
+        self.increaseWarStatus( toAttack )
+
+        blocked = self.features[ toAttack ][ :, self.blockingColumns ].any( axis=1 )
+        self.features[ np.ix_( toAttack, self.blockingColumns ) ] = False
+
+        taken = toAttack[ ~blocked ]
+        self.features[taken] &= ~self.buildingLosses[ self.control[taken] ]
+        self.control[taken] = faction
+
+        if numControlled == 0:
+            if faction == self.controlIds["Marquisate"]:
+                self.features[taken, self.stronghold] = True
+            elif faction == self.controlIds["Eyrie"]:
+                self.features[taken, self.roost] = True
+
+        if firstFortified is not None:
+            self.increaseWarStatus( [ firstFortified ] )
+            self.features[firstFortified, self.fortifications] = False
+
+    @staticmethod
+    def fortify( self, faction ):
+        canFortify = np.flatnonzero( ( self.control == faction ) & ~self.features[:, self.fortifications] )
+        strongholdExists = self.count( self.stronghold ) > 0
+
+        toFortify = self.sample( canFortify, self.scaleByExpectedClearings( 1, 1 ) )
+        self.features[toFortify, self.fortifications] = True
+
+        if faction == self.controlIds["Marquisate"] and not strongholdExists:
+            self.features[toFortify, self.stronghold] = True
+
+    @staticmethod
+    def establishCells( self, faction ):
+        canAdd = np.flatnonzero( ( self.control != faction ) & ~self.features[:, self.allianceSupport] )
+        toAdd = self.sample( canAdd, self.scaleByExpectedClearings( 2, 1 ) )
+        self.features[toAdd, self.allianceSupport] = True
+
+    @staticmethod
+    def stampCells( self, faction ):
+        self.features[ self.control == faction, self.allianceSupport ] = False
+
+    @staticmethod
+    def buildIndustry( self, faction ):
+        built = self.features[:, self.sawmill] & self.features[:, self.workshop] & self.features[:, self.recruiter]
+        canBuild = np.flatnonzero( ( self.control == faction ) & ~built )
+        toBuild = self.sample( canBuild, self.scaleByExpectedClearings( 1, 1 ) )
+
+        # Build the first missing one of sawmill, workshop, recruiter
+        needSawmill = ~self.features[toBuild, self.sawmill]
+        needWorkshop = ~needSawmill & ~self.features[toBuild, self.workshop]
+        needRecruiter = ~needSawmill & ~needWorkshop & ~self.features[toBuild, self.recruiter]
+        self.features[toBuild[needSawmill], self.sawmill] = True
+        self.features[toBuild[needWorkshop], self.workshop] = True
+        self.features[toBuild[needRecruiter], self.recruiter] = True
+
+    @staticmethod
+    def buildGarden( self, faction ):
+        inProgress = self.features[:, self.inProgressGarden]
+        almostBuilt = np.flatnonzero( inProgress )
+
+        if len( almostBuilt ) > 0:
+            toBuild = self.sample( almostBuilt, self.scaleByExpectedClearings( 1, 1 ) )
+            self.features[toBuild, self.garden] = True
+            self.features[toBuild, self.inProgressGarden] = False
+        else:
+            supported = self.features[:, self.lizardSupport] | ( self.control == faction )
+            canBuild = np.flatnonzero( ~inProgress & ~self.features[:, self.garden] & supported )
+            toBuild = self.sample( canBuild, self.scaleByExpectedClearings( 1, 1 ) )
+            self.features[toBuild, self.inProgressGarden] = True
+
+    @staticmethod
+    def proselytize( self, faction ):
+        # Woodland.proselytize adds a feature that doesn't exist, so it never changes anything
+        return
+
+    @staticmethod
+    def conductCommerce( self, faction ):
+        canAdd = np.flatnonzero( ( self.control != faction ) & ~self.features[:, self.riverfolk] )
+        toAdd = self.sample( canAdd, self.scaleByExpectedClearings( 1, 1 ) )
+        self.features[toAdd, self.riverfolk] = True
+
+    @staticmethod
+    def buildTradingPost( self, faction ):
+        canAdd = np.flatnonzero( self.features[:, self.riverfolk] & ~self.features[:, self.tradingPost] )
+        toAdd = self.sample( canAdd, self.scaleByExpectedClearings( 1, 1 ) )
+        self.features[toAdd, self.tradingPost] = True
+
+    @staticmethod
+    def connectTunnel( self, faction ):
+        canAdd = np.flatnonzero( ~self.features[:, self.tunnel] )
+        toAdd = self.sample( canAdd, self.scaleByExpectedClearings( 1, 1 ) )
+        self.features[toAdd, self.tunnel] = True
+
+    @staticmethod
+    def buildDuchy( self, faction ):
+        built = self.features[:, self.market] & self.features[:, self.citadel]
+        canBuild = np.flatnonzero( ( self.control == faction ) & ~built )
+        toBuild = self.sample( canBuild, self.scaleByExpectedClearings( 1, 1 ) )
+
+        needMarket = ~self.features[toBuild, self.market]
+        self.features[toBuild[needMarket], self.market] = True
+        self.features[toBuild[~needMarket], self.citadel] = True
+
+    @staticmethod
+    def expandNetwork( self, faction ):
+        canAdd = np.flatnonzero( self.getAdjacent( faction ) & ~self.features[:, self.corvids] )
+        toAdd = self.sample( canAdd, self.scaleByExpectedClearings( 1, 1 ) )
+        self.features[toAdd, self.corvids] = True
+
+    @staticmethod
+    def enactPlot( self, faction ):
+        canAdd = np.flatnonzero( self.features[:, self.corvids] & ~self.features[:, self.plot] )
+        toAdd = self.sample( canAdd, self.scaleByExpectedClearings( 1, 1 ) )
+        self.features[toAdd, self.plot] = True
+
+    @staticmethod
+    def stampPlot( self, faction ):
+        controlled = self.control == faction
+        self.features[controlled, self.plot] = False
+        self.features[controlled, self.corvids] = False
+
+    @staticmethod
+    def evictTraders( self, faction ):
+        controlled = self.control == faction
+        hasPost = self.features[:, self.tradingPost]
+        self.features[controlled & ~hasPost, self.riverfolk] = False
+        self.features[controlled, self.tradingPost] = False
+
+    @staticmethod
+    def lossUpdate( self, faction ):
+        controlled = self.control == faction
+        controlledIds = np.flatnonzero( controlled )
+
+        if self.rng.random() < Woodland.lossControlChance and len( controlledIds ) > 0:
+            toLose = self.sample( controlledIds, self.scaleByExpectedClearings( 1, 1 ) )
+            self.control[toLose] = self.noControl
+            self.features[toLose, self.fortifications] = False
+            self.features[toLose] &= ~self.buildingLosses[faction]
+        else:
+            # Every ( clearing, building ) pair that could be lost, fortifications only count in controlled clearings
+            columns = np.concatenate( ( [ self.fortifications ], np.flatnonzero( self.buildingLosses[faction] ) ) )
+            buildings = self.features[:, columns]
+            buildings[:, 0] &= controlled
+            clearingIds, columnIndexes = np.nonzero( buildings )
+
+            if len( clearingIds ) > 0:
+                toLose = self.sample( np.arange( len( clearingIds ) ), self.scaleByExpectedClearings( 1, 1 ) )
+                self.features[ clearingIds[toLose], columns[ columnIndexes[toLose] ] ] = False
+
+    # Major boons
+    @staticmethod
+    def revolt( self, faction ):
+        canAdd = np.flatnonzero( self.features[:, self.allianceSupport] & ~self.features[:, self.base] )
+        toAdd = self.sample( canAdd, self.scaleByExpectedClearings( 1, 1 ) )
+        self.features[toAdd, self.base] = True
+        self.conquer( toAdd, faction )
+
+    @staticmethod
+    def buildRoost( self, faction ):
+        canAdd = np.flatnonzero( ( self.control == faction ) & ~self.features[:, self.roost] )
+        toAdd = self.sample( canAdd, self.scaleByExpectedClearings( 1, 1 ) )
+        self.features[toAdd, self.roost] = True
+
+    @staticmethod
+    def rapidBuildGarden( self, faction ):
+        canAdd = np.flatnonzero( ~self.features[:, self.garden] & self.features[:, self.lizardSupport] )
+        toAdd = self.sample( canAdd, self.scaleByExpectedClearings( 1, 1 ) )
+        self.features[toAdd, self.garden] = True
+        self.control[toAdd] = faction
+
+    @staticmethod
+    def tradeWar( self, faction ):
+        canAdd = np.flatnonzero( self.features[:, self.tradingPost] )
+        toAdd = self.sample( canAdd, self.scaleByExpectedClearings( 1, 1 ) )
+        self.conquer( toAdd, faction )
+
+        # Spread a trading post to the first connected clearing without one
+        for clearingId in toAdd:
+            neighbours = self.indices[ self.indptr[clearingId]:self.indptr[clearingId+1] ]
+            free = neighbours[ ~self.features[neighbours, self.tradingPost] ]
+            if len( free ) > 0:
+                self.features[free[0], self.tradingPost] = True
+
+    @staticmethod
+    def culminatePlot( self, faction ):
+        canAdd = np.flatnonzero( self.features[:, self.plot] & ( self.control != faction ) )
+        toAdd = self.sample( canAdd, self.scaleByExpectedClearings( 1, 1 ) )
+        self.conquer( toAdd, faction )
+
+    # minor, major, loss
+    controlFcns = { "Marquisate":           [marquisateRoll,    [attack, fortify, stampCells, buildIndustry, stampPlot, evictTraders],              [],                 [lossUpdate, None]],
+                    "Eyrie":                [eyrieRoll,         [attack, fortify, stampCells, stampPlot, evictTraders],                             [buildRoost],       [lossUpdate, None]],
+                    "Woodland Alliance":    [allianceRoll,      [attack, fortify, establishCells, stampPlot, evictTraders],                         [revolt],           [lossUpdate, None]],
+                    "Lizard Cult":          [lizardCultRoll,    [attack, fortify, stampCells, buildGarden, proselytize, stampPlot, evictTraders],   [rapidBuildGarden], [lossUpdate, None]],
+                    "Riverfolk":            [riverfolkRoll,     [fortify, stampCells, conductCommerce, buildTradingPost, stampPlot],                [tradeWar],         [lossUpdate, None]],
+                    "Grand Duchy":          [duchyRoll,         [attack, fortify, connectTunnel, buildDuchy, stampCells, stampPlot, evictTraders],  [],                 [lossUpdate, None]],
+                    "Corvid Conspiracy":    [corvidRoll,        [attack, fortify, stampCells, expandNetwork, enactPlot, evictTraders],              [culminatePlot],    [lossUpdate, None]],
+                    }
+
+    # Update
+    def update( self ):
+        numControl = np.bincount( self.control, minlength=len( self.controlNames ) )[ self.factionOffset: ]
+
+        # Factions with the most clearings go first, ties keep the faction order
+        order = np.argsort( -numControl, kind="stable" )
+        self.lastRolls = {}
+
+        for orderIndex in range( len( order ) ):
+            factionIndex = order[orderIndex]
+            if not self.enabled[factionIndex]:
+                continue
+
+            factionName = self.factions[factionIndex]
+            faction = factionIndex + self.factionOffset
+            rollFcn, minorBoonFcns, majorBoonFcns, lossFcns = self.controlFcns[ factionName ]
+
+            roll = self.rollDie( 6, 2 ) + rollFcn( self, faction )
+            if orderIndex == 0:
+                roll -= 1
+            if numControl[factionIndex] == 0:
+                roll += 2
+            self.lastRolls[ factionName ] = roll
+
+            toCall = []
+
+            if roll >= 10:
+                # If we don't have any major boons do two minor boons
+                if ( len( majorBoonFcns ) == 0 or self.rng.random() < 0.5 ) and len( minorBoonFcns ) > 0:
+                    toCall = [ minorBoonFcns[i] for i in self.rng.integers( 0, len( minorBoonFcns ), size=2 ) ]
+                elif len( majorBoonFcns ) > 0:
+                    toCall = [ majorBoonFcns[ self.rng.integers( 0, len( majorBoonFcns ) ) ] ]
+            elif roll >= 7 and len( minorBoonFcns ) > 0:
+                toCall = [ minorBoonFcns[ self.rng.integers( 0, len( minorBoonFcns ) ) ] ]
+            elif len( lossFcns ) > 0:
+                toCall = [ lossFcns[ self.rng.integers( 0, len( lossFcns ) ) ] ]
+
+            for call in toCall:
+                if call != None:
+                    call( self, faction )
+
+        # Same as Clearing.update for every clearing
+        self.ticksSinceLastAttack += 1
+        recovering = ( self.status > 0 ) & ( self.ticksSinceLastAttack >= Clearing.statusDecreaseTicks )
+        self.ticksSinceLastAttack[recovering] = 0
+        self.status[recovering] -= 1
+
+        self.ticks += 1
+
+    def run( self, ticks ):
+        for _ in range( ticks ):
+            self.update()
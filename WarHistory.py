@@ -0,0 +1,143 @@
+from WoodlandCommon import *
+from Clearing import *
+
+from array import array
+import json
+import numpy as np
+
+
+# A record of how the war changed the woodland on every tick, so any earlier tick can be shown again without rerunning the war
+# Each tick only stores what changed, as ( clearing, field, value ) in typed arrays that are only ever appended to.
+# Every keyframeInterval ticks the whole state is kept too, so getting to a tick only replays the changes since the keyframe before it
+class WarHistory:
+    keyframeInterval = 32
+
+    # What a change is to
+    CONTROL = 0
+    FEATURES_ADDED = 1
+    FEATURES_REMOVED = 2
+    STATUS = 3
+
+    def __init__( self, woodland ):
+        # Controls are stored as their index in here
+        self.controls = []
+        self.controlCodes = {}
+
+        self.changeClearings = array( "i" )
+        self.changeFields = array( "b" )
+        self.changeValues = array( "q" )
+        # How many changes there are up to the end of each tick, the changes for tick t are tickEnds[t-1] to tickEnds[t]
+        self.tickEnds = array( "q", [ 0 ] )
+
+        self.lastState = self.getWoodlandState( woodland )
+        self.keyframes = { 0: self.lastState }
+        self.numTicks = 0
+        # The tick the woodland is showing
+        self.currentTick = 0
+
+    def getControlCode( self, control ):
+        if control not in self.controlCodes:
+            self.controlCodes[control] = len( self.controls )
+            self.controls.append( control )
+        return self.controlCodes[control]
+
+    # The parts of the woodland the war changes, as ( control codes, feature masks, statuses ) indexed by clearing id
+    def getWoodlandState( self, woodland ):
+        control = np.array( [ self.getControlCode( clearing.control ) for clearing in woodland.clearings ], dtype=np.int16 )
+        status = np.array( [ clearing.status for clearing in woodland.clearings ], dtype=np.int8 )
+        return ( control, woodland.getFeatureMasks(), status )
+
+    # Call after every update of the war
+    def record( self, woodland ):
+        control, masks, status = self.getWoodlandState( woodland )
+        lastControl, lastMasks, lastStatus = self.lastState
+
+        self.addChanges( self.CONTROL, control != lastControl, control )
+        self.addChanges( self.FEATURES_ADDED, ( masks & ~lastMasks ) != 0, masks & ~lastMasks )
+        self.addChanges( self.FEATURES_REMOVED, ( lastMasks & ~masks ) != 0, lastMasks & ~masks )
+        self.addChanges( self.STATUS, status != lastStatus, status )
+
+        self.numTicks += 1
+        self.tickEnds.append( len( self.changeClearings ) )
+        self.lastState = ( control, masks, status )
+        if self.numTicks % self.keyframeInterval == 0:
+            self.keyframes[self.numTicks] = self.lastState
+        self.currentTick = self.numTicks
+
+    def addChanges( self, field, changed, values ):
+        ids = np.nonzero( changed )[0]
+        self.changeClearings.extend( ids.tolist() )
+        self.changeFields.extend( [ field ] * len( ids ) )
+        self.changeValues.extend( values[ids].tolist() )
+
+    # The changes made on a tick as arrays of ( clearing ids, fields, values )
+    # These are made from slices so nothing holds on to the logs' buffers, they couldn't be appended to while something did
+    def getTickChanges( self, tick ):
+        start, end = self.tickEnds[tick - 1], self.tickEnds[tick]
+        return ( np.frombuffer( self.changeClearings[start:end], dtype=np.int32 ),
+                 np.frombuffer( self.changeFields[start:end], dtype=np.int8 ),
+                 np.frombuffer( self.changeValues[start:end], dtype=np.int64 ) )
+
+    # The state at a tick, starting from the keyframe before it
+    def getState( self, tick ):
+        tick = max( 0, min( tick, self.numTicks ) )
+        keyframeTick = tick - tick % self.keyframeInterval
+        control, masks, status = [ values.copy() for values in self.keyframes[keyframeTick] ]
+
+        # A clearing only changes each field once a tick so each tick can be applied all at once
+        for replayTick in range( keyframeTick + 1, tick + 1 ):
+            ids, fields, values = self.getTickChanges( replayTick )
+            for field, target in ( ( self.CONTROL, control ), ( self.STATUS, status ) ):
+                isField = fields == field
+                target[ ids[isField] ] = values[isField]
+
+            isAdded = fields == self.FEATURES_ADDED
+            masks[ ids[isAdded] ] |= values[isAdded]
+            isRemoved = fields == self.FEATURES_REMOVED
+            masks[ ids[isRemoved] ] &= ~values[isRemoved]
+
+        return ( control, masks, status )
+
+    # Put the woodland back how it was at a tick. Going back to the latest tick has to happen before the war is updated again
+    def showTick( self, woodland, tick ):
+        tick = max( 0, min( tick, self.numTicks ) )
+        control, masks, status = self.getState( tick )
+
+        for clearing, clearingControl, mask, clearingStatus in zip( woodland.clearings, control.tolist(), masks.tolist(), status.tolist() ):
+            clearing.control = self.controls[clearingControl]
+            clearing.setFeatureMask( mask )
+            clearing.status = clearingStatus
+
+        self.currentTick = tick
+
+    def isAtLatest( self ):
+        return self.currentTick == self.numTicks
+
+    @staticmethod
+    def getFeatureNames( mask ):
+        return [ name for name in Clearing.featureNames if mask & Clearing.featureBits[name] ]
+
+    # Write the whole history as JSON Lines, the first line is the starting state of every clearing and then one line per tick of what changed
+    def export( self, path ):
+        with open( path, "w" ) as file:
+            control, masks, status = self.keyframes[0]
+            clearings = []
+            for id, ( clearingControl, mask, clearingStatus ) in enumerate( zip( control.tolist(), masks.tolist(), status.tolist() ) ):
+                clearings.append( { "id": id,
+                                    "control": self.controls[clearingControl],
+                                    "features": self.getFeatureNames( mask ),
+                                    "status": Clearing.statusDescriptions[clearingStatus] } )
+            file.write( json.dumps( { "tick": 0, "clearings": clearings }, separators=( ",", ":" ) ) + "\n" )
+
+            for tick in range( 1, self.numTicks + 1 ):
+                changes = []
+                for id, field, value in zip( *[ values.tolist() for values in self.getTickChanges( tick ) ] ):
+                    if field == self.CONTROL:
+                        changes.append( { "id": id, "control": self.controls[value] } )
+                    elif field == self.FEATURES_ADDED:
+                        changes.append( { "id": id, "featuresAdded": self.getFeatureNames( value ) } )
+                    elif field == self.FEATURES_REMOVED:
+                        changes.append( { "id": id, "featuresRemoved": self.getFeatureNames( value ) } )
+                    else:
+                        changes.append( { "id": id, "status": Clearing.statusDescriptions[value] } )
+                file.write( json.dumps( { "tick": tick, "changes": changes }, separators=( ",", ":" ) ) + "\n" )
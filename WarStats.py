@@ -0,0 +1,102 @@
+from Woodland import *
+
+import numpy as np
+
+# Running totals of the war over any number of simulated maps, these can be merged so each worker can keep its own
+# Clearing and building counts are summed per tick over all the maps, rolls are kept as a histogram
+class WarStats:
+    # Same groups as Woodland.controlCountingData
+    factions = list( Woodland.controlFcns.keys() ) + [ "None" ]
+    # 2d6, +1 from the faction bonus, +2 when a faction has nothing
+    maxRoll = 15
+
+    def __init__( self, numTicks ):
+        self.numTicks = numTicks
+        self.numMaps = 0
+        self.numClearings = 0
+        self.control = { faction: np.zeros( numTicks, dtype=np.int64 ) for faction in self.factions }
+        self.buildings = { faction: np.zeros( numTicks, dtype=np.int64 ) for faction in self.factions }
+        self.rolls = { faction: np.zeros( self.maxRoll + 1, dtype=np.int64 ) for faction in self.factions }
+
+    def addMap( self, numClearings ):
+        self.numMaps += 1
+        self.numClearings += numClearings
+
+    def addTick( self, tick, controlCounts, buildingCounts ):
+        for faction in self.factions:
+            self.control[faction][tick] += controlCounts.get( faction, 0 )
+            self.buildings[faction][tick] += buildingCounts.get( faction, 0 )
+
+    def addRoll( self, faction, roll ):
+        self.rolls[faction][ min( max( roll, 0 ), self.maxRoll ) ] += 1
+
+    # Read the debug counting data a woodland builds up while updating
+    def addWoodlandCounts( self, woodland ):
+        data = woodland.controlCountingData
+        for tick in range( min( self.numTicks, len( data["None"][0] ) ) ):
+            self.addTick( tick, { faction: data[faction][0][tick] for faction in self.factions },
+                                { faction: data[faction][1][tick] for faction in self.factions } )
+
+        # Every tick pushes a 0 for each faction before the roll, a real roll is never below 1
+        for faction in self.factions:
+            for roll in data[faction][2]:
+                if roll != 0:
+                    self.addRoll( faction, roll )
+
+    # Read the state of a WarEngine right after it updates
+    def addEngineTick( self, tick, engine ):
+        controlCounts = np.bincount( engine.control, minlength=len( engine.controlNames ) )
+        featureCounts = np.count_nonzero( engine.features, axis=0 )
+
+        buildingCounts = {}
+        for i, feature in enumerate( Clearing.featureNames ):
+            faction = Clearing.featuresDict[ feature ]
+            buildingCounts[faction] = buildingCounts.get( faction, 0 ) + int( featureCounts[i] )
+
+        self.addTick( tick, { name: int( controlCounts[i] ) for i, name in enumerate( engine.controlNames ) }, buildingCounts )
+
+        for faction, roll in engine.lastRolls.items():
+            self.addRoll( faction, roll )
+
+    def merge( self, other ):
+        self.numMaps += other.numMaps
+        self.numClearings += other.numClearings
+        for faction in self.factions:
+            self.control[faction] += other.control[faction]
+            self.buildings[faction] += other.buildings[faction]
+            self.rolls[faction] += other.rolls[faction]
+
+    def getSummary( self ):
+        summary = {}
+        maps = max( 1, self.numMaps )
+        for faction in self.factions:
+            rolls = self.rolls[faction]
+            numRolls = rolls.sum()
+            values = np.arange( len( rolls ) )
+
+            summary[faction] = { "averageControl":      float( self.control[faction].mean() / maps ) if self.numTicks > 0 else 0.0,
+                                 "finalControl":        float( self.control[faction][-1] / maps ) if self.numTicks > 0 else 0.0,
+                                 "averageBuildings":    float( self.buildings[faction].mean() / maps ) if self.numTicks > 0 else 0.0,
+                                 "averageRoll":         float( ( rolls * values ).sum() / numRolls ) if numRolls > 0 else 0.0,
+                                 "minorBoonChance":     float( rolls[7:10].sum() / numRolls ) if numRolls > 0 else 0.0,
+                                 "majorBoonChance":     float( rolls[10:].sum() / numRolls ) if numRolls > 0 else 0.0,
+                                 "controlPerTick":      ( self.control[faction] / maps ).tolist(),
+                                 "rollHistogram":       rolls.tolist(),
+                                 }
+        return summary
+
+    def toDict( self ):
+        return { "maps": self.numMaps,
+                 "ticks": self.numTicks,
+                 "averageClearings": self.numClearings / max( 1, self.numMaps ),
+                 "factions": self.getSummary(),
+                 }
+
+    def printSummary( self ):
+        summary = self.getSummary()
+        print( "Maps: " + str( self.numMaps ) + ", ticks per map: " + str( self.numTicks ) + ", average clearings: " + "{:.1f}".format( self.numClearings / max( 1, self.numMaps ) ) )
+        print( "{:<20}{:>10}{:>10}{:>12}{:>8}{:>8}{:>8}".format( "Faction", "Control", "Final", "Buildings", "Roll", "Minor", "Major" ) )
+        for faction in self.factions:
+            data = summary[faction]
+            print( "{:<20}{:>10.2f}{:>10.2f}{:>12.2f}{:>8.2f}{:>8.0%}{:>8.0%}".format( faction, data["averageControl"], data["finalControl"], data["averageBuildings"],
+                                                                                      data["averageRoll"], data["minorBoonChance"], data["majorBoonChance"] ) )
@@ -21,14 +21,18 @@ class Water:
     minCoastPoints = 2
     maxCoastPoints = 8
     
-    def __init__( self, triangles, riverPoints, woodland ):
+    # A hull that's already been generated, like from a saved woodland, is used as is
+    def __init__( self, triangles, riverPoints, woodland, rng=random, hull=None ):
         self.triangles = triangles
         self.riverPoints = riverPoints
         self.hull = []
         self.woodland = woodland
-        self.generateHull()
+        if hull is None:
+            self.generateHull( rng )
+        else:
+            self.hull = hull
     
-    def generateHull( self ):
+    def generateHull( self, rng=random ):
         dt = self.woodland.tri
         clearings = self.woodland.clearings
         numClearings = len(clearings)
@@ -180,7 +184,7 @@ class Water:
                 # Add some randomness and fix points too close to settlements
                 for aux in range( auxPointStart, auxPointStart + numAuxPoints ):
                     curAuxPoint = self.hull[aux]
-                    curAuxPoint += right * random.uniform(-self.auxPointsVariance, self.auxPointsVariance)
+                    curAuxPoint += right * rng.uniform(-self.auxPointsVariance, self.auxPointsVariance)
                     
                     isBuffer = False
                     # Push the point away from clearings its too close to
@@ -193,7 +197,7 @@ class Water:
                                 # Scale the point in between the ranges
                                 maxFarClearingDist = awayClearing.rad + self.fromClearingBuffer + self.farClearingBufferMax
                                 # The distance to add to this point
-                                bufferDist = np.random.uniform(low=minFarClearingDist, high=maxFarClearingDist)
+                                bufferDist = rng.uniform( minFarClearingDist, maxFarClearingDist )
                                 newPoint = curAuxPoint + ( bufferDist / currDist )*( curAuxPoint - awayClearing.pos )
                                 self.hull[aux] = newPoint
 
@@ -216,12 +220,12 @@ class Water:
                     
                     for i in range(startFixUp, firstBufferedPoint):
                         newPoint = self.hull[startFixUp] + startVec * (i - startFixUp)
-                        newPoint += right * random.uniform(-self.auxPointsVariance, self.auxPointsVariance)
+                        newPoint += right * rng.uniform(-self.auxPointsVariance, self.auxPointsVariance)
                         self.hull[i] = newPoint
 
                     for i in range(lastBufferedPoint+1, endFixUp):
                         newPoint = self.hull[lastBufferedPoint] + endVec * (i - lastBufferedPoint)
-                        newPoint += right * random.uniform(-self.auxPointsVariance, self.auxPointsVariance)
+                        newPoint += right * rng.uniform(-self.auxPointsVariance, self.auxPointsVariance)
                         self.hull[i] = newPoint
 
 
@@ -257,7 +261,3 @@ class Water:
     # Greater than 0 is CCW, Less is CW, equal is colinear
     def det( self, p1, p2, p3 ):
         return ( p2[0] - p1[0] ) * ( p3[1] - p1[1] ) - ( p2[1] - p1[1] ) * ( p3[0] - p1[0] )
-        
-    def draw( self, screen ):
-        pygame.draw.polygon( screen, LIGHT_BLUE, self.hull )
-
@@ -3,14 +3,19 @@ from Path import *
 from Clearing import *
 from Water import *
 from Landmark import *
+from PoissonDisk import *
+from ClearingGraph import *
+from ClearingIndex import *
+from SpatialIndex import *
+from DecorGeometry import *
 
 from enum import Enum
-import pygame
 import random
 import math
 import numpy as np
 from scipy.spatial import Delaunay
 from scipy import interpolate as intp
+from scipy import ndimage
 
 class DTType(Enum):
     FOREST = 0
@@ -27,8 +32,6 @@ class Woodland:
     expectedClearings = 12
     # Clearings won't be spawned outside of this space along the edge of the map
     clearingBufferPercentage = 0.1
-    # Size in pixels of the grid cells used in clearing placement
-    gridSize = 10
     # Size in pizels of the cells used for drawing
     drawGridCellSize = 4
     drawGridWaterCellsBuffer = 2
@@ -60,18 +63,17 @@ class Woodland:
 
     numBorderPoints = 2
 
-    # Path draw data
-    pathWidth = 4
-    pathSegmentLength = 10
-    pathSegmentSpacing = 10
-    pathPointVariance = 0 # Keep this at 0 because we don't want to have to store all of the path points to do redraws
-    
     # What value the roll must be at or above to relinquish control. 13+ is impossible
     marquisateControlVals   = [0,5,7,10,12,13,13,13,13,13,13,13,13]
     eyrieControlVals        = [0,6,9,11,13,13,13,13,13,13,13,13,13]
     eyrieRoostVals          = [0,9,11,12,13,13,13,13,13,13,13,13,13]
     duchyControlVal = 10
 
+    # Path data, paths are drawn as dashes
+    pathSegmentLength = 10
+    pathSegmentSpacing = 10
+    pathPointVariance = 0 # The dashes are only made once so any variance here stays put when the map is redrawn
+
     # Decor data
     decorMaxArea = 50000.0
     decorMinArea = 1.0
@@ -99,7 +101,6 @@ class Woodland:
 
     mountainMaxSize = 60
     mountainMinSize = 34
-    mountainSnowCapMinSize = 42
 
     marshTreeMaxSize = 30
     marshTreeMinSize = 23
@@ -116,77 +117,24 @@ class Woodland:
     
     smallHouseSize = 30
 
-    houseOutlineWidth = 1
-
     class DecorObjectType(Enum):
         TREE = 0
         MOUNTAIN = 1
         PINE = 2
         BUSH = 3
-        
-    # Drawing functions
-    @staticmethod
-    def drawTree( self, screen, pos, size, colour ):
-        trunkPoints = [ [-.2, 0], [-.15, -.05], [-.15, -.7], [.15, -.7], [.15, -.05], [.2, 0] ]
-        for i in range( len( trunkPoints ) ):
-            trunkPoints[i] = pos + size * np.array( trunkPoints[i] )
-
-        pygame.draw.polygon( screen, BROWN, trunkPoints )
-
-        leavesPoints = [ [ pos[0] - 0.25 * size, pos[1] - 0.6 * size ], [ pos[0] + 0.25 * size, pos[1] - 0.6 * size ], [ pos[0], pos[1] - 0.7 * size ] ]
-        leavesSizes = [ size * 0.25, size * 0.25, size * 0.35 ]
-
-        for i in range( len( leavesPoints ) ):
-            pygame.draw.circle( screen, colour, leavesPoints[i], leavesSizes[i] )
-    
-    @staticmethod
-    def drawMountain( self, screen, pos, size, colour ):
-        pos = np.array( pos )
-        mountainPoints = ( pos + ( 0, - size ), pos + ( - size / 2, 0 ), pos + ( size / 2, 0 ) )
-                        
-        pygame.draw.polygon( screen, colour, mountainPoints )
-        if size >= self.mountainSnowCapMinSize:
-            snowCapHeight = ( size - self.mountainSnowCapMinSize ) / size;
-            snowCapPoints = ( mountainPoints[0], mountainPoints[0] + snowCapHeight * ( mountainPoints[1] - mountainPoints[0] ), mountainPoints[0] + snowCapHeight * ( mountainPoints[2] - mountainPoints[0] ) )
-            pygame.draw.polygon( screen, WHITE, snowCapPoints )
-
-    @staticmethod
-    def drawPine( self, screen, pos, size, colour ):
-        trunkPoints = [ [-.15, 0], [-.1, -.1], [.1, -.1], [.15, 0] ]
-        for i in range( len( trunkPoints ) ):
-            trunkPoints[i] = pos + size * np.array( trunkPoints[i] )
-
-        pygame.draw.polygon( screen, DARK_BROWN, trunkPoints )
-        
-        treePoints = [ [0, -1.0], [.2, -.7], [.1, -.7], [.3, -.4], [.2, -.4], [.4, -.1], [-.4, -.1], [-.2, -.4], [-.3, -.4], [-.1, -.7], [-.2, -.7] ]
-        for i in range( len( treePoints ) ):
-            treePoints[i] = pos + size * np.array( treePoints[i] )
-
-        pygame.draw.polygon( screen, colour, treePoints )
-
-    @staticmethod
-    def drawBush( self, screen, pos, size, colour ):
-        drawPos = [ pos[0], pos[1] - size / 2 ]
-        pygame.draw.circle( screen, colour, drawPos, size / 2 )
+        HOUSE = 4
 
-    @staticmethod
-    def drawSmallHouse( self, screen, pos, size, colour ):
-        basePoints = [ [-.3, .0], [-.3, -.4], [.0, -.7], [.3, -.4], [.3, .0] ]
-        roofPoints = [ [.0, -.7], [.4, -.3], [.45, -.35], [.3, -.5], [.3, -.75], [.15, -.75], [.15, -.65], [0, -.8], [-.45, -.35], [-.4, -.3] ]
-
-        colours = [ GREY, BROWN ]
-        allPoints = [ basePoints, roofPoints ]
-
-        for pointsIndex in range( len( allPoints ) ):
-            points = allPoints[pointsIndex]
-            for i in range( len( points ) ):
-                points[i] = pos + size * np.array( points[i] )
+    # Every decor object, x is in world space but y is only kept as the draw grid row it's drawn on
+    decorDtype = np.dtype( [ ( "x", np.float64 ), ( "row", np.int32 ), ( "size", np.int32 ), ( "colour", np.uint8, 3 ), ( "type", np.int8 ) ] )
 
-            pygame.draw.polygon( screen, colours[pointsIndex], points )
-            pygame.draw.polygon( screen, BLACK, points, width=self.houseOutlineWidth )
+    decorShapeFcns = { DecorObjectType.TREE        : DecorGeometry.addTrees,
+                       DecorObjectType.MOUNTAIN    : DecorGeometry.addMountains,
+                       DecorObjectType.PINE        : DecorGeometry.addPines,
+                       DecorObjectType.BUSH        : DecorGeometry.addBushes,
+                       DecorObjectType.HOUSE       : DecorGeometry.addSmallHouses,
+                       }
 
-
-    # For each DTType, we have the draw Functions and the relative weight to draw them ( Ex 3 trees to every 1 pine )
+    # For each DTType, we have the decor object types and the relative weight to spawn them ( Ex 3 trees to every 1 pine )
     dtDrawDataForType = { DTType.FOREST     : ( [ DecorObjectType.TREE, DecorObjectType.PINE, DecorObjectType.BUSH ],
                                                 [ 6, 5, 1 ] ),
                           DTType.LAKE       : ( [],
@@ -211,7 +159,6 @@ class Woodland:
     # Bridge data
     bridgeHalfWidth = 5
     bridgeHalfSize = 15
-    bridgePoleRadius = 2
 
     # Landmark data
     minLandmarks = 2
@@ -245,17 +192,10 @@ class Woodland:
     # Roll fcns
     @staticmethod
     def marquisateRoll( self ):
-        numTotal = 0
-        
-        for clearing in self.clearings:
-            if clearing.control == "Marquisate":
-                numTotal += 1
-            if clearing.hasFeature( "Workshop" ):
-                numTotal += 1
-            if clearing.hasFeature( "Sawmill" ):
-                numTotal += 1
-            if clearing.hasFeature( "Recruiter" ):
-                numTotal += 1
+        numTotal = self.index.countControlled( "Marquisate" )
+        numTotal += self.index.countWithFeature( "Workshop" )
+        numTotal += self.index.countWithFeature( "Sawmill" )
+        numTotal += self.index.countWithFeature( "Recruiter" )
 
         # Originally 4, scaled down
         numFeaturesForBonus = self.scaleByExpectedClearings( 2 )
@@ -266,15 +206,8 @@ class Woodland:
 
     @staticmethod
     def eyrieRoll( self ):
-        numRoosts = 0
-        numClearings = 0
-        
-        for clearing in self.clearings:
-            if clearing.control == "Eyrie":
-                numClearings += 1
-                
-            if clearing.hasFeature( "Roost" ):
-                numRoosts += 1
+        numRoosts = self.index.countWithFeature( "Roost" )
+        numClearings = self.index.countControlled( "Eyrie" )
 
         # Originally 1
         numRoostsForBonus = self.scaleByExpectedClearings( 0 )
@@ -287,14 +220,8 @@ class Woodland:
 
     @staticmethod
     def allianceRoll( self ):
-        numBases = 0
-        numSympathy = 0
-        
-        for clearing in self.clearings:
-            if clearing.hasFeature( "Base" ):
-                numBases += 1
-            if clearing.hasFeature( "Woodland Alliance Support" ):
-                numSympathy += 1
+        numBases = self.index.countWithFeature( "Base" )
+        numSympathy = self.index.countWithFeature( "Woodland Alliance Support" )
 
         # Originally 0
         numBasesForBonus = self.scaleByExpectedClearings( 1 )
@@ -307,11 +234,7 @@ class Woodland:
 
     @staticmethod
     def lizardCultRoll( self ):
-        numGardens = 0
-        
-        for clearing in self.clearings:
-            if clearing.hasFeature( "Garden" ):
-                numGardens += 1
+        numGardens = self.index.countWithFeature( "Garden" )
 
         # Originally 1
         numGardensForBonus = self.scaleByExpectedClearings( 1 )
@@ -322,11 +245,7 @@ class Woodland:
 
     @staticmethod
     def riverfolkRoll( self ):
-        numPosts = 0
-        
-        for clearing in self.clearings:
-            if clearing.hasFeature( "Riverfolk" ):
-                numPosts += 1
+        numPosts = self.index.countWithFeature( "Riverfolk" )
 
         # Originally 2
         numPostsForBonus = self.scaleByExpectedClearings( 3 )
@@ -337,18 +256,9 @@ class Woodland:
 
     @staticmethod
     def duchyRoll( self ):
-        numClearings = 0
-        numMarkets = 0
-        numCitadels = 0
-        
-        for clearing in self.clearings:
-            if clearing.control == "Grand Duchy":
-                numClearings += 1
-                
-            if clearing.hasFeature( "Market" ):
-                numMarkets += 1
-            if clearing.hasFeature( "Citadel" ):
-                numCitadels += 1
+        numClearings = self.index.countControlled( "Grand Duchy" )
+        numMarkets = self.index.countWithFeature( "Market" )
+        numCitadels = self.index.countWithFeature( "Citadel" )
                 
         # Originally 1
         numClearingsForBonus = self.scaleByExpectedClearings( 1 )
@@ -363,11 +273,7 @@ class Woodland:
 
     @staticmethod
     def corvidRoll( self ):
-        numPlots = 0
-        
-        for clearing in self.clearings:
-            if clearing.control == "Corvid Conspiracy":
-                numPlots += 1
+        numPlots = self.index.countControlled( "Corvid Conspiracy" )
 
         # Originally 2
         numPlotsForBonus = self.scaleByExpectedClearings( 3 )
@@ -384,31 +290,32 @@ class Woodland:
                     "Grand Duchy": ["Tunnel", "Market", "Citadel"],
                     "Corvid Conspiracy": ["Corvid Conspiracy", "Plot"],
                     }
+    possibleBuildingLossMasks = { faction: Clearing.getFeatureMask( buildings ) for faction, buildings in possibleBuildingLosses.items() }
+
+    attackBlockingFeatures = [ "Roost", "Base", "Stronghold", "Workshop", "Sawmill", "Recruiter", "Citadel", "Market" ]
+    attackBlockingMask = Clearing.getFeatureMask( attackBlockingFeatures )
+    waterFeatureMask = Clearing.getFeatureMask( [ "Lake", "River" ] )
 
     # Minor boon fcns
     @staticmethod
     def attack( self, faction ):
-        adjacent = [False for i in range(len(self.clearings))]
-        numControlled = 0
+        adjacent = set()
+        controlled = self.index.getControlled( faction )
+        numControlled = len( controlled )
         
-        for clearing in self.clearings:
-            if clearing.control == faction:
-                numControlled += 1
-                for other in clearing.connected:
-                    if other.control != faction:
-                        adjacent[other.id] = True
-                if clearing.hasFeature( "Lake" ) or clearing.hasFeature( "River" ):
-                    for other in self.clearings:
-                        if clearing.id != clearing.id and ( other.hasFeature( "Lake" ) or other.hasFeature( "River" ) ):
-                            adjacent[other.id] = True
+        for clearing in controlled:
+            for other in clearing.connected:
+                if other.control != faction:
+                    adjacent.add( other.id )
+            if clearing.hasAnyFeature( self.waterFeatureMask ):
+                for other in self.clearings:
+                    if clearing.id != clearing.id and other.hasAnyFeature( self.waterFeatureMask ):
+                        adjacent.add( other.id )
                             
-            elif faction == "Grand Duchy" and clearing.hasFeature( "Tunnel" ):
-                adjacent[clearing.id] = True
+        if faction == "Grand Duchy":
+            adjacent |= self.index.getFeatureIds( "Tunnel" ) - self.index.getControlledIds( faction )
 
-        canAttack = []
-        for i in range( len( adjacent) ):
-            if adjacent[i]:
-                canAttack.append( self.clearings[i] )
+        canAttack = self.index.getClearings( adjacent )
 
         if numControlled == 0:
             canAttack += self.corners
@@ -427,18 +334,13 @@ class Woodland:
                 toAttack.removeFeature( "Fortifications" )
                 return
             
-            blockingFeatures = [ "Roost", "Base", "Stronghold", "Workshop", "Sawmill", "Recruiter", "Citadel", "Market" ]
-            hasBlocking = False
-            for blocking in blockingFeatures:
-                if toAttack.hasFeature( blocking ):
-                    toAttack.removeFeature( blocking )
-                    hasBlocking = True
+            hasBlocking = toAttack.hasAnyFeature( self.attackBlockingMask )
+            toAttack.removeFeatures( self.attackBlockingMask )
 
             if not hasBlocking:
                 # Clear out the previous plots and trade posts that aren't blocking features
-                if toAttack.control in self.possibleBuildingLosses:
-                    for building in self.possibleBuildingLosses[ toAttack.control ]:
-                        toAttack.removeFeature( building )
+                if toAttack.control in self.possibleBuildingLossMasks:
+                    toAttack.removeFeatures( self.possibleBuildingLossMasks[ toAttack.control ] )
                 toAttack.control = faction
                 if faction == "Marquisate" and numControlled == 0:
                     toAttack.addFeature( "Stronghold" )
@@ -448,14 +350,8 @@ class Woodland:
 
     @staticmethod
     def fortify( self, faction ):
-        controlled = []
-
-        strongholdExists = False
-        for clearing in self.clearings:
-            if clearing.control == faction and not clearing.hasFeature( "Fortifications" ):
-                controlled.append( clearing )
-            if clearing.hasFeature( "Stronghold" ):
-                strongholdExists = True
+        controlled = [ x for x in self.index.getControlled( faction ) if not x.hasFeature( "Fortifications" ) ]
+        strongholdExists = self.index.countWithFeature( "Stronghold" ) > 0
 
         if len( controlled ) == 0:
             return
@@ -490,16 +386,15 @@ class Woodland:
 
     @staticmethod
     def stampCells( self, faction ):
-        for clearing in self.clearings:
-            if clearing.control == faction:
-                clearing.removeFeature( "Woodland Alliance Support" )
+        for clearing in self.index.getControlled( faction ):
+            clearing.removeFeature( "Woodland Alliance Support" )
 
     @staticmethod
     def buildIndustry( self, faction ):
         controlled = []
 
-        for clearing in self.clearings:
-            if clearing.control == faction and not( clearing.hasFeature( "Sawmill" ) and clearing.hasFeature( "Workshop" ) and clearing.hasFeature( "Recruiter" ) ):
+        for clearing in self.index.getControlled( faction ):
+            if not( clearing.hasFeature( "Sawmill" ) and clearing.hasFeature( "Workshop" ) and clearing.hasFeature( "Recruiter" ) ):
                 controlled.append( clearing )
         
         if len( controlled ) > 0:
@@ -520,14 +415,11 @@ class Woodland:
 
     @staticmethod
     def buildGarden( self, faction ):
-        almostBuilt = []
+        almostBuilt = self.index.getWithFeature( "In Progress Garden" )
         canBuild = []
 
-        for clearing in self.clearings:
-            if clearing.hasFeature( "In Progress Garden" ):
-                almostBuilt.append( clearing )
-
-            if not clearing.hasFeature( "In Progress Garden" ) and not clearing.hasFeature( "Garden" ) and ( clearing.hasFeature( "Lizard Cult Support" ) or clearing.control == faction ):
+        for clearing in self.index.getClearings( self.index.getFeatureIds( "Lizard Cult Support" ) | self.index.getControlledIds( faction ) ):
+            if not clearing.hasFeature( "In Progress Garden" ) and not clearing.hasFeature( "Garden" ):
                 canBuild.append( clearing )
 
         if len( almostBuilt ) > 0:
@@ -583,10 +475,7 @@ class Woodland:
             
     @staticmethod
     def buildTradingPost( self, faction ):
-        canAdd = []
-        for clearing in self.clearings:
-            if clearing.hasFeature( "Riverfolk" ) and not clearing.hasFeature( "Trading Post" ):
-                canAdd.append( clearing )
+        canAdd = [ x for x in self.index.getWithFeature( "Riverfolk" ) if not x.hasFeature( "Trading Post" ) ]
 
         if len( canAdd ) > 0:
             # Originally 1
@@ -617,8 +506,8 @@ class Woodland:
     def buildDuchy( self, faction ):
         controlled = []
 
-        for clearing in self.clearings:
-            if clearing.control == faction and not( clearing.hasFeature( "Market" ) and clearing.hasFeature( "Citadel" ) ):
+        for clearing in self.index.getControlled( faction ):
+            if not( clearing.hasFeature( "Market" ) and clearing.hasFeature( "Citadel" ) ):
                 controlled.append( clearing )
         
         if len( controlled ) > 0:
@@ -635,23 +524,19 @@ class Woodland:
         
     @staticmethod
     def expandNetwork( self, faction ):
-        adjacent = [False for i in range(len(self.clearings))]
+        adjacent = set()
 
-        for clearing in self.clearings:
-            if clearing.control == faction:
-                for other in clearing.connected:
-                    if other.control != faction:
-                        adjacent[other.id] = True
+        for clearing in self.index.getControlled( faction ):
+            for other in clearing.connected:
+                if other.control != faction:
+                    adjacent.add( other.id )
 
-                if clearing.hasFeature( "Lake" ) or clearing.hasFeature( "River" ):
-                    for other in self.clearings:
-                        if clearing.id != clearing.id and ( other.hasFeature( "Lake" ) or other.hasFeature( "River" ) ):
-                            adjacent[other.id] = True
+            if clearing.hasAnyFeature( self.waterFeatureMask ):
+                for other in self.clearings:
+                    if clearing.id != clearing.id and other.hasAnyFeature( self.waterFeatureMask ):
+                        adjacent.add( other.id )
 
-        canAdd = []
-        for i in range( len( adjacent) ):
-            if adjacent[i] and not self.clearings[i].hasFeature( "Corvid Conspiracy" ):
-                canAdd.append( self.clearings[i] )
+        canAdd = self.index.getClearings( adjacent - self.index.getFeatureIds( "Corvid Conspiracy" ) )
 
         if len( canAdd ) == 0:
             return
@@ -665,10 +550,7 @@ class Woodland:
         
     @staticmethod
     def enactPlot( self, faction ):
-        controlled = []
-        for clearing in self.clearings:
-            if clearing.hasFeature( "Corvid Conspiracy" ) and not clearing.hasFeature( "Plot" ):
-                controlled.append( clearing )
+        controlled = [ x for x in self.index.getWithFeature( "Corvid Conspiracy" ) if not x.hasFeature( "Plot" ) ]
 
         if len( controlled ) > 0:
             numToAdd = self.scaleByExpectedClearings( 1, 1 )
@@ -680,30 +562,32 @@ class Woodland:
                 
     @staticmethod
     def stampPlot( self, faction ):
-        for clearing in self.clearings:
-            if clearing.control == faction:
-                clearing.removeFeature( "Plot" )
-                clearing.removeFeature( "Corvid Conspiracy" )
+        for clearing in self.index.getControlled( faction ):
+            clearing.removeFeature( "Plot" )
+            clearing.removeFeature( "Corvid Conspiracy" )
 
     @staticmethod
     def evictTraders( self, faction ):
-        for clearing in self.clearings:
-            if clearing.control == faction:
-                if clearing.hasFeature( "Trading Post" ):
-                    clearing.removeFeature( "Trading Post" )
-                else:
-                    clearing.removeFeature( "Riverfolk" )
+        for clearing in self.index.getControlled( faction ):
+            if clearing.hasFeature( "Trading Post" ):
+                clearing.removeFeature( "Trading Post" )
+            else:
+                clearing.removeFeature( "Riverfolk" )
 
     @staticmethod
     def lossUpdate( self, faction ):
-        control = []
-        buildings = []
-        for clearing in self.clearings:
-            if clearing.control == faction:
-                control.append( clearing )
+        controlIds = self.index.getControlledIds( faction )
+        control = self.index.getClearings( controlIds )
+
+        # Only clearings with something to lose can add to the buildings
+        buildingIds = controlIds & self.index.getFeatureIds( "Fortifications" )
+        for building in self.possibleBuildingLosses[ faction ]:
+            buildingIds = buildingIds | self.index.getFeatureIds( building )
 
-                if clearing.hasFeature( "Fortifications" ):
-                    buildings.append([clearing, "Fortifications"])
+        buildings = []
+        for clearing in self.index.getClearings( buildingIds ):
+            if clearing.control == faction and clearing.hasFeature( "Fortifications" ):
+                buildings.append([clearing, "Fortifications"])
 
             for building in self.possibleBuildingLosses[ faction ]:
                 if clearing.hasFeature( building ):
@@ -721,8 +605,7 @@ class Woodland:
                 toLose.control = "None"
                 toLose.removeFeature( "Fortifications" )
 
-                for building in self.possibleBuildingLosses[ faction ]:
-                    toLose.removeFeature( building )
+                toLose.removeFeatures( self.possibleBuildingLossMasks[ faction ] )
         elif len( buildings ) > 0:
             numToLose = self.scaleByExpectedClearings( 1, 1 )
             numToLose = min( numToLose, len( buildings ) )
@@ -734,10 +617,7 @@ class Woodland:
     # Major boons
     @staticmethod
     def revolt( self, faction ):
-        canAdd = []
-        for clearing in self.clearings:
-            if clearing.hasFeature( "Woodland Alliance Support" ) and not clearing.hasFeature( "Base" ):
-                canAdd.append( clearing )
+        canAdd = [ x for x in self.index.getWithFeature( "Woodland Alliance Support" ) if not x.hasFeature( "Base" ) ]
 
         if len( canAdd ) > 0:
             numToAdd = self.scaleByExpectedClearings( 1, 1 )
@@ -749,19 +629,15 @@ class Woodland:
 
                 toAdd.removeFeature( "Fortifications" )
 
-                if toAdd.control in self.possibleBuildingLosses:
-                    for building in self.possibleBuildingLosses[ toAdd.control ]:
-                        toAdd.removeFeature( building )
+                if toAdd.control in self.possibleBuildingLossMasks:
+                    toAdd.removeFeatures( self.possibleBuildingLossMasks[ toAdd.control ] )
 
                 toAdd.increaseWarStatusBy( 1 )
                 toAdd.control = "Woodland Alliance"
 
     @staticmethod
     def buildRoost( self, faction ):
-        canAdd = []
-        for clearing in self.clearings:
-            if clearing.control == faction and not clearing.hasFeature( "Roost" ):
-                canAdd.append( clearing )
+        canAdd = [ x for x in self.index.getControlled( faction ) if not x.hasFeature( "Roost" ) ]
 
         if len( canAdd ) > 0:
             numToAdd = self.scaleByExpectedClearings( 1, 1 )
@@ -775,8 +651,8 @@ class Woodland:
     def rapidBuildGarden( self, faction ):
         controlled = []
 
-        for clearing in self.clearings:
-            if not clearing.hasFeature( "Garden" ) and not clearing.hasFeature( "Garden In Progress" ) and clearing.hasFeature( "Lizard Cult Support" ):
+        for clearing in self.index.getWithFeature( "Lizard Cult Support" ):
+            if not clearing.hasFeature( "Garden" ) and not clearing.hasFeature( "Garden In Progress" ):
                 controlled.append( clearing )
         
         if len( controlled ) > 0:
@@ -790,11 +666,7 @@ class Woodland:
 
     @staticmethod
     def tradeWar( self, faction ):
-        canAdd = []
-
-        for clearing in self.clearings:
-            if clearing.hasFeature( "Trading Post" ):
-                canAdd.append( clearing )
+        canAdd = self.index.getWithFeature( "Trading Post" )
         
         if len( canAdd ) > 0:
             numToAdd = self.scaleByExpectedClearings( 1, 1 )
@@ -804,9 +676,8 @@ class Woodland:
             for toAdd in toAddClearings:
                 toAdd.removeFeature( "Fortifications" )
 
-                if toAdd.control in self.possibleBuildingLosses:
-                    for building in self.possibleBuildingLosses[ toAdd.control ]:
-                        toAdd.removeFeature( building )
+                if toAdd.control in self.possibleBuildingLossMasks:
+                    toAdd.removeFeatures( self.possibleBuildingLossMasks[ toAdd.control ] )
 
                 toAdd.increaseWarStatusBy( 1 )
                 toAdd.control = "Riverfolk"
@@ -818,11 +689,7 @@ class Woodland:
 
     @staticmethod
     def culminatePlot( self, faction ):
-        canAdd = []
-
-        for clearing in self.clearings:
-            if clearing.hasFeature( "Plot" ) and clearing.control != faction:
-                canAdd.append( clearing )
+        canAdd = [ x for x in self.index.getWithFeature( "Plot" ) if x.control != faction ]
         
         if len( canAdd ) > 0:
             numToAdd = self.scaleByExpectedClearings( 1, 1 )
@@ -832,9 +699,8 @@ class Woodland:
             for toAdd in toAddClearings:
                 toAdd.removeFeature( "Fortifications" )
 
-                if toAdd.control in self.possibleBuildingLosses:
-                    for building in self.possibleBuildingLosses[ toAdd.control ]:
-                        toAdd.removeFeature( building )
+                if toAdd.control in self.possibleBuildingLossMasks:
+                    toAdd.removeFeatures( self.possibleBuildingLossMasks[ toAdd.control ] )
 
                 toAdd.increaseWarStatusBy( 1 )
                 toAdd.control = "Corvid Conspiracy"
@@ -849,10 +715,17 @@ class Woodland:
                     "Corvid Conspiracy":    [corvidRoll,        [attack, fortify, stampCells, expandNetwork, enactPlot, evictTraders],              [culminatePlot],    [lossUpdate, None]],
                     }
 
+    # Independent random streams used during generation, in the order they are spawned from the seed
+    # New ones go on the end so the streams of the others stay the same for a seed
+    generationStages = [ "clearings", "water", "control", "decor", "landmarks", "names", "localData", "pathSegments" ]
+    # The steps generate reports to its progress function as it gets to them
+    progressStages = [ "clearings", "triangulation", "paths", "water", "control", "decor", "landmarks", "names" ]
+
     # Initialization
     def __init__( self, pos, size, minClearingDist, enableLake=True, enableRiver=True, forceLake=False, forceRiver=False, enableMarquisate=True, enableEyrie=True, enableWoodlandAlliance=True,
                   enableLizardCult=True, enableRiverfolk=True, enableDuchy=True, enableCorvids=True, enableMountains=True, enableMarshes=True, enableLandmarks=True ):
         self.pos = pos
+        self.seed = None
         self.size = [ max( size[0], self.minSize ), max( size[1], self.minSize ) ]
         self.minClearingDist = max( 10, minClearingDist )
         
@@ -870,12 +743,12 @@ class Woodland:
         
         self.tri = None
         self.dtTypes = []
-        self.decorPointsForDts = []
-        self.decorSizesForDts = []
-        self.decorColoursForDts = []
         
         self.clearings = []
-        self.paths = []
+        self.graph = ClearingGraph( [] )
+        self.index = ClearingIndex( [] )
+        self.spatialIndex = SpatialIndex( [], [], [] )
+        self.pathSegments = np.zeros( ( 0, 2, 2 ) )
         self.corners = []
         self.water = None
         self.lakeClearings = []
@@ -887,8 +760,9 @@ class Woodland:
         self.allNames = {}
         
         self.drawGridSize = [ int( self.size[0] / self.drawGridCellSize ) + 1, int( self.size[1] / self.drawGridCellSize ) + 1 ]
-        self.drawGridOpenCells = [ [ True for _ in range( self.drawGridSize[1] ) ] for _ in range( self.drawGridSize[0] ) ]
-        self.drawGridData = [ [] for _ in range( self.drawGridSize[1] ) ]
+        self.drawGridOpenCells = np.ones( self.drawGridSize, dtype=bool )
+        self.decor = np.zeros( 0, dtype=self.decorDtype )
+        self.decorGeometry = DecorGeometry()
 
         self.controlCountingData = { "Marquisate": [[], [], []],
                     "Eyrie": [[], [], []],
@@ -936,10 +810,8 @@ class Woodland:
             self.controlCountingData[control][1].append(0)
             self.controlCountingData[control][2].append(0)
             
-        for clearing in self.clearings:
-            for i in range( len( factionControl ) ):
-                if clearing.control == factionControl[i][1]:
-                    factionControl[i][0] += 1
+        for i in range( len( factionControl ) ):
+            factionControl[i][0] = self.index.countControlled( factionControl[i][1] )
 
         factionControl.sort(key=lambda x:x[0], reverse=True)
         
@@ -982,15 +854,13 @@ class Woodland:
                         call( self, factionName )
 
         # This is debug data for counting how much control each faction has        
-        for clearing in self.clearings:
-            control = clearing.control
-            if control in self.controlCountingData:
-                self.controlCountingData[ control ][0][-1] += 1
+        for control in self.controlCountingData:
+            self.controlCountingData[ control ][0][-1] += self.index.countControlled( control )
 
-            for feature in clearing.features:
-                fcontrol = Clearing.featuresDict[ feature ][0]
-                if fcontrol != None and fcontrol in self.controlCountingData:
-                    self.controlCountingData[ fcontrol ][1][-1] += 1
+        for feature in Clearing.featureNames:
+            fcontrol = Clearing.featuresDict[ feature ]
+            if fcontrol != None and fcontrol in self.controlCountingData:
+                self.controlCountingData[ fcontrol ][1][-1] += self.index.countWithFeature( feature )
 
         for clearing in self.clearings:
             clearing.update()
@@ -1013,15 +883,30 @@ class Woodland:
         val = num * len( self.clearings ) / self.expectedClearings
         return int( max( minVal, val ) )
 
+    # Array of every clearing's feature bitmask, indexed by clearing id
+    def getFeatureMasks( self ):
+        return np.array( [ clearing.featureMask for clearing in self.clearings ], dtype=np.int64 )
+
+    def countClearingsWithFeature( self, featureString ):
+        return self.index.countWithFeature( featureString )
+
+    def getClearingsWithFeature( self, featureString ):
+        return self.index.getWithFeature( featureString )
+
+    # Every path in the order they were made
+    @property
+    def paths( self ):
+        return self.graph.getPaths()
+
     def clearData( self ):
         self.tri = None
         self.dtTypes = []
-        self.decorPointsForDts = []
-        self.decorSizesForDts = []
-        self.decorColoursForDts = []
         
         self.clearings = []
-        self.paths = []
+        self.graph = ClearingGraph( [] )
+        self.index = ClearingIndex( [] )
+        self.spatialIndex = SpatialIndex( [], [], [] )
+        self.pathSegments = np.zeros( ( 0, 2, 2 ) )
         self.corners = []
         self.water = None
         self.lakeClearings = []
@@ -1031,98 +916,67 @@ class Woodland:
         self.riverHullPoints = []
         self.bridges = []
         self.allNames = {}
-        
-    def generate( self, numClearings ):
+        self.decor = np.zeros( 0, dtype=self.decorDtype )
+        self.decorGeometry = DecorGeometry()
+        
+    def createStageRngs( self, seed ):
+        # Each generation stage gets its own independent stream spawned from the map seed, so changing how much
+        # randomness one stage consumes doesn't shift the results of every stage after it
+        rngs = {}
+        children = np.random.SeedSequence( seed ).spawn( len( self.generationStages ) )
+        for stage, child in zip( self.generationStages, children ):
+            rngs[ stage ] = random.Random( int( child.generate_state( 1, np.uint64 )[0] ) )
+        return rngs
+
+    # progressFcn is called with the name of each of the progressStages as generation gets to it
+    def generate( self, numClearings, seed=None, progressFcn=None ):
+        if progressFcn is None:
+            progressFcn = lambda stage: None
+
         numClearings = max( self.minClearings, numClearings )
         
         self.clearData()
+
+        if seed is None:
+            seed = random.getrandbits( 32 )
+        self.seed = seed
+        rngs = self.createStageRngs( seed )
         
         self.generateNameData()
         
-        self.generateClearings( numClearings )
+        progressFcn( "clearings" )
+        self.generateClearings( numClearings, rngs["clearings"] )
         
+        progressFcn( "triangulation" )
         self.generateTriData()
         
+        progressFcn( "paths" )
         self.generatePaths()
         
-        self.generateWater()
+        progressFcn( "water" )
+        self.generateWater( rngs["water"] )
         
+        progressFcn( "control" )
         self.calcCorners()
-        self.generateWoodlandControl()
+        self.generateWoodlandControl( rngs["control"] )
 
+        progressFcn( "decor" )
         self.generateDrawGrid()
-        self.generateDecorData()
-        self.generateClearingDecor()
+        self.generateDecorData( rngs["decor"] )
+        self.generateClearingDecor( rngs["decor"] )
+        self.generatePathSegments( rngs["pathSegments"] )
 
-        self.generateLandmarks()
+        progressFcn( "landmarks" )
+        self.generateLandmarks( rngs["landmarks"] )
         
         # Do this near the end since we want to check what places are next to rivers, lakes, etc.
-        self.generateClearingNames()
-        self.generateClearingLocalData()
-
-    def draw( self, screen ):
-        # Draw everything here in reverse order of what we want on top
-        pygame.draw.rect( screen, LIGHT_GREEN, self.rect )
-
-        if self.water:
-            self.water.draw( screen )
-
-        self.drawBridges( screen )
-        self.drawDecor( screen )
-        self.drawPaths( screen )
-        self.drawLandmarks( screen )
-            
-        pygame.draw.rect( screen, BROWN, self.rect, width=5 )
-        
-        for clearing in self.clearings:
-            clearing.draw( screen )
-        
-        
-    def drawPaths( self, screen ):
-        for path in self.paths:
-            startPoint = path.clearing1.pos
-            endPoint = path.clearing2.pos
-
-            v = endPoint - startPoint
-            l = np.linalg.norm( endPoint - startPoint )
-            u = v / l
-            d = 0
-
-            while ( d < l ):
-                p1 = startPoint + d * u
-                p2 = startPoint + min( l, d + self.pathSegmentLength ) * u
-
-                # Variance to make the lines look nicer
-                p1 += ( random.uniform( -self.pathPointVariance, self.pathPointVariance ), random.uniform( -self.pathPointVariance, self.pathPointVariance ) )
-                p2 += ( random.uniform( -self.pathPointVariance, self.pathPointVariance ), random.uniform( -self.pathPointVariance, self.pathPointVariance ) )
-                pygame.draw.line( screen, RED, p1, p2, self.pathWidth )
-
-                d += self.pathSegmentSpacing + self.pathSegmentLength
-        
-    def drawDecor( self, screen ):
-        # Draw the decor starting from the lowest y to the highest so it's draw on top of themselves
-        for j in range( self.drawGridSize[1] ):
-            for data in self.drawGridData[j]:
-                x = data[0]
-                size = data[1]
-                colour = data[2]
-                drawFcn = data[3]
+        progressFcn( "names" )
+        self.generateClearingNames( rngs["names"] )
+        self.generateClearingLocalData( rngs["localData"] )
 
-                pos = [ x, self.pos[1] + self.drawGridCellSize * j ]
-
-                drawFcn( self, screen, pos, size, colour )
-
-    def drawBridges( self, screen ):
-        for bridge in self.bridges:
-            pygame.draw.polygon( screen, BROWN, bridge )
-
-            for point in bridge:
-                pygame.draw.circle( screen, BROWN, point, self.bridgePoleRadius )
-                pygame.draw.circle( screen, BLACK, point, self.bridgePoleRadius, 1 )
-
-    def drawLandmarks( self, screen ):
-        for landmark in self.landmarks:
-            landmark.draw( screen )
+        # Start tracking control and features now that generation has set them up
+        self.index = ClearingIndex( self.clearings )
+        self.spatialIndex = SpatialIndex( self.clearings, self.landmarks, self.bridges )
 
     def generateNameData( self ):
         for name in self.possibleNames:
@@ -1131,31 +985,21 @@ class Woodland:
 
         allNames = {}
         
-    def generatePointsInTri( self, a, b, c, n ):
-        # These vectors define the plane the points can be in, with randomly choosing a as the origin
-        ba = b - a
-        ca = c - a
-
-        points = []
-        for i in range(n):
-            u1 = random.random()
-            u2 = random.random()
+    # Random points inside a batch of triangles at once, a, b and c are arrays of the corners and counts is how many points each gets
+    # The points come back grouped by triangle along with the index of the triangle each one is in
+    def generatePointsInTris( self, a, b, c, counts, npRng ):
+        triIndexes = np.repeat( np.arange( len( counts ) ), counts )
+        u = npRng.random( ( len( triIndexes ), 2 ) )
 
-            # u1 and u2 will give us a random point inside the quadrilateral made by ba and ca, but we want inside the triangle
-            # So if any points are past this line (u1+u2 = 1) then flip them so they're inside the original triangle
-            if u1 + u2 > 1:
-                u1 = 1 - u1
-                u2 = 1 - u2
+        # u1 and u2 will give us a random point inside the quadrilateral made by ba and ca, but we want inside the triangle
+        # So if any points are past this line (u1+u2 = 1) then flip them so they're inside the original triangle
+        flip = u[:, 0] + u[:, 1] > 1
+        u[flip] = 1 - u[flip]
 
-            p = a + u1*ba + u2*ca
-
-            i, j = self.getDrawGridIndexes( p[0], p[1] )
-            
-            # if we aren't drawing on top of a bad place
-            if self.drawGridOpenCells[i][j]:
-                points.append(p)
-
-        return points
+        ba = ( b - a )[triIndexes]
+        ca = ( c - a )[triIndexes]
+        points = a[triIndexes] + u[:, 0:1] * ba + u[:, 1:2] * ca
+        return points, triIndexes
 
 
     def getDrawGridIndexes( self, x, y ):
@@ -1163,285 +1007,276 @@ class Woodland:
         j = int( min( self.drawGridSize[1] - 1, max( 0, ( y - self.pos[1] ) / self.drawGridCellSize ) ) )
         return i, j
 
-    def floodFillDrawGrid( self, i, j ):
-        toFill = [ [i, j] ]
+    def getDrawGridIndexesArray( self, points ):
+        i = np.clip( ( points[:, 0] - self.pos[0] ) / self.drawGridCellSize, 0, self.drawGridSize[0] - 1 ).astype( np.int32 )
+        j = np.clip( ( points[:, 1] - self.pos[1] ) / self.drawGridCellSize, 0, self.drawGridSize[1] - 1 ).astype( np.int32 )
+        return i, j
 
-        while len( toFill ) > 0:
-            point = toFill[-1]
-            toFill.pop()
-            
-            if point[0] < 0 or point[0] >= self.drawGridSize[0] or point[1] < 0 or point[1] >= self.drawGridSize[1]:
-                continue
-            if not self.drawGridOpenCells[point[0]][point[1]]:
-                continue
-            
-            self.drawGridOpenCells[point[0]][point[1]] = False
-            toFill.append( [ point[0] - 1, point[1] ] )
-            toFill.append( [ point[0] + 1, point[1] ] )
-            toFill.append( [ point[0], point[1] - 1 ] )
-            toFill.append( [ point[0], point[1] + 1 ] )
-            
+    # Offsets of every cell within radius cells of the centre, as a mask over the square around it
+    @staticmethod
+    def getCellDisk( radius ):
+        offsets = np.arange( -radius, radius + 1 )
+        return offsets[:, None] * offsets[:, None] + offsets[None, :] * offsets[None, :] <= radius * radius
 
     def generateDrawGrid( self ):
-        self.drawGridOpenCells = [ [ True for _ in range( self.drawGridSize[1] ) ] for _ in range( self.drawGridSize[0] ) ]
+        self.drawGridOpenCells = np.ones( self.drawGridSize, dtype=bool )
 
-        fillPoints = []
-        fillPoints.extend( self.riverSplinePoints )
+        fillPoints = list( self.riverSplinePoints )
         if self.water:
             fillPoints.extend( self.water.hull )
-            
-        # Prevent us from drawing on top of water
-        for point in fillPoints:
-            i, j = self.getDrawGridIndexes( point[0], point[1] )
-
-            minX = int( max( 0, i - self.drawGridWaterCellsBuffer ) )
-            maxX = int( min( self.drawGridSize[0], i + self.drawGridWaterCellsBuffer + 1 ) )
-            minY = int( max( 0, j - self.drawGridWaterCellsBuffer ) )
-            maxY = int( min( self.drawGridSize[1], j + self.drawGridWaterCellsBuffer + 1 ) )
-
-            bufferDistSq = self.drawGridWaterCellsBuffer * self.drawGridWaterCellsBuffer
-
-            for x in range( minX, maxX ):
-                for y in range( minY, maxY ):
-                    if distSq( np.array([i, j]), np.array([x, y]) ) <= bufferDistSq:
-                        self.drawGridOpenCells[x][y] = False
-
-        # Fill in the lake if it exists
-        for triIndex in self.water.triangles:
-            centroid = np.array([0.0, 0.0])
-            dt = self.tri.simplices[triIndex]
-            for pointIndex in dt:
-                centroid += self.tri.points[pointIndex]
-
-            centroid /= 3
-            
-            i, j = self.getDrawGridIndexes( centroid[0], centroid[1] )
-            # If this point is already filled in, it's probably on the edge and we don't want to fill it in
-            if self.drawGridOpenCells[i][j]:
-                self.floodFillDrawGrid( i, j )
 
+        # Prevent us from drawing on top of water, every cell within the buffer of a water point is closed
+        if len( fillPoints ) > 0:
+            i, j = self.getDrawGridIndexesArray( np.array( fillPoints, dtype=float ).reshape( -1, 2 ) )
+            waterCells = np.zeros( self.drawGridSize, dtype=bool )
+            waterCells[i, j] = True
+            self.drawGridOpenCells &= ~ndimage.binary_dilation( waterCells, structure=self.getCellDisk( self.drawGridWaterCellsBuffer ) )
 
-    def debugDrawDrawGrid( self, screen ):
-        for i in range( self.drawGridSize[0] ):
-            for j in range( self.drawGridSize[1] ):
-                if not self.drawGridOpenCells[i][j]:
-                    pygame.draw.rect( screen, RED, [ self.pos[0] + i * self.drawGridCellSize, self.pos[1] + j * self.drawGridCellSize, self.drawGridCellSize, self.drawGridCellSize ] )
-                            
-        
-    def generateDecorData( self ):
-        numClearings = len(self.clearings)
-        numTris = len( self.tri.simplices )
+        # Fill in the lake if it exists by closing each open area of the grid that a lake tri's centroid lands in
+        if self.water and len( self.water.triangles ) > 0:
+            centroids = self.tri.points[ self.tri.simplices[ list( self.water.triangles ) ] ].mean( axis=1 )
+            i, j = self.getDrawGridIndexesArray( centroids )
 
-        self.decorPointsForDts = [ [] for i in range( numTris ) ]
-        self.decorSizesForDts = [ [] for i in range( numTris ) ]
-        self.decorColoursForDts = [ [] for i in range( numTris ) ]
+            # If a centroid is already filled in, it's probably on the edge and we don't want to fill it in
+            # The default structure only joins cells along their sides so the fill can't leak out diagonally through the buffer
+            areas, _ = ndimage.label( self.drawGridOpenCells )
+            lakeAreas = np.unique( areas[i, j] )
+            lakeAreas = lakeAreas[ lakeAreas > 0 ]
+            self.drawGridOpenCells[ np.isin( areas, lakeAreas ) ] = False
 
-        areaToPointsFactor = ( self.decorMaxPointsPerDt - self.decorMinPointsPerDt ) / ( self.decorMaxArea - self.decorMinArea )
-        
-        for dt in range( numTris ):
-            a = self.tri.points[ self.tri.simplices[dt][0] ]
-            b = self.tri.points[ self.tri.simplices[dt][1] ]
-            c = self.tri.points[ self.tri.simplices[dt][2] ]
-            points = [a, b, c]
-            pointIndexes = [self.tri.simplices[dt][0], self.tri.simplices[dt][1], self.tri.simplices[dt][2]]
-            oppPointIndexes = [ [ pointIndexes[1], pointIndexes[2] ], [ pointIndexes[0], pointIndexes[2] ], [ pointIndexes[0], pointIndexes[1] ] ]
-            
-            area = 0.5 * ( a[0] * ( b[1] - c[1] ) + b[0] * ( c[1] - a[1] ) + c[0] * ( a[1] - b[1] ) )
-            # Scale the area to between the bounds so we don't get weird numbers of points
-            area = min( self.decorMaxArea, area )
-            area = max( self.decorMinArea, area )
-            
-            numDecorPoints = int( ( area - self.decorMinArea ) * areaToPointsFactor + self.decorMinPointsPerDt )
-
-            # If any of these points is a clearing, then we dont want to draw stuff along the paths or too close to the clearing so offset it
-            for i in range( len( points ) ):
-                pointOffset = np.array((0.0, 0.0))
-                if pointIndexes[i] < numClearings:
-                    clearing = self.clearings[ pointIndexes[i] ]
-                    oppIndex1 = oppPointIndexes[i][0]
-                    oppIndex2 = oppPointIndexes[i][1]
-                    
-                    if oppIndex1 < numClearings and clearing.isConnectedTo( oppIndex1 ):
-                        toOpp = self.tri.points[oppIndex2] - points[i]
-                        toOppLen = np.linalg.norm( toOpp )
-                        toOpp = toOpp / toOppLen
-                        pointOffset += toOpp
-
-                    if oppIndex2 < numClearings and clearing.isConnectedTo( oppIndex2 ):
-                        toOpp = self.tri.points[oppIndex1] - points[i]
-                        toOppLen = np.linalg.norm( toOpp )
-                        toOpp = toOpp / toOppLen
-                        pointOffset += toOpp
-                        
-                pointOffsetLen = np.linalg.norm( pointOffset )
-                if pointOffsetLen > 0:
-                    pointOffest = pointOffset / pointOffsetLen
 
-                points[i] = points[i] + pointOffset * self.decorFromClearingBuffer
-    
-            self.decorPointsForDts[dt] = self.generatePointsInTri( points[0], points[1], points[2], numDecorPoints )
-            
-            # If any of these tri areas is an edge point, then randomly chance it turning into a mountain region
-            isEdge = -1 in self.tri.neighbors[dt]
-            if ( self.enableMountains and isEdge and self.dtTypes[dt] != DTType.LAKE ):
-                mountainChance = random.random()
-                if mountainChance < self.mountainChance:
-                    self.dtTypes[dt] = DTType.MOUNTAIN
-
-                    # Mark any clearing connected to this tri as a mountainous clearing
-                    for vertex in self.tri.simplices[dt]:
-                        if vertex < numClearings:
-                            if not self.clearings[vertex].hasFeature( "Mountain" ):
-                                self.clearings[vertex].addFeature( "Mountain" )
-
-            # If we're a forest next to a lake or have a river clearing adjacent then have a chance to be a marsh
-            if ( self.enableMarshes and self.dtTypes[dt] == DTType.FOREST ):
-                # Are we next to a lake
-                nextToLake = False
-                for neighbor in self.tri.neighbors[dt]:
-                    if self.dtTypes[neighbor] == DTType.LAKE:
-                        nextToLake = True
-
-                # Are we on a river
-                # Use tris that have two points connected to rivers. This will make the marshes cross rivers more often and look better
-                numAdjacentRiverClearings = 0
-                for vertex in self.tri.simplices[dt]:
-                    if vertex < numClearings:
-                        if self.clearings[vertex].hasFeature( "River" ):
-                            numAdjacentRiverClearings += 1
-
-                canBeMarsh = nextToLake or numAdjacentRiverClearings > 1
-
-                # Random chance to become a marsh
-                if canBeMarsh:
-                    marshChance = random.random()
-                    if ( marshChance < self.marshChance ):
-                        self.dtTypes[dt] = DTType.MARSH
-
-                        # Mark any clearing connected to this tri as a marsh clearing
-                        for vertex in self.tri.simplices[dt]:
-                            if vertex < numClearings:
-                                if not self.clearings[vertex].hasFeature( "Marsh" ):
-                                    self.clearings[vertex].addFeature( "Marsh" )
-            
+    def generateDecorData( self, rng=random ):
+        numClearings = len(self.clearings)
+        simplices = self.tri.simplices
+        numTris = len( simplices )
+        # All the sampling below is done in batches, numpy's generator is seeded off this stage's rng so it stays reproducible
+        npRng = np.random.default_rng( rng.getrandbits( 64 ) )
 
-            numPoints = len( self.decorPointsForDts[dt] )
+        corners = [ self.tri.points[ simplices[:, k] ] for k in range( 3 ) ]
+        a, b, c = corners
 
-            if self.dtTypes[dt] == DTType.MOUNTAIN:
-                numPoints = min( numPoints, int( numPoints * self.decorMountainPercentage ) )
-            elif self.dtTypes[dt] == DTType.FOREST:
-                numPoints = min( numPoints, int( numPoints * self.decorForestPercentage ) )
-            elif self.dtTypes[dt] == DTType.LAKE:
-                numPoints = 0
-            elif self.dtTypes[dt] == DTType.MARSH:
-                numPoints = min( numPoints, int( numPoints * self.decorMarshPercentage ) )
+        area = 0.5 * ( a[:, 0] * ( b[:, 1] - c[:, 1] ) + b[:, 0] * ( c[:, 1] - a[:, 1] ) + c[:, 0] * ( a[:, 1] - b[:, 1] ) )
+        # Scale the area to between the bounds so we don't get weird numbers of points
+        area = np.clip( area, self.decorMinArea, self.decorMaxArea )
 
-            if numPoints > 0:
-                # Select the draw functions based on the weights
-                decorObjectTypes = random.choices( self.dtDrawDataForType[ self.dtTypes[dt] ][0], weights=self.dtDrawDataForType[ self.dtTypes[dt] ][1], k=numPoints )
-            
-            for pointIndex in range( numPoints ):
-                decorObjectType = decorObjectTypes[ pointIndex ]
-                point = self.decorPointsForDts[ dt ][ pointIndex ]
-
-                size = 0
-                colour = WHITE
-                colourVariance = 0
-                drawFcn = None
-                
-                if decorObjectType == Woodland.DecorObjectType.TREE:
-                    drawFcn = Woodland.drawTree
-                    # We have a difference between marsh and forest trees
-                    if self.dtTypes[dt] == DTType.MARSH:
-                        size = random.randint( self.marshTreeMinSize, self.marshTreeMaxSize )
-                        colour = MARSH_GREEN
-                        colourVariance = self.marshColourVariance
-                    else:
-                        size = random.randint( self.treeMinSize, self.treeMaxSize )
-                        colour = DARK_GREEN
-                        colourVariance = self.treeColourVariance
-                elif decorObjectType == Woodland.DecorObjectType.PINE:
-                    drawFcn = Woodland.drawPine
-                    size = random.randint( self.pineMinSize, self.pineMaxSize )
-                    colour = DARK_GREEN
-                    colourVariance = self.pineColourVariance
-                elif decorObjectType == Woodland.DecorObjectType.MOUNTAIN:
-                    drawFcn = Woodland.drawMountain
-                    size = random.randint( self.mountainMinSize, self.mountainMaxSize )
-                    colour = LIGHT_GREY
-                    colourVariance = self.mountainColourVariance
-                elif decorObjectType == Woodland.DecorObjectType.BUSH:
-                    drawFcn = Woodland.drawBush
-                    size = random.randint( self.bushMinSize, self.bushMaxSize )
-                    colour = DARK_GREEN
-                    colourVariance = self.bushColourVariance
-                
-                colour = np.array( colour )
-                # Keep the colour inside the bound of 0 to 255
-                for colourIndex in range( len( colour ) ):
-                    t = random.randint( colour[ colourIndex ] - colourVariance, colour[ colourIndex ] + colourVariance )
-                    t = min( 255, max( t, 0 ) )
-                    colour[ colourIndex ] = t
-                
-                # If theres nothing to draw don't bother adding it
-                if drawFcn:
-                    data = [ point[0], size, colour, drawFcn ]
-                    i, j = self.getDrawGridIndexes( point[0], point[1] )
+        areaToPointsFactor = ( self.decorMaxPointsPerDt - self.decorMinPointsPerDt ) / ( self.decorMaxArea - self.decorMinArea )
+        numDecorPoints = ( ( area - self.decorMinArea ) * areaToPointsFactor + self.decorMinPointsPerDt ).astype( np.int64 )
+
+        # If any of these points is a clearing, then we dont want to draw stuff along the paths or too close to the clearing so offset it
+        # Each corner moves towards the far corner of every path it's on, the sum isn't normalised so a corner on both edges moves furthest
+        edgeKeys = np.array( [ id1 * numClearings + id2 for id1, id2 in self.graph.edges ], dtype=np.int64 )
+        offsetCorners = []
+        for k in range( 3 ):
+            vertex = simplices[:, k]
+            offset = np.zeros( ( numTris, 2 ) )
+            for opp, far in ( ( simplices[:, (k+1)%3], simplices[:, (k+2)%3] ), ( simplices[:, (k+2)%3], simplices[:, (k+1)%3] ) ):
+                onPath = ( vertex < numClearings ) & ( opp < numClearings )
+                onPath[onPath] = np.isin( np.minimum( vertex, opp )[onPath] * numClearings + np.maximum( vertex, opp )[onPath], edgeKeys )
+                toFar = self.tri.points[far[onPath]] - corners[k][onPath]
+                offset[onPath] += toFar / np.linalg.norm( toFar, axis=1 )[:, None]
+
+            offsetCorners.append( corners[k] + offset * self.decorFromClearingBuffer )
+
+        points, triIndexes = self.generatePointsInTris( offsetCorners[0], offsetCorners[1], offsetCorners[2], numDecorPoints, npRng )
+
+        # Only keep the points that aren't drawn on top of a bad place
+        i, j = self.getDrawGridIndexesArray( points )
+        isOpen = self.drawGridOpenCells[i, j]
+        points = points[isOpen]
+        triIndexes = triIndexes[isOpen]
+
+        # Tris with a vertex off the edge of the map can be mountains, forest tris next to water can be marshes
+        # Only lakes are read from the neighbours and those never change here, so all the tris can be decided at once
+        dtTypes = np.array( [ dtType.value for dtType in self.dtTypes ], dtype=np.int8 )
+        vertexIsClearing = simplices < numClearings
+
+        isEdge = np.any( self.tri.neighbors == -1, axis=1 )
+        mountainRolls = npRng.random( numTris )
+        if self.enableMountains:
+            isMountain = isEdge & ( dtTypes != DTType.LAKE.value ) & ( mountainRolls < self.mountainChance )
+            dtTypes[isMountain] = DTType.MOUNTAIN.value
+
+            # Mark any clearing connected to a mountain tri as a mountainous clearing
+            for vertex in np.unique( simplices[isMountain][vertexIsClearing[isMountain]] ):
+                self.clearings[vertex].addFeature( "Mountain" )
+
+        marshRolls = npRng.random( numTris )
+        if self.enableMarshes:
+            # Neighbour -1 reads the last tri, the same as indexing the list did
+            nextToLake = np.any( dtTypes[self.tri.neighbors] == DTType.LAKE.value, axis=1 )
+
+            # Use tris that have two points connected to rivers. This will make the marshes cross rivers more often and look better
+            isRiverClearing = np.array( [ clearing.hasFeature( "River" ) for clearing in self.clearings ] + [ False ], dtype=bool )
+            numAdjacentRiverClearings = np.count_nonzero( isRiverClearing[ np.where( vertexIsClearing, simplices, numClearings ) ], axis=1 )
+
+            isMarsh = ( dtTypes == DTType.FOREST.value ) & ( nextToLake | ( numAdjacentRiverClearings > 1 ) ) & ( marshRolls < self.marshChance )
+            dtTypes[isMarsh] = DTType.MARSH.value
+
+            # Mark any clearing connected to a marsh tri as a marsh clearing
+            for vertex in np.unique( simplices[isMarsh][vertexIsClearing[isMarsh]] ):
+                self.clearings[vertex].addFeature( "Marsh" )
+
+        self.dtTypes = [ DTType( dtType ) for dtType in dtTypes ]
+
+        # Each tri type only keeps a percentage of its points, the first ones sampled in that tri are kept
+        percentages = np.zeros( len( DTType ) )
+        percentages[DTType.MOUNTAIN.value] = self.decorMountainPercentage
+        percentages[DTType.FOREST.value] = self.decorForestPercentage
+        percentages[DTType.MARSH.value] = self.decorMarshPercentage
+
+        pointsInTri = np.bincount( triIndexes, minlength=numTris )
+        pointsToKeep = np.minimum( pointsInTri, ( pointsInTri * percentages[dtTypes] ).astype( np.int64 ) )
+        rankInTri = np.arange( len( triIndexes ) ) - ( np.cumsum( pointsInTri ) - pointsInTri )[triIndexes]
+        keep = rankInTri < pointsToKeep[triIndexes]
+        points = points[keep]
+        triIndexes = triIndexes[keep]
+        pointDtTypes = dtTypes[triIndexes]
+
+        # Select the decor types based on the weights for the tri type
+        decorTypes = np.zeros( len( points ), dtype=np.int8 )
+        typeRolls = npRng.random( len( points ) )
+        for dtType, ( objectTypes, weights ) in self.dtDrawDataForType.items():
+            if len( objectTypes ) == 0:
+                continue
+            inType = pointDtTypes == dtType.value
+            cumulativeWeights = np.cumsum( weights ) / sum( weights )
+            choices = np.minimum( np.searchsorted( cumulativeWeights, typeRolls[inType], side="right" ), len( objectTypes ) - 1 )
+            decorTypes[inType] = np.array( [ objectType.value for objectType in objectTypes ], dtype=np.int8 )[choices]
+
+        # Size range, base colour and colour variance for each decor type
+        minSizes = np.zeros( len( Woodland.DecorObjectType ), dtype=np.int32 )
+        maxSizes = np.zeros( len( Woodland.DecorObjectType ), dtype=np.int32 )
+        baseColours = np.zeros( ( len( Woodland.DecorObjectType ), 3 ), dtype=np.int32 )
+        colourVariances = np.zeros( len( Woodland.DecorObjectType ), dtype=np.int32 )
+        for decorObjectType, minSize, maxSize, colour, colourVariance in (
+                ( Woodland.DecorObjectType.TREE,        self.treeMinSize,       self.treeMaxSize,       DARK_GREEN, self.treeColourVariance ),
+                ( Woodland.DecorObjectType.PINE,        self.pineMinSize,       self.pineMaxSize,       DARK_GREEN, self.pineColourVariance ),
+                ( Woodland.DecorObjectType.MOUNTAIN,    self.mountainMinSize,   self.mountainMaxSize,   LIGHT_GREY, self.mountainColourVariance ),
+                ( Woodland.DecorObjectType.BUSH,        self.bushMinSize,       self.bushMaxSize,       DARK_GREEN, self.bushColourVariance ) ):
+            minSizes[decorObjectType.value] = minSize
+            maxSizes[decorObjectType.value] = maxSize
+            baseColours[decorObjectType.value] = colour
+            colourVariances[decorObjectType.value] = colourVariance
+
+        pointMinSizes = minSizes[decorTypes]
+        pointMaxSizes = maxSizes[decorTypes]
+        pointColours = baseColours[decorTypes]
+        pointColourVariances = colourVariances[decorTypes]
+
+        # We have a difference between marsh and forest trees
+        isMarshTree = ( decorTypes == Woodland.DecorObjectType.TREE.value ) & ( pointDtTypes == DTType.MARSH.value )
+        pointMinSizes[isMarshTree] = self.marshTreeMinSize
+        pointMaxSizes[isMarshTree] = self.marshTreeMaxSize
+        pointColours[isMarshTree] = MARSH_GREEN
+        pointColourVariances[isMarshTree] = self.marshColourVariance
+
+        decor = np.zeros( len( points ), dtype=self.decorDtype )
+        decor["x"] = points[:, 0]
+        decor["row"] = self.getDrawGridIndexesArray( points )[1]
+        decor["size"] = npRng.integers( pointMinSizes, pointMaxSizes, endpoint=True )
+        # Keep the colour inside the bound of 0 to 255
+        pointColourVariances = pointColourVariances[:, None]
+        decor["colour"] = np.clip( pointColours + npRng.integers( -pointColourVariances, pointColourVariances, size=pointColours.shape, endpoint=True ), 0, 255 )
+        decor["type"] = decorTypes
+
+        self.setDecor( decor )
+
+    # Decor is kept sorted by row so it can be drawn starting from the lowest y to the highest and end up on top of itself
+    # The sort is stable so anything added later in the same row is still drawn after what was there
+    def setDecor( self, decor ):
+        self.decor = decor[ np.argsort( decor["row"], kind="stable" ) ]
+        self.decorGeometry = None
+
+    # The shapes are built from the decor the first time they're asked for, so they're only built once however many times
+    # the decor is changed during generation, and not at all if the woodland is never drawn with them
+    def getDecorGeometry( self ):
+        if self.decorGeometry is None:
+            self.decorGeometry = DecorGeometry.build( self.decor, self.pos[1], self.drawGridCellSize, self.decorShapeFcns )
+        return self.decorGeometry
+
+
+    # Start and end points of every dash along every path, stored as an array of [ start, end ] pairs
+    def generatePathSegments( self, rng=random ):
+        npRng = np.random.default_rng( rng.getrandbits( 64 ) )
+        paths = self.paths
+        if len( paths ) == 0:
+            self.pathSegments = np.zeros( ( 0, 2, 2 ) )
+            return
+
+        startPoints = np.array( [ path.clearing1.pos for path in paths ], dtype=float )
+        endPoints = np.array( [ path.clearing2.pos for path in paths ], dtype=float )
+        v = endPoints - startPoints
+        l = np.linalg.norm( v, axis=1 )
+        u = v / l[:, None]
 
-                    self.drawGridData[j].append( data )
+        # Each path gets a dash starting at every step along it until it reaches the end
+        step = self.pathSegmentLength + self.pathSegmentSpacing
+        numSegments = np.ceil( l / step ).astype( np.int64 )
+        pathIndexes = np.repeat( np.arange( len( paths ) ), numSegments )
+        d = ( np.arange( len( pathIndexes ) ) - np.repeat( np.cumsum( numSegments ) - numSegments, numSegments ) ) * step
 
+        self.pathSegments = np.zeros( ( len( pathIndexes ), 2, 2 ) )
+        self.pathSegments[:, 0] = startPoints[pathIndexes] + d[:, None] * u[pathIndexes]
+        self.pathSegments[:, 1] = startPoints[pathIndexes] + np.minimum( l[pathIndexes], d + self.pathSegmentLength )[:, None] * u[pathIndexes]
+
+        # Variance to make the lines look nicer
+        self.pathSegments += npRng.uniform( -self.pathPointVariance, self.pathPointVariance, self.pathSegments.shape )
 
     # Note that this function doesn't return an x, y coordinate in world space, it returns an i, j coordinate in draw grid space because that's what we need later.
-    def getDecorIndexesAroundClearing( self, clearing, n ):
-        allPoints = []
+    def getDecorIndexesAroundClearing( self, clearing, n, rng=random ):
         cellsFromClearing = int( clearing.rad / self.drawGridCellSize )
-        cellsFromClearingSq = cellsFromClearing * cellsFromClearing
 
         i, j = self.getDrawGridIndexes( clearing.pos[0], clearing.pos[1] )
         minX = int( max( 0, i - cellsFromClearing ) )
         maxX = int( min( self.drawGridSize[0], i + cellsFromClearing + 1 ) )
         minY = int( max( 0, j - cellsFromClearing ) )
         maxY = int( min( self.drawGridSize[1], j + cellsFromClearing + 1 ) )
-        
-        for x in range( minX, maxX ):
-            for y in range( minY, maxY ):
-                if self.drawGridOpenCells[x][y] and distSq( np.array([i, j]), np.array([x, y]) ) <= cellsFromClearingSq:
-                    allPoints.append( [x, y] )
+
+        # Cut the disk down to the part of it that's inside the grid
+        disk = self.getCellDisk( cellsFromClearing )
+        disk = disk[ minX - ( i - cellsFromClearing ):maxX - ( i - cellsFromClearing ), minY - ( j - cellsFromClearing ):maxY - ( j - cellsFromClearing ) ]
+        allPoints = ( np.argwhere( self.drawGridOpenCells[minX:maxX, minY:maxY] & disk ) + [ minX, minY ] ).tolist()
 
         n = min( len( allPoints ), n )
         
-        decorPoints = random.choices( allPoints, k=n )
+        decorPoints = rng.choices( allPoints, k=n )
         return decorPoints
     
-    def generateClearingDecor( self ):
+    def generateClearingDecor( self, rng=random ):
+        decorIndexes = []
         for clearing in self.clearings:
-            decorIndexes = self.getDecorIndexesAroundClearing( clearing, 4 )
-            
-            for decorIndex in decorIndexes:
-                x = self.pos[0] + self.drawGridCellSize * decorIndex[0]
-                data = [ x, self.smallHouseSize, WHITE, Woodland.drawSmallHouse ]
-                self.drawGridData[decorIndex[1]].append( data )
+            decorIndexes.extend( self.getDecorIndexesAroundClearing( clearing, 4, rng ) )
+
+        decorIndexes = np.array( decorIndexes, dtype=np.int32 ).reshape( -1, 2 )
+        houses = np.zeros( len( decorIndexes ), dtype=self.decorDtype )
+        houses["x"] = self.pos[0] + self.drawGridCellSize * decorIndexes[:, 0]
+        houses["row"] = decorIndexes[:, 1]
+        houses["size"] = self.smallHouseSize
+        houses["colour"] = WHITE
+        houses["type"] = Woodland.DecorObjectType.HOUSE.value
 
-    def generateLandmarks( self ):
+        self.setDecor( np.concatenate( ( self.decor, houses ) ) )
+
+    def generateLandmarks( self, rng=random ):
         self.landmarks = []
 
         if not self.enableLandmarks:
             return
         
-        numLandmarksToSpawn = random.randrange( self.minLandmarks, self.maxLandmarks + 1 )
+        numLandmarksToSpawn = rng.randrange( self.minLandmarks, self.maxLandmarks + 1 )
         numLandmarks = len( LandmarkType )
         
         numLandmarksToSpawn = min( numLandmarks, numLandmarksToSpawn )
 
         # Pick random tris to spawn the landmarks in
         triIndexes = list( range( len( self.tri.simplices ) ) )
-        random.shuffle( triIndexes )
+        rng.shuffle( triIndexes )
 
         usedTris = [ False for i in range( len( self.tri.simplices ) ) ]
 
         # Shuffle the landmarks that get spawned
         allLandmarks = list( LandmarkType )
-        random.shuffle( allLandmarks )
+        rng.shuffle( allLandmarks )
         
         landmarkIndex = 0
         numSpawnedLandmarks = 0
@@ -1496,7 +1331,7 @@ class Woodland:
             # Try the next landmark
             landmarkIndex += 1
     
-    def nameClearing( self, clearing ):
+    def nameClearing( self, clearing, rng=random ):
         potentialNames = []
         potentialNames += self.basicNames
         
@@ -1523,21 +1358,21 @@ class Woodland:
                 duplicateNames[name] = True
         
         if len( potentialNamesFiltered ) > 0:
-            name = random.choice( potentialNamesFiltered )
+            name = rng.choice( potentialNamesFiltered )
             self.allNames[name] = True
             clearing.name = name
 
-    def generateClearingLocalData( self ):
+    def generateClearingLocalData( self, rng=random ):
         for clearing in self.clearings:
-            clearing.generateLocalData()
+            clearing.generateLocalData( rng )
 
     
-    def generateClearingNames( self ):
+    def generateClearingNames( self, rng=random ):
         for clearing in self.clearings:
-            self.nameClearing( clearing )
+            self.nameClearing( clearing, rng )
 
     
-    def generateClearings( self, numClearings ):
+    def generateClearings( self, numClearings, rng=random ):
         self.clearings = []
         maxPerResidentType = int( numClearings / len( self.residentsTable ) )
 
@@ -1551,65 +1386,20 @@ class Woodland:
             for resident in self.residentsTable:
                 residentsList.append( resident )
 
-        gridWidth = self.woodlandRight - self.woodlandLeft
-        gridHeight = self.woodlandTop - self.woodlandBottom
-        
-        gridX = int( gridWidth / self.gridSize )
-        gridY = int( gridHeight / self.gridSize )
-        gridN = gridX * gridY
-
-        useablePoints = [ [ True for _ in range( gridY ) ] for _ in range( gridX ) ]
-        # The spaces around the clearing we have to check and clear from useable points
-        gridSpacesToClear = int( math.sqrt( self.minClearingDistSq ) / self.gridSize )
-        
-        numSpawnedClearings = 0
-        pointIndex = 0
-
-        possiblePoints = []
-        for x in range( gridX ):
-            for y in range( gridY ):
-                possiblePoints.append( ( x, y ) )
-        random.shuffle( possiblePoints )
-
-        while ( numSpawnedClearings < numClearings and pointIndex < gridN ):
-            pointToTry = possiblePoints[pointIndex]
-
-            if useablePoints[ pointToTry[0] ][ pointToTry[1] ]:
-                # Spawn in the middle of the cell
-                newPos = np.array( [ self.woodlandLeft + pointToTry[0] * self.gridSize + self.gridSize / 2.0,
-                           self.woodlandBottom + pointToTry[1] * self.gridSize + self.gridSize / 2.0 ] )
-
-                clearing = Clearing( newPos )
-
-                clearing.residents = residentsList[numSpawnedClearings]
-                clearing.avail_paths = self.pathsTable[ rollDie(6, 2) ]
-            
-                clearing.id = numSpawnedClearings
-                self.clearings.append(clearing)
-
-                debug_print("Generating clearing "+str(clearing.id))
-                debug_print("  Avail_paths: "+str(clearing.avail_paths))
+        sampler = PoissonDisk( self.woodlandLeft, self.woodlandBottom, self.woodlandRight, self.woodlandTop, self.minClearingDist )
+        positions = sampler.sample( numClearings, rng )
 
-                minX = max( 0, pointToTry[0] - gridSpacesToClear )
-                maxX = min( gridX, pointToTry[0] + gridSpacesToClear + 1 )
-                minY = max( 0, pointToTry[1] - gridSpacesToClear )
-                maxY = min( gridY, pointToTry[1] + gridSpacesToClear + 1 )
+        for pos in positions:
+            clearing = Clearing( np.array( pos ) )
 
-                # Clear as useable any points at a far enough distance from this one
-                for x in range( minX, maxX ):
-                    for y in range( minY, maxY ):
-                        # No point doing another distance check if we already ruled this one out
-                        if useablePoints[x][y]:
-                            otherPos = np.array( [ self.woodlandLeft + x * self.gridSize + self.gridSize / 2.0,
-                                         self.woodlandBottom + y * self.gridSize + self.gridSize / 2.0 ] )
-
-                            if distSq( otherPos, newPos ) < self.minClearingDistSq:
-                                useablePoints[x][y] = False
-
-                numSpawnedClearings += 1
+            clearing.residents = residentsList[ len( self.clearings ) ]
+            clearing.avail_paths = self.pathsTable[ rollDie( 6, 2, rng ) ]
+        
+            clearing.id = len( self.clearings )
+            self.clearings.append(clearing)
 
-            # Try the next point always
-            pointIndex += 1
+            debug_print("Generating clearing "+str(clearing.id))
+            debug_print("  Avail_paths: "+str(clearing.avail_paths))
         
     def generateBorderPoints( self, numPointsOnEdge ):
         # Get all the corners
@@ -1639,7 +1429,9 @@ class Woodland:
         self.isLakeTri = [False for i in range( len( self.tri.simplices ) )]
             
     def generatePaths( self ):
-        self.paths = []
+        self.graph = ClearingGraph( self.clearings )
+        for clearing in self.clearings:
+            clearing.graph = self.graph
         unconnected_clearings = self.clearings.copy()
         
         for i in range(len(self.clearings)):
@@ -1658,38 +1450,24 @@ class Woodland:
             other_index = 0
             while ( clearing.avail_paths > 0 and other_index < len( other_clearings ) ):
                 other = other_clearings[ other_index ]
-                if ( other.avail_paths > 0 and not clearing.isConnectedTo( other.id ) ):
-                    newPath = Path( clearing, other )
-                    self.paths.append( newPath )
-                    clearing.connected.append( other )
-                    other.connected.append( clearing )
+                if ( other.avail_paths > 0 and not self.graph.hasEdge( clearing.id, other.id ) ):
+                    self.graph.addPath( clearing, other )
                     clearing.avail_paths -= 1
                     other.avail_paths -= 1
 
                 other_index += 1
         
         # it's possible that we've created two separate graphs that aren't linked. Fix that now
-        # Find the unions of all the clearings
-        unions = [i for i in range(len(self.clearings))]
-        for clearing in self.clearings:
-            for other in clearing.connected:
-                union = min( unions[clearing.id], unions[other.id] )
-                unions[clearing.id] = union
-                unions[other.id] = union
-        # Simplify the unions
-        for i in range(len(unions)):
-            x = i
-            while ( x != unions[x] ):
-                x = unions[x]
-            unions[i] = x
+        # Find which group every clearing is in
+        labels = self.graph.getComponentLabels()
         
         # Generate the groups
         groups = {}
-        for i in range(len(unions)):
-            if unions[i] in groups:
-                groups[unions[i]].append(self.clearings[i])
+        for i in range(len(labels)):
+            if labels[i] in groups:
+                groups[labels[i]].append(self.clearings[i])
             else:
-                groups[unions[i]] = [self.clearings[i]]
+                groups[labels[i]] = [self.clearings[i]]
 
         # We're going to try every connection and find the best one.
         # This is slower than just finding a good connection and running with it, but since we have only 12 nodes it's worth it to make the graphs look good
@@ -1714,9 +1492,7 @@ class Woodland:
                 debug_print( "Failed to link the two groups" )
                 return
             # Make the link then update the groups
-            self.paths.append( Path( bestClearings[0], bestClearings[1] ) )
-            bestClearings[0].connected.append( bestClearings[1] )
-            bestClearings[1].connected.append( bestClearings[0] )
+            self.graph.addPath( bestClearings[0], bestClearings[1] )
 
             groups[newGroupIndex] += groups[group_keys[0]]
             del groups[group_keys[0]]
@@ -1748,8 +1524,8 @@ class Woodland:
                 if other_c != c:
                     cornerScores[bestCornerIndex][other_c] = - self.size[0] - self.size[1]
 
-    def generateLake( self ):
-        lakeTris = [ random.randint( 0, len( self.tri.simplices ) - 1 ) ]
+    def generateLake( self, rng=random ):
+        lakeTris = [ rng.randint( 0, len( self.tri.simplices ) - 1 ) ]
         visited = [ False for i in range( len( self.tri.simplices ) ) ]
 
         # Scale some of the factors we use in the lake generation by how many clearings we have
@@ -1783,7 +1559,7 @@ class Woodland:
         while ( len( possibleNeighbours ) > 0 ):
             # Just check if we can stop adding clearings
             if ( len( lakeClearings ) >= minLakeClearings ):
-                roll = rollDie( 6, 2 ) - len( lakeClearings )
+                roll = rollDie( 6, 2, rng ) - len( lakeClearings )
                 if ( roll < 7 ):
                     currMaxClearings = len( lakeClearings )
             
@@ -1793,7 +1569,7 @@ class Woodland:
                 # Find the indexes of every other triangle we would be connecting to 
                 existingLakeTriConnections = [ x for x in self.tri.neighbors[ neighbour ] if x in lakeTris ]
                 
-                if ( self.isGoodLakeConnection( neighbour, existingLakeTriConnections, lakeClearings, pathsToDestroy, currMaxClearings ) ):
+                if ( self.isGoodLakeConnection( neighbour, existingLakeTriConnections, lakeClearings, pathsToDestroy, currMaxClearings, rng ) ):
                     lakeTris.append( neighbour )
                     newNeighbours = [ x for x in self.tri.neighbors[ neighbour ] if x != -1 and not visited[ x ] ]
                     
@@ -1816,7 +1592,7 @@ class Woodland:
             clearing.addFeature( "Lake" )   
         
 
-    def isGoodLakeConnection( self, neighbour, existingLakeTriConnections, lakeClearings, pathsToDestroy, currMaxClearings ):
+    def isGoodLakeConnection( self, neighbour, existingLakeTriConnections, lakeClearings, pathsToDestroy, currMaxClearings, rng=random ):
         debug_print("Trying to connect " + str(neighbour) + " to lake")
 
         numClearings = len( self.clearings )
@@ -1830,7 +1606,7 @@ class Woodland:
             connectingPoints = [ x for x in self.tri.simplices[neighbour] if x in self.tri.simplices[existingLakeTriConnection] ]
             
             # If there are clearings at these points and they're connected
-            if ( connectingPoints[0] < numClearings and connectingPoints[1] < numClearings and self.clearings[connectingPoints[0]].isConnectedTo( connectingPoints[1] ) ):
+            if ( connectingPoints[0] < numClearings and connectingPoints[1] < numClearings and self.graph.hasEdge( connectingPoints[0], connectingPoints[1] ) ):
                 destroyedPathPoints.append( ( connectingPoints[0], connectingPoints[1] ) )
                 pathsToRemoveFromEachClearing[connectingPoints[0]] += 1
                 pathsToRemoveFromEachClearing[connectingPoints[1]] += 1
@@ -1854,50 +1630,39 @@ class Woodland:
 
         # If this addition doesn't add any clearings lets give it a random chance to be added
         if ( len( lakeClearingsToAdd ) == 0 ):
-            chance = random.random()
+            chance = rng.random()
             if ( chance > Water.lakeEdgeAddChance ):
                 return False
 
         maxDestroyablePaths = self.scaleByExpectedClearings( Water.maxDestroyablePaths )
         
         if ( len( pathsToDestroy ) + len( destroyedPathPoints ) <= maxDestroyablePaths and len( lakeClearingsToAdd ) + len( lakeClearings ) <= currMaxClearings ):
-            for i in range(numClearings):
-                if ( len( self.clearings[i].connected ) <= pathsToRemoveFromEachClearing[i] ):
-                    return False
+            # Don't cut any clearing off from all of its paths
+            if np.any( self.graph.degree <= np.array( pathsToRemoveFromEachClearing ) ):
+                return False
         else:
             return False
 
         if ( validAddition ):
             for pathPoints in destroyedPathPoints:
-                # Ensure clearing 1 is the lower value clearing so the removes go okay
-                clearing1 = self.clearings[min(pathPoints)]
-                clearing2 = self.clearings[max(pathPoints)]
-
-                # Do this long statement so we dont have to do an is in and a remove which is just iterating the list twice over
-                clearing1.connected = [ x for x in clearing1.connected if x is not clearing2 ]
-                clearing2.connected = [ x for x in clearing2.connected if x is not clearing1 ]
-
-                for path in self.paths:
-                    if ( ( path.clearing1 == clearing1 and path.clearing2 == clearing2 ) or ( path.clearing1 == clearing2 and path.clearing2 == clearing1 ) ):
-                        self.paths.remove( path )
-                        break
+                self.graph.removePath( pathPoints[0], pathPoints[1] )
 
             pathsToDestroy += destroyedPathPoints
             lakeClearings += lakeClearingsToAdd
 
         return validAddition
 
-    def getRandomBorderPoint( self, side ):
+    def getRandomBorderPoint( self, side, rng=random ):
         if side == "top":
-            return ( random.randint( int( self.left ), int( self.right ) ), int( self.top ) )
+            return ( rng.randint( int( self.left ), int( self.right ) ), int( self.top ) )
         elif side == "bottom":
-            return ( random.randint( int( self.left ), int( self.right ) ), int( self.bottom ) )
+            return ( rng.randint( int( self.left ), int( self.right ) ), int( self.bottom ) )
         elif side == "left":
-            return ( int( self.left ), random.randint( int( self.bottom ), int( self.top ) ) )
+            return ( int( self.left ), rng.randint( int( self.bottom ), int( self.top ) ) )
         elif side == "right":
-            return ( int( self.right ), random.randint( int( self.bottom ), int( self.top ) ) )
+            return ( int( self.right ), rng.randint( int( self.bottom ), int( self.top ) ) )
     
-    def generateRiver( self ):
+    def generateRiver( self, rng=random ):
         startPoint = (0, 0)
         endPoint = (0, 0)
         startSide = ""
@@ -1934,7 +1699,7 @@ class Woodland:
                     
             endSide = edgeNames[furthestEdgeIndex]
             startSide = oppositeEdgeNames[furthestEdgeIndex]
-            endPoint = np.array( self.getRandomBorderPoint( endSide ) )
+            endPoint = np.array( self.getRandomBorderPoint( endSide, rng ) )
 
             # Find the clearing thats on the
             bestStartDistance = self.size[0] * self.size[0]
@@ -1955,12 +1720,12 @@ class Woodland:
             riverPoints.append( startPoint )
         # If there is no lake, just pick 2 random edges 
         else:
-            startIndex = random.randint(0, 3)
+            startIndex = rng.randint(0, 3)
             startSide = edgeNames[startIndex] 
             endSide = oppositeEdgeNames[startIndex]
 
-            startPoint = np.array( self.getRandomBorderPoint( startSide ) )
-            endPoint = np.array( self.getRandomBorderPoint( endSide ) )
+            startPoint = np.array( self.getRandomBorderPoint( startSide, rng ) )
+            endPoint = np.array( self.getRandomBorderPoint( endSide, rng ) )
             riverPoints.append(startPoint)
 
         possPoints = []
@@ -2033,7 +1798,7 @@ class Woodland:
                             distToPointSq *= self.riverClearingFactor
 
                             # Give less consideration to clearings connected by a path to this one already
-                            if lastClearing and possClearings[i] in lastClearing.connected:
+                            if lastClearing and self.graph.hasEdge( lastClearing.id, possClearings[i].id ):
                                 distToPointSq *= self.riverConnectedFactor
                                 
                         if ( distToPointSq < smallestDistSq ):
@@ -2085,8 +1850,8 @@ class Woodland:
             left = np.array([ -fwd[1], fwd[0] ])
             right = np.array([ fwd[1], -fwd[0] ])
 
-            leftWidth = prevRiverLeftWidth + np.random.normal() * self.riverWidthVariance
-            rightWidth = prevRiverRightWidth + np.random.normal() * self.riverWidthVariance
+            leftWidth = prevRiverLeftWidth + rng.gauss( 0.0, 1.0 ) * self.riverWidthVariance
+            rightWidth = prevRiverRightWidth + rng.gauss( 0.0, 1.0 ) * self.riverWidthVariance
 
             leftWidth = min( max( self.riverWidthMin, leftWidth ), self.riverWidthMax )
             rightWidth = min( max( self.riverWidthMin, rightWidth ), self.riverWidthMax )
@@ -2127,7 +1892,7 @@ class Woodland:
                                            intersect + self.bridgeHalfSize * left - self.bridgeHalfWidth * fwd ] )
                     
             
-    def generateWater( self ):
+    def generateWater( self, rng=random ):
         self.water = None
         self.lakeClearings = []
         self.lakeTris = []
@@ -2136,66 +1901,66 @@ class Woodland:
         self.riverHullPoints = []
         self.bridges = []
         
-        chance = rollDie( 6, 1 )
+        chance = rollDie( 6, 1, rng )
         
         if self.forceLake or ( self.enableLake and chance > 3 ):
-            self.generateLake()
+            self.generateLake( rng )
 
         if self.forceRiver or ( self.enableRiver and chance < 5 ):
-            self.generateRiver()
+            self.generateRiver( rng )
             self.generateBridges()
 
         if len( self.lakeTris ) > 0 or len( self.riverHullPoints ) > 0:
-            self.water = Water( self.lakeTris, self.riverHullPoints, self )
+            self.water = Water( self.lakeTris, self.riverHullPoints, self, rng )
         
-    def generateWoodlandControl( self ):
-        marquisateCorner = random.randint(0, 3)
+    def generateWoodlandControl( self, rng=random ):
+        marquisateCorner = rng.randint(0, 3)
         if self.enableMarquisate:
-            self.generateMarquisateControl( self.corners[marquisateCorner] )
+            self.generateMarquisateControl( self.corners[marquisateCorner], rng )
 
         eyrieCorner = self.oppositeCorners[ marquisateCorner ]
         if self.enableEyrie:
-            self.generateEyrieControl( self.corners[eyrieCorner] )
+            self.generateEyrieControl( self.corners[eyrieCorner], rng )
 
         if self.enableWoodlandAlliance:
-            self.generateWoodlandAllianceControl()
+            self.generateWoodlandAllianceControl( rng )
 
         otherCorners = []
         for i in range(len(self.corners)):
             if ( i != marquisateCorner and i != eyrieCorner ):
                 otherCorners.append(i)
                 
-        lizardCultCorner = random.sample( otherCorners, 1 )[0]
+        lizardCultCorner = rng.sample( otherCorners, 1 )[0]
         grandDuchyCorner = self.oppositeCorners[ lizardCultCorner ]
 
         if self.enableLizardCult:
-            self.generateLizardCultControl( self.corners[ lizardCultCorner ] )
+            self.generateLizardCultControl( self.corners[ lizardCultCorner ], rng )
         if self.enableRiverfolk:
             self.generateRiverfolkControl()
         if self.enableDuchy:
-            self.generateGrandDuchyControl( self.corners[ grandDuchyCorner ] )
+            self.generateGrandDuchyControl( self.corners[ grandDuchyCorner ], rng )
         if self.enableCorvids:
-            self.generateCorvidConspiracyControl()
+            self.generateCorvidConspiracyControl( rng )
 
-    def generateMarquisateControl( self, corner ):
+    def generateMarquisateControl( self, corner, rng=random ):
         corner.control = "Marquisate"
         corner.addFeature( "Stronghold" )
         depths = self.getDepthFrom( corner )
 
         for clearing in self.clearings:
             if clearing.id != corner.id:
-                controlRoll = rollDie( 6, 2 )
+                controlRoll = rollDie( 6, 2, rng )
                 if depths[ clearing.id] < len( self.marquisateControlVals ) and controlRoll >= self.marquisateControlVals[ depths[ clearing.id ] ]:
                     clearing.control = "Marquisate"
 
-    def generateEyrieControl( self, corner ):
+    def generateEyrieControl( self, corner, rng=random ):
         corner.control = "Eyrie"
         corner.addFeature( "Roost" )
         depths = self.getDepthFrom( corner )
 
         for clearing in self.clearings:
             if clearing.id != corner.id and not clearing.hasFeature( "Stronghold" ):
-                controlRoll = rollDie( 6, 2 )
+                controlRoll = rollDie( 6, 2, rng )
                 if depths[ clearing.id] < len( self.eyrieControlVals ) and controlRoll >= self.eyrieControlVals[ depths[ clearing.id ] ]:
                     if clearing.control == "Marquisate":
                         clearing.addFeature( "Lost Marquisate Control" )
@@ -2203,9 +1968,9 @@ class Woodland:
                 if depths[ clearing.id] < len( self.eyrieRoostVals ) and controlRoll >= self.eyrieRoostVals[ depths[ clearing.id ] ]:
                     clearing.addFeature( "Roost" )
 
-    def generateWoodlandAllianceControl( self ):
+    def generateWoodlandAllianceControl( self, rng=random ):
         for clearing in self.clearings:
-            supportRoll = rollDie( 6, 2 )
+            supportRoll = rollDie( 6, 2, rng )
             sympathy = False
             if clearing.hasFeature( "Lost Marquisate Control" ) and supportRoll >= 8:
                 sympathy= True
@@ -2215,7 +1980,7 @@ class Woodland:
                 sympathy = True
 
             if sympathy:
-                controlRoll = rollDie( 6, 2 )
+                controlRoll = rollDie( 6, 2, rng )
                 # Get a base and get sympathy in all connected spots
                 if controlRoll == 12 and not clearing.hasFeature( "Stronghold" ):
                     clearing.control = "Woodland Alliance"
@@ -2231,8 +1996,8 @@ class Woodland:
                 elif not clearing.hasFeature( "Woodland Alliance Support" ):
                     clearing.addFeature( "Woodland Alliance Support" )
 
-    def generateLizardCultControl( self, corner ):
-        outcastIndex = random.randint(0, len( self.residentsTable ) - 1 )
+    def generateLizardCultControl( self, corner, rng=random ):
+        outcastIndex = rng.randint(0, len( self.residentsTable ) - 1 )
         outcastType = self.residentsTable[ outcastIndex ]
 
         outcastClearings = []
@@ -2241,15 +2006,14 @@ class Woodland:
                 outcastClearings.append( clearing )
 
         numCultClearings = min( 2, len( outcastClearings ) )
-        cultClearings = random.sample( outcastClearings, numCultClearings )
+        cultClearings = rng.sample( outcastClearings, numCultClearings )
 
         for clearing in cultClearings:
             clearing.addFeature( "Lizard Cult Support" )
 
         # Clear out the old stuff in the clearing we're taking over
-        if corner.control in self.possibleBuildingLosses:
-            for building in self.possibleBuildingLosses[ corner.control ]:
-                corner.removeFeature( building )
+        if corner.control in self.possibleBuildingLossMasks:
+            corner.removeFeatures( self.possibleBuildingLossMasks[ corner.control ] )
                 
         corner.control = "Lizard Cult"
         corner.addFeature( "Garden" )
@@ -2263,9 +2027,9 @@ class Woodland:
             score = 0
             if ( clearing.hasFeature( "River" ) or clearing.hasFeature( "Lake" ) ):
                 score += 1
-            if ( len( clearing.connected ) > 2 ):
+            if ( self.graph.degree[clearing.id] > 2 ):
                 score += 1
-            if ( len( clearing.connected ) > 3 ):
+            if ( self.graph.degree[clearing.id] > 3 ):
                 score += 1
 
             for resource in self.riverfolkValuableResources:
@@ -2286,38 +2050,36 @@ class Woodland:
             clearing = self.clearings[ clearingIndexes[i] ]
             clearing.addFeature( "Riverfolk" )
 
-    def generateGrandDuchyControl( self, corner ):
+    def generateGrandDuchyControl( self, corner, rng=random ):
         # Clear out the old stuff in the clearing we're taking over
-        if corner.control in self.possibleBuildingLosses:
-            for building in self.possibleBuildingLosses[ corner.control ]:
-                corner.removeFeature( building )
+        if corner.control in self.possibleBuildingLossMasks:
+            corner.removeFeatures( self.possibleBuildingLossMasks[ corner.control ] )
 
         corner.control = "Grand Duchy"
         corner.addFeature( "Tunnel" )
 
         for clearing in corner.connected:
             if ( not clearing.hasFeature( "Garden" ) and not clearing.hasFeature( "Stronghold" ) ):
-                roll = rollDie( 6, 2 )
+                roll = rollDie( 6, 2, rng )
                 if ( roll >= self.duchyControlVal ):
                     # Clear the old features from the clearing being taken over
-                    if clearing.control in self.possibleBuildingLosses:
-                        for building in self.possibleBuildingLosses[ clearing.control ]:
-                            clearing.removeFeature( building )
+                    if clearing.control in self.possibleBuildingLossMasks:
+                        clearing.removeFeatures( self.possibleBuildingLossMasks[ clearing.control ] )
                     clearing.control = "Grand Duchy"
 
         nonDuchyClearings = [ clearing for clearing in self.clearings if not clearing.control == "Grand Duchy" ]
 
         numTunnels = self.scaleByExpectedClearings( 1, 1 )
         numTunnels = min( numTunnels, len( nonDuchyClearings ) )
-        randomClearings = random.sample( nonDuchyClearings, numTunnels )
+        randomClearings = rng.sample( nonDuchyClearings, numTunnels )
 
         for clearing in randomClearings:
             clearing.addFeature( "Tunnel" )
 
-    def generateCorvidConspiracyControl( self ):
+    def generateCorvidConspiracyControl( self, rng=random ):
         numCorvidClearings = self.scaleByExpectedClearings( 4, 1 )
         numCorvidClearings = min( numCorvidClearings, len( self.clearings ) )
-        corvidClearings = random.sample( self.clearings, numCorvidClearings )
+        corvidClearings = rng.sample( self.clearings, numCorvidClearings )
 
         for clearing in corvidClearings:
             clearing.addFeature( "Corvid Conspiracy" )
@@ -0,0 +1,74 @@
+from WoodlandCommon import *
+from Woodland import *
+
+import json
+
+
+# Writes woodlands out as JSON Lines, one json object per woodland on its own line, for other tools to pick up
+# Each woodland is written as soon as it's given so a whole batch never has to be held in memory, and reading
+# hands them back one at a time for the same reason
+# Positions are relative to the top left of the map
+class WoodlandExport:
+    def __init__( self, path, append=False ):
+        self.path = path
+        self.file = open( path, "a" if append else "w" )
+        self.numWritten = 0
+
+    def __enter__( self ):
+        return self
+
+    def __exit__( self, excType, excValue, traceback ):
+        self.close()
+
+    def write( self, woodland ):
+        self.writeRecord( self.getRecord( woodland ) )
+
+    # For records that were made somewhere else, like in a worker process
+    def writeRecord( self, record ):
+        self.file.write( json.dumps( record, separators=( ",", ":" ) ) + "\n" )
+        # Keep what's done so far readable even if the batch doesn't finish
+        self.file.flush()
+        self.numWritten += 1
+
+    def close( self ):
+        if not self.file.closed:
+            self.file.close()
+
+    # Everything about a woodland that's useful outside of the generator, as plain json types
+    @staticmethod
+    def getRecord( woodland ):
+        def getPos( pos ):
+            return [ float( pos[0] - woodland.pos[0] ), float( pos[1] - woodland.pos[1] ) ]
+
+        clearings = []
+        for clearing in woodland.clearings:
+            clearings.append( { "id": clearing.id,
+                                "name": clearing.name,
+                                "pos": getPos( clearing.pos ),
+                                "residents": clearing.residents,
+                                "control": clearing.control,
+                                "features": clearing.features,
+                                "status": clearing.statusDescriptions[ clearing.status ],
+                                "denizens": [ { "name": denizen.name, "species": denizen.species, "occupation": denizen.occupation } for denizen in clearing.denizens ],
+                                "buildings": list( clearing.buildings ),
+                                "problems": list( clearing.problems ) } )
+
+        landmarks = []
+        for landmark in woodland.landmarks:
+            landmarks.append( { "type": landmark.landmarkType.name,
+                                "name": landmark.name,
+                                "pos": getPos( landmark.pos ) } )
+
+        return { "seed": woodland.seed,
+                 "size": list( woodland.size ),
+                 "clearings": clearings,
+                 "paths": woodland.graph.getEdgeArray().tolist(),
+                 "landmarks": landmarks }
+
+    # Yield the records in a file one at a time
+    @staticmethod
+    def read( path ):
+        with open( path ) as file:
+            for line in file:
+                if line.strip():
+                    yield json.loads( line )
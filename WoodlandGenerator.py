@@ -0,0 +1,71 @@
+from Woodland import *
+
+import threading
+
+# Generates a new woodland on a background thread so the window can keep drawing the current one while it's being made
+# The new woodland is only handed over once it's completely finished, nothing else touches it until then
+class WoodlandGenerator:
+    def __init__( self ):
+        self.lock = threading.Lock()
+        self.thread = None
+        self.stage = None
+        self.woodland = None
+        self.error = None
+
+    def isRunning( self ):
+        return self.thread is not None
+
+    # Start generating a woodland from the config, does nothing if one is already being generated
+    def start( self, configData, pos, seed=None ):
+        if self.isRunning():
+            return False
+
+        woodland = configData.createWoodland( pos )
+        self.stage = None
+        self.thread = threading.Thread( target=self.run, args=( woodland, configData.numClearings, seed ), daemon=True )
+        self.thread.start()
+        return True
+
+    def run( self, woodland, numClearings, seed ):
+        try:
+            woodland.generate( numClearings, seed, self.setStage )
+        except Exception as error:
+            with self.lock:
+                self.error = error
+            return
+
+        with self.lock:
+            self.woodland = woodland
+
+    def setStage( self, stage ):
+        with self.lock:
+            self.stage = stage
+
+    # The stage the generation is on and how far through the stages that is, from 0 to 1
+    def getProgress( self ):
+        with self.lock:
+            stage = self.stage
+
+        if stage is None:
+            return ( None, 0.0 )
+        return ( stage, Woodland.progressStages.index( stage ) / len( Woodland.progressStages ) )
+
+    # The finished woodland if there is one, after this the generator is ready to start the next one
+    # An error from the generation is raised here so it shows up on the main thread
+    def takeWoodland( self ):
+        with self.lock:
+            woodland = self.woodland
+            error = self.error
+            self.woodland = None
+            self.error = None
+
+        if woodland is None and error is None:
+            return None
+
+        self.thread.join()
+        self.thread = None
+        self.stage = None
+
+        if error is not None:
+            raise error
+        return woodland
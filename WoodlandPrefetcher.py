@@ -0,0 +1,86 @@
+from WoodlandCommon import *
+from Woodland import *
+
+import concurrent.futures
+import concurrent.futures.process
+import copy
+import multiprocessing
+import os
+import random
+
+
+# Generate one map, this runs inside the worker processes so it only takes picklable arguments
+def prefetchWoodland( configData, pos, seed ):
+    # The debug string is never dumped from the workers, don't let it grow across maps
+    debug_clear()
+
+    woodland = configData.createWoodland( pos )
+    woodland.generate( configData.numClearings, seed )
+    return woodland
+
+# Keeps a queue of maps generated ahead of time in worker processes, so asking for a new map can hand one over straight away
+# The maps are made for the config they were started with, if the config changes they're thrown out and started again
+class WoodlandPrefetcher:
+    def __init__( self, numWoodlands, pos, numWorkers=None ):
+        self.numWoodlands = max( 0, numWoodlands )
+        self.pos = pos
+        self.numWorkers = numWorkers if numWorkers else max( 1, min( self.numWoodlands, os.cpu_count() or 1 ) )
+        self.executor = None
+        self.queue = []
+        self.configData = None
+
+    # Start any maps the queue is missing, call this whenever the config might have changed
+    def update( self, configData ):
+        if self.numWoodlands == 0:
+            return
+
+        if self.configData is None or vars( self.configData ) != vars( configData ):
+            self.clear()
+            self.configData = copy.copy( configData )
+
+        # The window's process has a display and other threads going, so the workers start fresh instead of being forked from it
+        if self.executor is None:
+            self.executor = concurrent.futures.ProcessPoolExecutor( self.numWorkers, multiprocessing.get_context( "spawn" ) )
+
+        while len( self.queue ) < self.numWoodlands:
+            try:
+                self.queue.append( self.executor.submit( prefetchWoodland, self.configData, self.pos, random.getrandbits( 32 ) ) )
+            except concurrent.futures.process.BrokenProcessPool as error:
+                self.restart( error )
+                return
+
+    # The first finished map in the queue, or None if none of them are ready yet
+    # A map that failed is dropped and None is returned, so the caller can make one itself instead
+    def pop( self ):
+        for i in range( len( self.queue ) ):
+            if self.queue[i].done():
+                future = self.queue.pop( i )
+                try:
+                    return future.result()
+                except concurrent.futures.process.BrokenProcessPool as error:
+                    self.restart( error )
+                    return None
+                except Exception as error:
+                    print( "A prefetched woodland failed to generate: " + repr( error ) )
+                    return None
+        return None
+
+    def numReady( self ):
+        return sum( 1 for future in self.queue if future.done() )
+
+    # Throw out every queued map, ones that are already being made finish in the background and are ignored
+    def clear( self ):
+        for future in self.queue:
+            future.cancel()
+        self.queue = []
+
+    # A worker died and nothing else in the pool will finish, throw the pool out so the next update starts a new one
+    def restart( self, error ):
+        print( "Prefetching woodlands stopped working, restarting it: " + str( error ) )
+        self.shutdown()
+
+    def shutdown( self ):
+        self.clear()
+        if self.executor is not None:
+            self.executor.shutdown( wait=False, cancel_futures=True )
+            self.executor = None
@@ -0,0 +1,107 @@
+from RenderCommon import *
+from Woodland import *
+from ClearingRenderer import *
+from LandmarkRenderer import *
+from DecorAtlas import *
+
+import pygame
+import numpy as np
+
+class WoodlandRenderer:
+    # Path draw data
+    pathWidth = 4
+
+    # Bridge draw data
+    bridgePoleRadius = 2
+    localInfoDrawSpacing = 1
+
+    def __init__( self, woodland ):
+        self.woodland = woodland
+
+        # Everything under the clearings only changes when the map is regenerated, so it's drawn once and reused every frame
+        self.background = None
+        self.backgroundKey = None
+
+    # The settings the background was drawn with, if any of these change it's drawn again
+    def getBackgroundKey( self ):
+        return ( GLOBAL_SETTINGS.useClassicGraphics, GLOBAL_SETTINGS.useDecorAtlas )
+
+    def draw( self, screen ):
+        woodland = self.woodland
+
+        self.drawBackground( screen )
+        
+        for clearing in woodland.clearings:
+            ClearingRenderer.draw( screen, clearing )
+
+    def drawBackground( self, screen ):
+        backgroundKey = self.getBackgroundKey()
+        if self.background is None or self.backgroundKey != backgroundKey:
+            self.background = self.renderBackground( screen )
+            self.backgroundKey = backgroundKey
+
+        screen.blit( self.background, self.woodland.rect, self.woodland.rect )
+
+    def renderBackground( self, screen ):
+        woodland = self.woodland
+
+        # The background is in screen space so everything can be drawn as usual, only the woodland's rect of it is ever used
+        background = pygame.Surface( ( woodland.rect[0] + woodland.rect[2], woodland.rect[1] + woodland.rect[3] ), 0, screen )
+
+        # Draw everything here in reverse order of what we want on top
+        pygame.draw.rect( background, LIGHT_GREEN, woodland.rect )
+
+        self.drawWater( background )
+        self.drawBridges( background )
+        self.drawDecor( background )
+        self.drawPaths( background )
+        self.drawLandmarks( background )
+            
+        pygame.draw.rect( background, BROWN, woodland.rect, width=5 )
+
+        return background
+
+    def drawWater( self, screen ):
+        if self.woodland.water:
+            pygame.draw.polygon( screen, LIGHT_BLUE, self.woodland.water.hull )
+        
+    def drawPaths( self, screen ):
+        for p1, p2 in self.woodland.pathSegments.tolist():
+            pygame.draw.line( screen, RED, p1, p2, self.pathWidth )
+        
+    def drawDecor( self, screen ):
+        # Each object is a single blit of a pre-drawn sprite, this loses a little of the colour variance and sub pixel placement
+        if GLOBAL_SETTINGS.useDecorAtlas:
+            screen.blits( DecorAtlas.getBlits( self.woodland ), False )
+            return
+
+        geometry = self.woodland.getDecorGeometry()
+        points = geometry.points.tolist()
+
+        # The shapes are already in order from the lowest y to the highest so the decor is drawn on top of itself
+        for kind, colour, width, start, count, radius in geometry.shapes.tolist():
+            if kind == DecorGeometry.CIRCLE:
+                pygame.draw.circle( screen, colour, points[start], radius )
+            else:
+                pygame.draw.polygon( screen, colour, points[start:start + count], width )
+
+    def drawBridges( self, screen ):
+        for bridge in self.woodland.bridges:
+            pygame.draw.polygon( screen, BROWN, bridge )
+
+            for point in bridge:
+                pygame.draw.circle( screen, BROWN, point, self.bridgePoleRadius )
+                pygame.draw.circle( screen, BLACK, point, self.bridgePoleRadius, 1 )
+
+    @staticmethod
+    def drawBridgeLocalInfo( screen, bridge, pos ):
+        return drawTextTable( screen, pos, [ "Bridge" ], [ basicFont14 ], [ BLACK ], WoodlandRenderer.localInfoDrawSpacing, WHITE, BLACK )
+
+    def drawLandmarks( self, screen ):
+        for landmark in self.woodland.landmarks:
+            LandmarkRenderer.draw( screen, landmark )
+
+    def debugDrawDrawGrid( self, screen ):
+        woodland = self.woodland
+        for i, j in np.argwhere( ~woodland.drawGridOpenCells ).tolist():
+            pygame.draw.rect( screen, RED, [ woodland.pos[0] + i * woodland.drawGridCellSize, woodland.pos[1] + j * woodland.drawGridCellSize, woodland.drawGridCellSize, woodland.drawGridCellSize ] )
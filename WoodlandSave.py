@@ -0,0 +1,304 @@
+from WoodlandCommon import *
+from Woodland import *
+
+import json
+import os
+import random
+import zipfile
+import numpy as np
+
+
+# Stands in for the scipy Delaunay once a woodland is loaded, the woodland only looks at these arrays after it's generated
+class SavedTriangulation:
+    def __init__( self, points, simplices, neighbors ):
+        self.points = points
+        self.simplices = simplices
+        self.neighbors = neighbors
+
+
+# Saves a generated woodland to a single .npz file of plain numpy arrays and loads it back without generating anything
+# The file isn't compressed, so loading can memory map the big arrays, like the decor, straight out of it instead of reading them
+# Everything is stored as arrays of numbers and strings so nothing has to be pickled
+# A loaded woodland keeps the file mapped for as long as it's around. Saving it back over the same file copies its mapped arrays
+# into memory first, but any other woodland loaded from that file still maps it, and on Windows a mapped file can't be replaced
+class WoodlandSave:
+    formatVersion = 1
+    # Arrays smaller than this are just read in, mapping them isn't worth it
+    memmapMinBytes = 1 << 16
+
+    settingNames = [ "minClearingDist", "enableLake", "enableRiver", "forceLake", "forceRiver", "enableMarquisate", "enableEyrie",
+                     "enableWoodlandAlliance", "enableLizardCult", "enableRiverfolk", "enableDuchy", "enableCorvids", "enableMountains",
+                     "enableMarshes", "enableLandmarks" ]
+
+    @staticmethod
+    def save( woodland, path ):
+        WoodlandSave.releaseMaps( woodland, path )
+        clearings = woodland.clearings
+
+        info = { "formatVersion": WoodlandSave.formatVersion,
+                 "pos": list( woodland.pos ),
+                 "size": list( woodland.size ),
+                 "seed": woodland.seed,
+                 "settings": { name: getattr( woodland, name ) for name in WoodlandSave.settingNames },
+                 "hasWater": woodland.water is not None,
+                 "controlCountingData": woodland.controlCountingData }
+
+        arrays = { "info": np.array( json.dumps( info, default=int ) ) }
+
+        # Clearings
+        arrays["clearingPos"] = WoodlandSave.getPointArray( [ clearing.pos for clearing in clearings ] )
+        arrays["clearingAvailPaths"] = np.array( [ clearing.avail_paths for clearing in clearings ], dtype=np.int32 )
+        arrays["clearingResidents"] = WoodlandSave.getStringArray( [ clearing.residents for clearing in clearings ] )
+        arrays["clearingName"] = WoodlandSave.getStringArray( [ clearing.name for clearing in clearings ] )
+        arrays["clearingControl"] = WoodlandSave.getStringArray( [ clearing.control for clearing in clearings ] )
+        arrays["clearingFeatureMask"] = woodland.getFeatureMasks()
+        arrays["clearingStatus"] = np.array( [ clearing.status for clearing in clearings ], dtype=np.int32 )
+        arrays["clearingTicksSinceLastAttack"] = np.array( [ clearing.ticksSinceLastAttack for clearing in clearings ], dtype=np.int32 )
+
+        # Lists per clearing are stored flat, along with where each clearing's list starts
+        denizens = [ clearing.denizens for clearing in clearings ]
+        arrays["denizenStarts"] = WoodlandSave.getListStarts( denizens )
+        arrays["denizenName"] = WoodlandSave.getStringArray( [ denizen.name for clearingDenizens in denizens for denizen in clearingDenizens ] )
+        arrays["denizenSpecies"] = WoodlandSave.getStringArray( [ denizen.species for clearingDenizens in denizens for denizen in clearingDenizens ] )
+        arrays["denizenOccupation"] = WoodlandSave.getStringArray( [ denizen.occupation for clearingDenizens in denizens for denizen in clearingDenizens ] )
+
+        for name in [ "buildings", "problems" ]:
+            lists = [ getattr( clearing, name ) for clearing in clearings ]
+            arrays[name + "Starts"] = WoodlandSave.getListStarts( lists )
+            arrays[name] = WoodlandSave.getStringArray( [ value for values in lists for value in values ] )
+
+        # Paths in the order they were made, so the neighbours come back in the same order too
+        arrays["edges"] = woodland.graph.getEdgeArray()
+        arrays["corners"] = np.array( [ -1 if corner is None else corner.id for corner in woodland.corners ], dtype=np.int32 )
+
+        # Triangulation
+        tri = woodland.tri
+        arrays["triPoints"] = np.zeros( ( 0, 2 ) ) if tri is None else np.asarray( tri.points, dtype=float )
+        arrays["triSimplices"] = np.zeros( ( 0, 3 ), dtype=np.int32 ) if tri is None else np.asarray( tri.simplices, dtype=np.int32 )
+        arrays["triNeighbors"] = np.zeros( ( 0, 3 ), dtype=np.int32 ) if tri is None else np.asarray( tri.neighbors, dtype=np.int32 )
+        arrays["dtTypes"] = np.array( [ dtType.value for dtType in woodland.dtTypes ], dtype=np.int8 )
+
+        # Water
+        arrays["lakeTris"] = np.array( woodland.lakeTris, dtype=np.int32 )
+        arrays["lakeClearings"] = np.array( [ clearing.id for clearing in woodland.lakeClearings ], dtype=np.int32 )
+        arrays["waterHull"] = WoodlandSave.getPointArray( woodland.water.hull if woodland.water else [] )
+        arrays["riverSplinePoints"] = WoodlandSave.getPointArray( woodland.riverSplinePoints )
+        arrays["riverControlPoints"] = WoodlandSave.getPointArray( woodland.riverControlPoints )
+        arrays["riverHullPoints"] = WoodlandSave.getPointArray( woodland.riverHullPoints )
+        arrays["bridges"] = np.array( woodland.bridges, dtype=float ).reshape( -1, 4, 2 )
+
+        # Drawing
+        arrays["decor"] = woodland.decor
+        arrays["pathSegments"] = woodland.pathSegments
+        arrays["drawGridOpenCells"] = woodland.drawGridOpenCells
+
+        # Landmarks
+        arrays["landmarkType"] = np.array( [ landmark.landmarkType.value for landmark in woodland.landmarks ], dtype=np.int8 )
+        arrays["landmarkPos"] = WoodlandSave.getPointArray( [ landmark.pos for landmark in woodland.landmarks ] )
+        arrays["landmarkName"] = WoodlandSave.getStringArray( [ landmark.name for landmark in woodland.landmarks ] )
+
+        arrays["usedNames"] = WoodlandSave.getStringArray( [ name for name, used in woodland.allNames.items() if used ] )
+
+        # savez doesn't compress, which is what lets the arrays be mapped when loading
+        # It's written next to the file and then swapped in, so the old file is still whole while it's being read from
+        tempPath = path + ".tmp"
+        with open( tempPath, "wb" ) as file:
+            np.savez( file, **arrays )
+        os.replace( tempPath, path )
+
+    # Load a woodland saved with save. If pos is given the woodland is moved there, otherwise it stays where it was saved
+    @staticmethod
+    def load( path, pos=None ):
+        arrays = WoodlandSave.loadArrays( path )
+        info = json.loads( arrays["info"].item() )
+
+        if info["formatVersion"] != WoodlandSave.formatVersion:
+            raise ValueError( "Unsupported woodland save version " + str( info["formatVersion"] ) + " in " + path )
+
+        savedPos = info["pos"]
+        if pos is None:
+            pos = savedPos
+        offset = np.array( [ pos[0] - savedPos[0], pos[1] - savedPos[1] ], dtype=float )
+        moved = np.any( offset != 0 )
+
+        settings = info["settings"]
+        woodland = Woodland( tuple( pos ), info["size"], settings["minClearingDist"], settings["enableLake"], settings["enableRiver"],
+                             settings["forceLake"], settings["forceRiver"], settings["enableMarquisate"], settings["enableEyrie"],
+                             settings["enableWoodlandAlliance"], settings["enableLizardCult"], settings["enableRiverfolk"],
+                             settings["enableDuchy"], settings["enableCorvids"], settings["enableMountains"], settings["enableMarshes"],
+                             settings["enableLandmarks"] )
+        woodland.seed = info["seed"]
+        woodland.controlCountingData = info["controlCountingData"]
+
+        # Denizens pick a random name when they're made, give them a throwaway generator so loading doesn't use up the global one
+        denizenRng = random.Random( 0 )
+
+        # Clearings
+        clearingPos = np.asarray( arrays["clearingPos"] ) + offset
+        denizenNames = arrays["denizenName"].tolist()
+        denizenSpecies = arrays["denizenSpecies"].tolist()
+        denizenOccupations = arrays["denizenOccupation"].tolist()
+        denizenStarts = arrays["denizenStarts"].tolist()
+        buildings = WoodlandSave.getLists( arrays["buildings"], arrays["buildingsStarts"] )
+        problems = WoodlandSave.getLists( arrays["problems"], arrays["problemsStarts"] )
+
+        for i, ( residents, name, control, featureMask, status, ticksSinceLastAttack, availPaths ) in enumerate( zip(
+                arrays["clearingResidents"].tolist(), arrays["clearingName"].tolist(), arrays["clearingControl"].tolist(),
+                arrays["clearingFeatureMask"].tolist(), arrays["clearingStatus"].tolist(), arrays["clearingTicksSinceLastAttack"].tolist(),
+                arrays["clearingAvailPaths"].tolist() ) ):
+            clearing = Clearing( clearingPos[i].copy() )
+            clearing.id = i
+            clearing.residents = residents
+            clearing.name = name
+            clearing.control = control
+            clearing.featureMask = featureMask
+            clearing.status = status
+            clearing.ticksSinceLastAttack = ticksSinceLastAttack
+            clearing.avail_paths = availPaths
+            clearing.buildings = buildings[i]
+            clearing.problems = problems[i]
+
+            for j in range( denizenStarts[i], denizenStarts[i + 1] ):
+                denizen = Denizen( denizenRng )
+                denizen.name = denizenNames[j]
+                denizen.species = denizenSpecies[j]
+                denizen.occupation = denizenOccupations[j]
+                clearing.denizens.append( denizen )
+
+            woodland.clearings.append( clearing )
+
+        clearings = woodland.clearings
+        woodland.graph = ClearingGraph( clearings )
+        for clearing in clearings:
+            clearing.graph = woodland.graph
+        for id1, id2 in arrays["edges"].tolist():
+            woodland.graph.addPath( clearings[id1], clearings[id2] )
+
+        woodland.corners = [ None if id == -1 else clearings[id] for id in arrays["corners"].tolist() ]
+
+        # Triangulation
+        woodland.tri = SavedTriangulation( arrays["triPoints"] + offset if moved else arrays["triPoints"], arrays["triSimplices"], arrays["triNeighbors"] )
+        woodland.dtTypes = [ DTType( dtType ) for dtType in arrays["dtTypes"].tolist() ]
+
+        # Water
+        woodland.lakeTris = arrays["lakeTris"].tolist()
+        woodland.isLakeTri = [ False for i in range( len( woodland.dtTypes ) ) ]
+        for lakeTri in woodland.lakeTris:
+            woodland.isLakeTri[lakeTri] = True
+        woodland.lakeClearings = [ clearings[id] for id in arrays["lakeClearings"].tolist() ]
+
+        woodland.riverSplinePoints = [ tuple( point ) for point in ( arrays["riverSplinePoints"] + offset ).tolist() ]
+        woodland.riverControlPoints = list( arrays["riverControlPoints"] + offset )
+        woodland.riverHullPoints = list( arrays["riverHullPoints"] + offset )
+        woodland.bridges = [ list( bridge ) for bridge in arrays["bridges"] + offset ]
+        if info["hasWater"]:
+            woodland.water = Water( woodland.lakeTris, woodland.riverHullPoints, woodland, hull=( arrays["waterHull"] + offset ).tolist() )
+
+        # Drawing, the decor is only copied if it has to be moved. Its rows are relative to the woodland so only x changes
+        decor = arrays["decor"]
+        if offset[0] != 0:
+            decor = np.array( decor )
+            decor["x"] += offset[0]
+        woodland.decor = decor
+        woodland.decorGeometry = None
+        woodland.pathSegments = arrays["pathSegments"] + offset if moved else arrays["pathSegments"]
+        woodland.drawGridOpenCells = arrays["drawGridOpenCells"]
+
+        # Landmarks
+        woodland.landmarks = []
+        for landmarkType, landmarkPos, name in zip( arrays["landmarkType"].tolist(), arrays["landmarkPos"] + offset, arrays["landmarkName"].tolist() ):
+            landmark = landmarkClasses[ LandmarkType( landmarkType ) ]( landmarkPos )
+            landmark.name = name
+            woodland.landmarks.append( landmark )
+
+        woodland.generateNameData()
+        for name in arrays["usedNames"].tolist():
+            woodland.allNames[name] = True
+
+        woodland.index = ClearingIndex( clearings )
+        woodland.spatialIndex = SpatialIndex( clearings, woodland.landmarks, woodland.bridges )
+
+        return woodland
+
+    # Copy any of the woodland's arrays that are mapped from the file at path into memory, so the file can be replaced
+    @staticmethod
+    def releaseMaps( woodland, path ):
+        if not os.path.exists( path ):
+            return
+
+        def release( array ):
+            if isinstance( array, np.memmap ) and os.path.exists( array.filename ) and os.path.samefile( array.filename, path ):
+                return np.array( array )
+            return array
+
+        woodland.decor = release( woodland.decor )
+        woodland.pathSegments = release( woodland.pathSegments )
+        woodland.drawGridOpenCells = release( woodland.drawGridOpenCells )
+
+        tri = woodland.tri
+        if isinstance( tri, SavedTriangulation ):
+            tri.points = release( tri.points )
+            tri.simplices = release( tri.simplices )
+            tri.neighbors = release( tri.neighbors )
+
+    # Every array in the file by name. np.load can't map arrays inside an .npz, but since they're stored uncompressed
+    # each one is just a .npy file sitting somewhere inside the zip so it can be mapped from there
+    @staticmethod
+    def loadArrays( path ):
+        arrays = {}
+        with zipfile.ZipFile( path ) as zipFile, open( path, "rb" ) as file:
+            for zipInfo in zipFile.infolist():
+                name = zipInfo.filename[:-len( ".npy" )]
+
+                array = None
+                if zipInfo.compress_type == zipfile.ZIP_STORED and zipInfo.file_size >= WoodlandSave.memmapMinBytes:
+                    array = WoodlandSave.memmapArray( path, file, zipInfo )
+
+                if array is None:
+                    with zipFile.open( zipInfo ) as arrayFile:
+                        array = np.lib.format.read_array( arrayFile, allow_pickle=False )
+                arrays[name] = array
+
+        return arrays
+
+    # Map an array stored in the zip, or None if it's one that can't be mapped
+    @staticmethod
+    def memmapArray( path, file, zipInfo ):
+        # The local file header is 30 bytes followed by the name and an extra field, the .npy file starts after those
+        file.seek( zipInfo.header_offset )
+        header = file.read( 30 )
+        nameLength = int.from_bytes( header[26:28], "little" )
+        extraLength = int.from_bytes( header[28:30], "little" )
+        file.seek( zipInfo.header_offset + 30 + nameLength + extraLength )
+
+        version = np.lib.format.read_magic( file )
+        if version == ( 1, 0 ):
+            shape, fortranOrder, dtype = np.lib.format.read_array_header_1_0( file )
+        elif version == ( 2, 0 ):
+            shape, fortranOrder, dtype = np.lib.format.read_array_header_2_0( file )
+        else:
+            return None
+
+        if dtype.hasobject or len( shape ) == 0:
+            return None
+        return np.memmap( path, dtype, "r", file.tell(), shape, "F" if fortranOrder else "C" )
+
+    @staticmethod
+    def getPointArray( points ):
+        return np.array( points, dtype=float ).reshape( -1, 2 )
+
+    @staticmethod
+    def getStringArray( strings ):
+        return np.array( strings, dtype=np.str_ )
+
+    @staticmethod
+    def getListStarts( lists ):
+        starts = np.zeros( len( lists ) + 1, dtype=np.int64 )
+        np.cumsum( [ len( values ) for values in lists ], out=starts[1:] )
+        return starts
+
+    @staticmethod
+    def getLists( values, starts ):
+        values = values.tolist()
+        starts = starts.tolist()
+        return [ values[starts[i]:starts[i + 1]] for i in range( len( starts ) - 1 ) ]
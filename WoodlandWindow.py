@@ -0,0 +1,592 @@
+# The window for generating and browsing maps, it's started by running GenerateWoodland.py
+import pygame
+pygame.init()
+
+from WoodlandCommon import *
+from RenderCommon import *
+from Woodland import *
+from WarEngine import *
+from WoodlandRenderer import *
+from ConfigData import *
+from RedrawScheduler import *
+from WoodlandGenerator import *
+from WoodlandPrefetcher import *
+from WoodlandSave import *
+from WarHistory import *
+
+import random
+import math
+import os
+import numpy as np
+import pygame_widgets
+from pygame_widgets.textbox import TextBox
+from pygame_widgets.toggle import Toggle
+
+
+# Global Data settings functions
+def setUseClassicGraphics( config, widget ):
+    GLOBAL_SETTINGS.useClassicGraphics = widget.getValue()
+
+def setUseWarEngine( config, widget ):
+    GLOBAL_SETTINGS.useWarEngine = widget.getValue()
+
+def setUseDecorAtlas( config, widget ):
+    GLOBAL_SETTINGS.useDecorAtlas = widget.getValue()
+        
+def drawLegend( screen, pos, spacing ):
+    # First draw the factions legend
+    factionDrawPos = pos
+    factionTexts = [ "Factions:" ]
+    factionFonts = [ font16 ]
+    factionColours = [ BLACK ]
+
+    for controlName in controlColours:
+        factionTexts.append( controlName )
+        factionFonts.append( font12 )
+        factionColours.append( controlColours[controlName] )
+
+    factionDrawSize = drawTextTable( screen, factionDrawPos, factionTexts, factionFonts, factionColours, spacing, None, None )
+
+    # Draw the features legend
+    featureDrawPos = ( factionDrawPos[0], factionDrawPos[1] + factionDrawSize[1] + 2 * spacing )
+    featureTexts = [ "Features:" ]
+    featureFonts = [ font16 ]
+    featureColours = [ BLACK ]
+
+    for featureName in Clearing.featuresDict:
+        control = Clearing.featuresDict[featureName]
+        drawFcn = ClearingRenderer.featureDrawFcns[featureName]
+
+        if drawFcn != None:
+            featureTexts.append( featureName )
+            featureFonts.append( font12 )
+            featureColours.append( controlColours[control] )
+
+    featureDrawSize = drawTextTable( screen, featureDrawPos, featureTexts, featureFonts, featureColours, spacing, None, None )
+
+    # Draw the legend icons beside the faction and feature titles
+    iconsDrawX = pos[0] + max( factionDrawSize[0], featureDrawSize[0] ) + spacing
+
+    factionTitleSize = factionFonts[0].size( factionTexts[0] )
+    # Offset the Y by the title and spacing to start drawing on the first faction line
+    iconsDrawY = factionDrawPos[1] + factionTitleSize[1] + 2 * spacing
+
+    iconsWidth = 0
+    
+    # Skip the first item because that's just the title
+    for i in range( 1, len( factionTexts ) ):
+        drawFcn = ClearingRenderer.controlDict[ factionTexts[i] ]
+        size = factionFonts[i].size( factionTexts[i] )
+        
+        if drawFcn != None:
+            iconPos = ( iconsDrawX, iconsDrawY )
+            drawFcn( screen, iconPos, size[1] )
+            iconsWidth = max( iconsWidth, size[1] )
+
+        iconsDrawY += spacing + size[1]
+
+    featureTitleSize = featureFonts[0].size( featureTexts[0] )
+    # Offset the Y by the title and spacing to start drawing on the first faction line
+    iconsDrawY = featureDrawPos[1] + featureTitleSize[1] + 2 * spacing
+
+    # Skip the first item because that's just the title
+    for i in range( 1, len( featureTexts ) ):
+        drawFcn = ClearingRenderer.featureDrawFcns[ featureTexts[i] ]
+        size = featureFonts[i].size( featureTexts[i] )
+        
+        if drawFcn != None:
+            iconPos = ( iconsDrawX, iconsDrawY )
+            drawFcn( screen, iconPos, size[1] )
+            iconsWidth = max( iconsWidth, size[1] )
+
+        iconsDrawY += spacing + size[1]
+
+    legendSize = ( iconsDrawX + iconsWidth, factionDrawSize[1] + 2 * spacing + featureDrawSize[1] )
+    return legendSize
+
+
+def getCaption( woodland, history ):
+    caption = 'Root Woodland - Seed ' + str( woodland.seed )
+    if history.numTicks > 0:
+        caption += ' - Tick ' + str( history.currentTick ) + '/' + str( history.numTicks )
+    return caption
+
+# What each clearing looks like, to find the ones that need to be drawn again after the war changes them
+def getClearingDrawStates( woodland ):
+    return [ ( clearing.control, clearing.featureMask, clearing.status, clearing.residents ) for clearing in woodland.clearings ]
+
+def markChangedClearings( scheduler, woodland, drawStates ):
+    for clearing, drawState, newDrawState in zip( woodland.clearings, drawStates, getClearingDrawStates( woodland ) ):
+        if drawState != newDrawState:
+            scheduler.markDirty( ClearingRenderer.getDrawRect( clearing ) )
+
+def getGenerationProgressTexts( stage ):
+    numStages = len( Woodland.progressStages )
+    if stage is None:
+        return [ "Generating new woodland", "Starting" ]
+    return [ "Generating new woodland", "Stage " + str( Woodland.progressStages.index( stage ) + 1 ) + "/" + str( numStages ) + ": " + stage ]
+
+generationProgressFonts = [ basicFont14, basicFont12 ]
+generationProgressBarHeight = 6
+
+# Sized for the longest stage so the box doesn't change size as the stages go by
+def getGenerationProgressSize( spacing ):
+    width, height = 0, 0
+    for stage in [ None ] + Woodland.progressStages:
+        size = getTextTableSize( getGenerationProgressTexts( stage ), generationProgressFonts, spacing )
+        width, height = max( width, size[0] ), max( height, size[1] )
+
+    return ( width, height + generationProgressBarHeight + spacing )
+
+def drawGenerationProgress( screen, pos, spacing, stage, progress ):
+    width, height = getGenerationProgressSize( spacing )
+    barHeight = generationProgressBarHeight
+
+    pygame.draw.rect( screen, WHITE, [ pos[0], pos[1], width, height ] )
+    pygame.draw.rect( screen, BLACK, [ pos[0], pos[1], width, height ], 1 )
+    drawTextTable( screen, pos, getGenerationProgressTexts( stage ), generationProgressFonts, [ BLACK, BLACK ], spacing, None, None )
+
+    barRect = [ pos[0] + spacing, pos[1] + height - barHeight - spacing, width - 2 * spacing, barHeight ]
+    pygame.draw.rect( screen, GREEN, [ barRect[0], barRect[1], int( barRect[2] * progress ), barRect[3] ] )
+    pygame.draw.rect( screen, BLACK, barRect, 1 )
+
+    return ( width, height )
+
+def updateSettingsMenu( screen, pos, spacing, configData, createWidgets ):
+    maxWidth = 0
+    widgets = []
+    widgetCallbacks = []
+
+    textBoxHeightBuffer = 10
+    textBoxHalfHeightBuffer = textBoxHeightBuffer / 2
+    toggleExtraSpacing = 10
+    toggleHalfExtraSpacing = int( toggleExtraSpacing / 2 )
+    
+    # Draw the title
+    titlePos = pos
+    titleFont = font16
+    titleText = "Woodland Settings"
+
+    titleSize = titleFont.size( titleText )
+    drawText( screen, titlePos, titleText, titleFont, BLACK )
+
+    maxWidth = max( maxWidth, titleSize[0] )
+
+    # Common toggles for the basic info
+    commonPos = [ titlePos[0], titlePos[1] + titleSize[1] + spacing ]
+    commonFont = font14
+    commonText = "Common"
+
+    commonTextSize = commonFont.size( commonText )
+    drawText( screen, commonPos, commonText, commonFont, BLACK )
+
+    maxWidth = max( maxWidth, commonTextSize[0] )
+
+    commonVarsPos = [ commonPos[0], commonPos[1] + commonTextSize[1] + spacing ]
+    commonVarsTexts = [ "Map Width", "Map Height", "Number of Clearings", "Minimum Space Between Clearings" ]
+    commonVarsCallbacks = [ ConfigData.setMapWidth, ConfigData.setMapHeight, ConfigData.setNumClearings, ConfigData.setMinClearingDist ]
+    commonVarsStartVals = [ str( configData.mapWidth ), str( configData.mapHeight ), str( configData.numClearings ), str( configData.minClearingDist ) ]
+    commonVarsFont = basicFont14
+    yOffset = 0
+
+    for i in range( len( commonVarsTexts ) ):
+        text = commonVarsTexts[i]
+        textSize = commonVarsFont.size( text )
+        textBoxX = commonVarsPos[0]
+        textBoxY = commonVarsPos[1] + yOffset
+        textBoxWidth = 40
+        textBoxHeight = textSize[1] + textBoxHeightBuffer
+        
+        if createWidgets:
+            textBox = TextBox( screen, textBoxX, textBoxY, textBoxWidth, textBoxHeight,
+                               font=commonVarsFont, borderThickness=1 )
+            textBox.setText( commonVarsStartVals[i] )
+            widgets.append( textBox )
+            widgetCallbacks.append( commonVarsCallbacks[i] )
+        
+        textPos = [ textBoxX + textBoxWidth + 2 * spacing, textBoxY + textBoxHalfHeightBuffer ]
+        drawText( screen, textPos, text, commonVarsFont, BLACK )
+
+        yOffset += spacing + textBoxHeight
+
+        maxWidth = max( maxWidth, textSize[0] + textBoxWidth + spacing * 2 )
+
+    # Faction on and off toggles
+    factionsPos = [ commonVarsPos[0], commonVarsPos[1] + yOffset + spacing ]
+    factionsFont = font14
+    factionsText = "Factions Toggles"
+
+    factionsTextSize = factionsFont.size( factionsText )
+    drawText( screen, factionsPos, factionsText, factionsFont, BLACK )
+
+    maxWidth = max( maxWidth, factionsTextSize[0] )
+
+    factionNames = [ controlName for controlName in controlColours if controlName != "None" and controlName != "Denizens" ]
+    factionCallbacks = {
+        "Marquisate": ConfigData.setEnableMarquisate,
+        "Eyrie": ConfigData.setEnableEyrie,
+        "Woodland Alliance": ConfigData.setEnableWoodlandAlliance,
+        "Lizard Cult": ConfigData.setEnableLizardCult,
+        "Riverfolk": ConfigData.setEnableRiverfolk,
+        "Grand Duchy": ConfigData.setEnableDuchy,
+        "Corvid Conspiracy": ConfigData.setEnableCorvids,
+        }
+    factionStartVals = {
+        "Marquisate": configData.enableMarquisate,
+        "Eyrie": configData.enableEyrie,
+        "Woodland Alliance": configData.enableWoodlandAlliance,
+        "Lizard Cult": configData.enableLizardCult,
+        "Riverfolk": configData.enableRiverfolk,
+        "Grand Duchy": configData.enableDuchy,
+        "Corvid Conspiracy": configData.enableCorvids,
+        }
+    factionVarsPos = [ factionsPos[0], factionsPos[1] + factionsTextSize[1] + spacing ]
+    factionVarsFont = basicFont14
+    yOffset = 0
+    
+    for i in range( len( factionNames ) ):
+        text = factionNames[i]
+        textSize = factionVarsFont.size( text )
+
+        toggleX = factionVarsPos[0] + 2 * spacing
+        toggleY = factionVarsPos[1] + yOffset + toggleHalfExtraSpacing
+        toggleWidth = textSize[1]
+        toggleHeight = textSize[1]
+
+        if createWidgets:
+            startOn = True
+            if text in factionStartVals:
+                startOn = factionStartVals[text]
+            toggle = Toggle( screen, toggleX, toggleY, toggleWidth, toggleHeight, startOn=startOn )
+            widgets.append( toggle )
+
+            if text in factionCallbacks:
+                widgetCallbacks.append( factionCallbacks[text] )
+            else:
+                widgetCallbacks.append( None )
+
+        iconPos = [ toggleX + toggleWidth * 2 + spacing, toggleY ]
+        iconSize = textSize[1] 
+        drawFcn = ClearingRenderer.controlDict[ text ]
+        
+        if drawFcn != None:
+            drawFcn( screen, iconPos, iconSize )
+        
+        textPos = [ iconPos[0] + iconSize + spacing, iconPos[1] ]
+        drawText( screen, textPos, text, factionVarsFont, BLACK )
+
+        yOffset += spacing + toggleHeight + toggleHalfExtraSpacing * 2
+
+        maxWidth = max( maxWidth, textSize[0] + toggleWidth * 2 + iconSize + spacing * 5 )
+
+    # Map Generation variables and toggles
+    mapGenPos = [ factionVarsPos[0], factionVarsPos[1] + yOffset + spacing ]
+    mapGenFont = font14
+    mapGenText = "Map Generation Toggles"
+
+    mapGenSize = mapGenFont.size( mapGenText )
+    drawText( screen, mapGenPos, mapGenText, mapGenFont, BLACK )
+
+    maxWidth = max( maxWidth, mapGenSize[0] )
+
+    mapGenVarNames = [ "Enable Lake", "Force Lake Spawn", "Enable River", "Force River Spawn",
+                       "Enable Mountains", "Enable Marshes", "Enable Landmarks" ]
+    mapGenCallbacks = [ ConfigData.setEnableLake, ConfigData.setForceLake, ConfigData.setEnableRiver, ConfigData.setForceRiver,
+                        ConfigData.setEnableMountains, ConfigData.setEnableMarshes, ConfigData.setEnableLandmarks ]
+    mapGenVarStartValues = [ configData.enableLake, configData.forceLake, configData.enableRiver, configData.forceRiver,
+                             configData.enableMountains, configData.enableMarshes, configData.enableLandmarks ]
+    mapGenVarsPos = [ mapGenPos[0], mapGenPos[1] + mapGenSize[1] + spacing ]
+    mapGenVarsFont = basicFont14
+    yOffset = 0
+    
+    for i in range( len( mapGenVarNames ) ):
+        text = mapGenVarNames[i]
+        textSize = mapGenVarsFont.size( text )
+
+        toggleX = mapGenVarsPos[0] + 2 * spacing
+        toggleY = mapGenVarsPos[1] + yOffset + toggleHalfExtraSpacing
+        toggleWidth = textSize[1]
+        toggleHeight = textSize[1]
+
+        if createWidgets:
+            toggle = Toggle( screen, toggleX, toggleY, toggleWidth, toggleHeight, startOn=mapGenVarStartValues[i] )
+            widgets.append( toggle )
+            widgetCallbacks.append( mapGenCallbacks[i] )
+
+        textPos = [ toggleX + toggleWidth * 2 + spacing, toggleY ]
+        drawText( screen, textPos, text, mapGenVarsFont, BLACK )
+
+        yOffset += spacing + toggleHeight + toggleHalfExtraSpacing * 2
+
+        maxWidth = max( maxWidth, textSize[0] + toggleWidth * 2 + spacing * 4 )
+
+    # Other Settings
+    otherPos = [ mapGenVarsPos[0], mapGenVarsPos[1] + yOffset + spacing ]
+    otherFont = font14
+    otherText = "Other"
+
+    otherSize = otherFont.size( otherText )
+    drawText( screen, otherPos, otherText, otherFont, BLACK )
+
+    maxWidth = max( maxWidth, otherSize[0] )
+
+    otherVarNames = [ "Use Classic Graphics", "Use Fast War Engine", "Use Decor Atlas" ]
+    otherCallbacks = [ setUseClassicGraphics, setUseWarEngine, setUseDecorAtlas ]
+    otherVarStartValues = [ GLOBAL_SETTINGS.useClassicGraphics, GLOBAL_SETTINGS.useWarEngine, GLOBAL_SETTINGS.useDecorAtlas ]
+    otherVarsPos = [ otherPos[0], otherPos[1] + otherSize[1] + spacing ]
+    otherVarsFont = basicFont14
+    yOffset = 0
+    
+    for i in range( len( otherVarNames ) ):
+        text = otherVarNames[i]
+        textSize = otherVarsFont.size( text )
+
+        toggleX = otherVarsPos[0] + 2 * spacing
+        toggleY = otherVarsPos[1] + yOffset + toggleHalfExtraSpacing
+        toggleWidth = textSize[1]
+        toggleHeight = textSize[1]
+
+        if createWidgets:
+            toggle = Toggle( screen, toggleX, toggleY, toggleWidth, toggleHeight, startOn=otherVarStartValues[i] )
+            widgets.append( toggle )
+            widgetCallbacks.append( otherCallbacks[i] )
+
+        textPos = [ toggleX + toggleWidth * 2 + spacing, toggleY ]
+        drawText( screen, textPos, text, otherVarsFont, BLACK )
+
+        yOffset += spacing + toggleHeight + toggleHalfExtraSpacing * 2
+
+        maxWidth = max( maxWidth, textSize[0] + toggleWidth * 2 + spacing * 4 )
+    
+    return ( [ maxWidth, otherVarsPos[1] + yOffset ], widgets, widgetCallbacks )
+
+  
+def main():
+    """
+    //////// EDITABLE VARIABLES ///////
+    """
+    # Size of the woodland map
+    mapSize = ( 1000, 800 )
+    # Number of clearings to spawn on the map
+    numClearings = 12
+    # Minimum distance between clearings. The map size needs to be big enough to handle the number of clearings
+    # and the minimum distance between them or less clearings than set will spawn
+    minClearingDist = 100
+    # Number of maps to generate ahead of time in other processes, so hitting R can show one straight away. 0 turns it off
+    numPrefetchedWoodlands = 2
+    # File the S and L keys save the map to and load it from
+    savePath = "woodland.npz"
+    # File the E key exports the history of the war to
+    historyExportPath = "warHistory.jsonl"
+    """
+    ///////////////////////////////////
+    """
+    # Data for the mouse position checks
+    localInfoDrawDist = 50.0
+    # How often to check on a map being generated in the background, in milliseconds
+    generationPollTime = 50
+    # Spacing between items
+    spacing = 3
+    buffer = 15
+    # Buffer for the bottom and right edges of the map
+    screen = pygame.display.set_mode( ( 1 ,1 ) )
+    pygame.display.set_caption('Root Woodland')
+
+    configData = ConfigData()
+    
+    # Do this once to figure out the size of the legend so we can place the map in the right spot
+    legendSize = drawLegend( screen, (0, 0), spacing )
+
+    mapPos = ( legendSize[0] + spacing, 0 )
+    settingsMenuPos = ( mapPos[0] + mapSize[0] + spacing * 2, 0 )
+
+    settingsMenuSize, widgets, widgetCallbacks = updateSettingsMenu( screen, settingsMenuPos, spacing, configData, True )
+        
+    screenSize = ( settingsMenuPos[0] + settingsMenuSize[0] + spacing, max( mapSize[1], legendSize[1], settingsMenuSize[1] ) + spacing + buffer )
+    screen = pygame.display.set_mode( screenSize )
+    
+    woodland = Woodland( mapPos, mapSize, minClearingDist )
+    woodland.generate( numClearings )
+    renderer = WoodlandRenderer( woodland )
+    history = WarHistory( woodland )
+    # Made the first time the war engine is used on a map and kept until something else changes the clearings
+    warEngine = None
+    pygame.display.set_caption( getCaption( woodland, history ) )
+    
+    running = True
+    clock = pygame.time.Clock()
+    scheduler = RedrawScheduler( screen )
+
+    # The settings that change how everything is drawn, if any of these change the whole screen has to be redrawn
+    drawSettings = renderer.getBackgroundKey()
+    tooltipRect = None
+
+    # New maps are made in the background, the current one keeps being drawn until the new one is ready
+    generator = WoodlandGenerator()
+    prefetcher = WoodlandPrefetcher( numPrefetchedWoodlands, mapPos )
+    prefetcher.update( configData )
+    progressPos = ( mapPos[0] + spacing, mapPos[1] + spacing )
+    drawnProgress = None
+    
+    while running:
+        # Main event updates, this waits for the next event if there's nothing to redraw
+        events = scheduler.getEvents( generationPollTime if generator.isRunning() else None )
+        newWoodland = None
+
+        for event in events:
+            if event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_r:
+                    # Use a map that's already been made if there's one ready, otherwise make one now
+                    if not generator.isRunning():
+                        newWoodland = prefetcher.pop()
+                        if newWoodland is None:
+                            debug_clear()
+                            generator.start( configData, mapPos )
+                
+                elif event.key == pygame.K_s:
+                    # The save is of the war as it is now, not an earlier tick that's being looked at
+                    if not history.isAtLatest():
+                        drawStates = getClearingDrawStates( woodland )
+                        history.showTick( woodland, history.numTicks )
+                        warEngine = None
+                        markChangedClearings( scheduler, woodland, drawStates )
+                        pygame.display.set_caption( getCaption( woodland, history ) )
+
+                    WoodlandSave.save( woodland, savePath )
+                    print( "Saved the woodland to " + savePath )
+                elif event.key == pygame.K_l:
+                    if os.path.exists( savePath ):
+                        newWoodland = WoodlandSave.load( savePath, mapPos )
+                elif event.key == pygame.K_d:
+                    debug_dump()
+                elif event.key == pygame.K_u:
+                    # Only the clearings the war changed need to be drawn again
+                    drawStates = getClearingDrawStates( woodland )
+
+                    # The war always carries on from the latest tick
+                    if not history.isAtLatest():
+                        history.showTick( woodland, history.numTicks )
+                        warEngine = None
+
+                    if GLOBAL_SETTINGS.useWarEngine:
+                        if warEngine is None:
+                            warEngine = WarEngine( woodland )
+                        warEngine.update()
+                        warEngine.saveState( woodland )
+                    else:
+                        woodland.update()
+                        warEngine = None
+
+                    history.record( woodland )
+                    markChangedClearings( scheduler, woodland, drawStates )
+                    pygame.display.set_caption( getCaption( woodland, history ) )
+                elif event.key in ( pygame.K_LEFT, pygame.K_RIGHT ):
+                    # Step through the history of the war
+                    drawStates = getClearingDrawStates( woodland )
+                    history.showTick( woodland, history.currentTick + ( 1 if event.key == pygame.K_RIGHT else -1 ) )
+                    markChangedClearings( scheduler, woodland, drawStates )
+                    pygame.display.set_caption( getCaption( woodland, history ) )
+                elif event.key == pygame.K_e:
+                    history.export( historyExportPath )
+                    print( "Exported the war history to " + historyExportPath )
+
+            if event.type == pygame.QUIT:
+                running = False
+
+            # Anything that could change a widget means the settings need to be redrawn
+            settingsMenuRect = pygame.Rect( settingsMenuPos, settingsMenuSize )
+            if event.type in ( pygame.MOUSEBUTTONDOWN, pygame.MOUSEBUTTONUP, pygame.KEYDOWN, pygame.KEYUP, pygame.TEXTINPUT ):
+                scheduler.markDirty( settingsMenuRect )
+            elif event.type == pygame.MOUSEMOTION and settingsMenuRect.collidepoint( event.pos ):
+                scheduler.markDirty( settingsMenuRect )
+
+        # Swap in the new map once it's done, otherwise keep the progress up to date
+        if newWoodland is None:
+            newWoodland = generator.takeWoodland()
+        if newWoodland is not None:
+            woodland = newWoodland
+            renderer = WoodlandRenderer( woodland )
+            history = WarHistory( woodland )
+            warEngine = None
+            pygame.display.set_caption( getCaption( woodland, history ) )
+
+            settingsMenuPos = ( mapPos[0] + woodland.size[0] + spacing * 2, 0 )
+            settingsMenuSize, widgets, widgetCallbacks = updateSettingsMenu( screen, settingsMenuPos, spacing, configData, True )
+
+            screenSize = ( settingsMenuPos[0] + settingsMenuSize[0] + spacing, max( woodland.size[1], legendSize[1], settingsMenuSize[1] ) + spacing + buffer )
+            prevScreenSize = screen.get_size()
+
+            if screenSize[0] != prevScreenSize[0] or screenSize[1] != prevScreenSize[1]:
+                screen = pygame.display.set_mode( screenSize )
+            scheduler.setScreen( screen )
+            tooltipRect = None
+            drawnProgress = None
+        elif generator.isRunning() and generator.getProgress() != drawnProgress:
+            scheduler.markDirty( ( progressPos, getGenerationProgressSize( spacing ) ) )
+
+        # A text box being edited needs to keep drawing so the cursor shows up
+        for widget in widgets:
+            if isinstance( widget, TextBox ) and widget.selected:
+                scheduler.markDirty( pygame.Rect( settingsMenuPos, settingsMenuSize ) )
+
+        # If we're close enough to anything on the map draw its local info, clearings take priority over landmarks and bridges
+        mousePos = pygame.mouse.get_pos()
+
+        hovered = None
+        hoveredDrawFcn = None
+        for nearestFcn, drawFcn in ( ( woodland.spatialIndex.nearestClearing, ClearingRenderer.drawLocalInfo ),
+                                     ( woodland.spatialIndex.nearestLandmark, LandmarkRenderer.drawLocalInfo ),
+                                     ( woodland.spatialIndex.nearestBridge, WoodlandRenderer.drawBridgeLocalInfo ) ):
+            hovered = nearestFcn( mousePos, localInfoDrawDist )
+            if hovered is not None:
+                hoveredDrawFcn = drawFcn
+                break
+
+        # The local info follows the mouse, and is drawn again on top of anything that gets redrawn
+        # So whatever was under it has to be drawn again whenever it moves, goes away or anything else is redrawn
+        mouseMoved = any( event.type == pygame.MOUSEMOTION for event in events )
+        if hovered is not None and ( mouseMoved or not tooltipRect ):
+            scheduler.markDirty( ( mousePos, ( 1, 1 ) ) )
+        if tooltipRect and ( scheduler.isDirty() or hovered is None ):
+            scheduler.markDirty( tooltipRect )
+            tooltipRect = None
+
+        # Redraw the map, screen, and background
+        if scheduler.beginDraw():
+            renderer.draw( screen )
+            drawAntiRect( screen, woodland.rect, WHITE )
+            legendSize = drawLegend( screen, (0, 0), spacing )
+            settingsMenuSize, _, _ = updateSettingsMenu( screen, settingsMenuPos, spacing, configData, False )
+
+            if generator.isRunning():
+                drawnProgress = generator.getProgress()
+                drawGenerationProgress( screen, progressPos, spacing, *drawnProgress )
+            scheduler.endDraw()
+
+            if hovered is not None:
+                infoDrawPos = [ mousePos[0] + 10, mousePos[1] ]
+                tooltipRect = pygame.Rect( infoDrawPos, hoveredDrawFcn( screen, hovered, infoDrawPos ) )
+                scheduler.markDrawn( tooltipRect )
+
+        # Update widgets, these always listen to the events but only show up when their part of the screen gets updated
+        pygame_widgets.update( events )
+        for widgetIndex in range( len( widgets ) ):
+            # Set our config data
+            if widgetCallbacks[widgetIndex]:
+                widgetCallbacks[widgetIndex]( configData, widgets[widgetIndex] )
+
+        # Keep the queue of maps full, this also throws them out if the settings changed
+        prefetcher.update( configData )
+
+        newDrawSettings = renderer.getBackgroundKey()
+        if newDrawSettings != drawSettings:
+            drawSettings = newDrawSettings
+            scheduler.markAllDirty()
+        
+        # Update display
+        scheduler.updateDisplay()
+
+        clock.tick(60)
+
+    prefetcher.shutdown()
+    pygame.quit()
@@ -0,0 +1,58 @@
+from PoissonDisk import *
+from Woodland import *
+
+import math
+import random
+import pytest
+
+
+# The clearing placement from before PoissonDisk, tries the middle of every gridSize cell in a random order
+def gridScan( woodland, n, rng ):
+    gridSize = 10
+    gridX = int( ( woodland.woodlandRight - woodland.woodlandLeft ) / gridSize )
+    gridY = int( ( woodland.woodlandTop - woodland.woodlandBottom ) / gridSize )
+    useablePoints = [ [ True for _ in range( gridY ) ] for _ in range( gridX ) ]
+    gridSpacesToClear = int( math.sqrt( woodland.minClearingDistSq ) / gridSize )
+
+    possiblePoints = [ ( x, y ) for x in range( gridX ) for y in range( gridY ) ]
+    rng.shuffle( possiblePoints )
+
+    points = []
+    for pointX, pointY in possiblePoints:
+        if len( points ) >= n:
+            break
+        if not useablePoints[pointX][pointY]:
+            continue
+
+        newPos = ( woodland.woodlandLeft + pointX * gridSize + gridSize / 2.0, woodland.woodlandBottom + pointY * gridSize + gridSize / 2.0 )
+        points.append( newPos )
+
+        for x in range( max( 0, pointX - gridSpacesToClear ), min( gridX, pointX + gridSpacesToClear + 1 ) ):
+            for y in range( max( 0, pointY - gridSpacesToClear ), min( gridY, pointY + gridSpacesToClear + 1 ) ):
+                if useablePoints[x][y]:
+                    otherPos = ( woodland.woodlandLeft + x * gridSize + gridSize / 2.0, woodland.woodlandBottom + y * gridSize + gridSize / 2.0 )
+                    if ( otherPos[0] - newPos[0] ) ** 2 + ( otherPos[1] - newPos[1] ) ** 2 < woodland.minClearingDistSq:
+                        useablePoints[x][y] = False
+    return points
+
+def sample( woodland, n, rng ):
+    sampler = PoissonDisk( woodland.woodlandLeft, woodland.woodlandBottom, woodland.woodlandRight, woodland.woodlandTop, woodland.minClearingDist )
+    return sampler.sample( n, rng )
+
+@pytest.mark.parametrize( "size, minDist, n", [ ( ( 1000, 800 ), 100, 40 ), ( ( 3000, 3000 ), 100, 400 ), ( ( 1000, 800 ), 100, 60 ), ( ( 600, 600 ), 100, 30 ) ] )
+def test_reachesGridScanCount( size, minDist, n ):
+    woodland = Woodland( ( 0, 0 ), size, minDist )
+    for seed in range( 10 ):
+        expected = len( gridScan( woodland, n, random.Random( seed ) ) )
+        points = sample( woodland, n, random.Random( seed ) )
+        assert len( points ) >= expected
+
+def test_pointsAreApartAndInside():
+    woodland = Woodland( ( 0, 0 ), ( 1000, 800 ), 100 )
+    points = sample( woodland, 1000, random.Random( 1 ) )
+
+    for i, ( x, y ) in enumerate( points ):
+        assert woodland.woodlandLeft <= x <= woodland.woodlandRight
+        assert woodland.woodlandBottom <= y <= woodland.woodlandTop
+        for otherX, otherY in points[i + 1:]:
+            assert ( x - otherX ) ** 2 + ( y - otherY ) ** 2 >= woodland.minClearingDistSq